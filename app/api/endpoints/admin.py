@@ -1,14 +1,25 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from fastapi.responses import FileResponse
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
-import os
-from datetime import datetime
+from datetime import datetime, date, timedelta
 
 from app.db.session import get_db
 from app.models.user import User
-from app.services.evaluation import generate_excel_report
-from app.core.config import settings
+from app.schemas.export import EvaluationExportFilter, ExportJobCreate, ExportJobStatus
+from app.services.export import stream_evaluations_csv, stream_evaluations_ndjson
+from app.services.stats import reconcile_stat_counters
+from app.services.dashboard_cache import get_cached_dashboard_stats, invalidate_dashboard_cache
+from app.services.analytics import get_interview_trends, get_score_distributions, rebuild_rollups_task
+from app.services.cohorts import rebuild_cohorts_task
+from app.schemas.scoring import ScoringWeights, ScoringWeightsCreate
+from app.services.scoring import (
+    create_scoring_weights, activate_scoring_weights, get_scoring_weights, get_scoring_weights_list, submit_rescore_job
+)
+from app.services.export_jobs import (
+    create_export_job, submit_export_job, get_export_job, get_export_job_status,
+    get_export_file_path, EXPORT_MEDIA_TYPES
+)
 
 router = APIRouter()
 
@@ -17,95 +28,254 @@ def get_dashboard_stats(
     db: Session = Depends(get_db)
 ) -> Any:
     """
-    관리자 대시보드 통계 조회
+    관리자 대시보드 통계 조회 (증분 카운터 기반 스냅샷을 Redis에 짧게 캐시)
     """
-    # 면접 통계
-    total_interviews = db.execute("SELECT COUNT(*) FROM interviews").scalar()
-    completed_interviews = db.execute("SELECT COUNT(*) FROM interviews WHERE status = 'completed'").scalar()
-    in_progress_interviews = db.execute("SELECT COUNT(*) FROM interviews WHERE status = 'in_progress'").scalar()
-    scheduled_interviews = db.execute("SELECT COUNT(*) FROM interviews WHERE status = 'scheduled'").scalar()
-    
-    # 평가 통계
-    total_evaluations = db.execute("SELECT COUNT(*) FROM evaluations").scalar()
-    avg_score = db.execute("SELECT AVG(total_score) FROM evaluations").scalar() or 0
-    
-    # 최근 면접 목록
-    recent_interviews = db.execute("""
-        SELECT i.id, i.candidate_name, i.start_time, i.status, u.username as interviewer_name
-        FROM interviews i
-        JOIN users u ON i.interviewer_id = u.id
-        ORDER BY i.start_time DESC
-        LIMIT 5
-    """).fetchall()
-    
-    recent_interviews_list = [
-        {
-            "id": row[0],
-            "candidate_name": row[1],
-            "start_time": row[2].strftime("%Y-%m-%d %H:%M") if row[2] else None,
-            "status": row[3],
-            "interviewer_name": row[4]
-        }
-        for row in recent_interviews
-    ]
-    
-    return {
-        "interview_stats": {
-            "total": total_interviews,
-            "completed": completed_interviews,
-            "in_progress": in_progress_interviews,
-            "scheduled": scheduled_interviews
-        },
-        "evaluation_stats": {
-            "total": total_evaluations,
-            "avg_score": round(avg_score, 2)
-        },
-        "recent_interviews": recent_interviews_list
-    }
+    return get_cached_dashboard_stats(db)
 
-@router.post("/export-excel-report", response_model=dict)
-def export_excel_report_endpoint(
-    background_tasks: BackgroundTasks,
+@router.post("/stats/reconcile", response_model=dict)
+def reconcile_stats(
     db: Session = Depends(get_db)
 ) -> Any:
     """
-    면접 평가 결과 Excel 리포트 생성
+    대시보드 통계 카운터 재집계 (원본 테이블 기준으로 보정)
     """
-    # 백그라운드 작업으로 Excel 리포트 생성
-    excel_path = generate_excel_report(db)
-    
-    if not excel_path:
+    drift = reconcile_stat_counters(db)
+    if drift:
+        invalidate_dashboard_cache()
+    return {
+        "msg": "통계 카운터가 재집계되었습니다",
+        "drift": drift
+    }
+
+def _analytics_range(start_date: Optional[date], end_date: Optional[date]) -> tuple:
+    """
+    분석 조회 기간 (기본: 최근 90일)
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=89)
+    if start_date > end_date:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Excel 리포트 생성 중 오류가 발생했습니다"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일이 종료일보다 늦습니다"
         )
-    
+    return start_date, end_date
+
+@router.get("/analytics/interviews", response_model=dict)
+def read_interview_analytics(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    granularity: str = Query("day", pattern="^(day|week|month|all)$"),
+    interviewer_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    기간별 면접 수, 상태별 건수, 완료율 (일별 롤업 기반)
+    """
+    start_date, end_date = _analytics_range(start_date, end_date)
     return {
-        "msg": "Excel 리포트가 생성되었습니다",
-        "excel_url": f"/media/{excel_path}"
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "granularity": granularity,
+        "series": get_interview_trends(db, start_date, end_date, granularity, interviewer_id)
     }
 
-@router.get("/download-excel-report/{filename}", response_class=FileResponse)
-def download_excel_report(
-    filename: str
+@router.get("/analytics/scores", response_model=dict)
+def read_score_analytics(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    granularity: str = Query("week", pattern="^(day|week|month|all)$"),
+    interviewer_id: Optional[int] = None,
+    by_interviewer: bool = False,
+    db: Session = Depends(get_db)
 ) -> Any:
     """
-    Excel 리포트 다운로드
+    기간별(선택적으로 면접관별) 총점 분포: 평균, 분위수, 히스토그램 (일별 롤업 스케치 병합)
     """
-    excel_path = os.path.join(settings.MEDIA_STORAGE_PATH, "reports", filename)
-    
-    if not os.path.exists(excel_path):
+    start_date, end_date = _analytics_range(start_date, end_date)
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "granularity": granularity,
+        "series": get_score_distributions(db, start_date, end_date, granularity, interviewer_id, by_interviewer)
+    }
+
+@router.post("/analytics/rebuild", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def rebuild_analytics(
+    background_tasks: BackgroundTasks
+) -> Any:
+    """
+    분석 롤업 및 코호트 스케치 전체 재계산 (원본 테이블 기준, 백그라운드 실행)
+    """
+    background_tasks.add_task(rebuild_rollups_task)
+    background_tasks.add_task(rebuild_cohorts_task)
+    return {"msg": "분석 롤업 재계산이 시작되었습니다"}
+
+@router.get("/scoring-weights", response_model=List[ScoringWeights])
+def read_scoring_weights(
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    채점 가중치 버전 목록 (최신순, 활성 버전이 없으면 설정값 기반 기본 가중치 적용)
+    """
+    return get_scoring_weights_list(db)
+
+@router.post("/scoring-weights", response_model=ScoringWeights, status_code=status.HTTP_201_CREATED)
+def create_weights(
+    weights_in: ScoringWeightsCreate,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    채점 가중치 새 버전 생성 (activate=True이면 즉시 활성화하고 기존 평가를 백그라운드에서 재채점)
+    """
+    try:
+        db_weights = create_scoring_weights(db, weights_in)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if weights_in.activate:
+        db_weights = activate_scoring_weights(db, db_weights.version)
+        submit_rescore_job(db_weights.version)
+    return db_weights
+
+@router.get("/scoring-weights/{version}", response_model=ScoringWeights)
+def read_weights(
+    version: int,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    채점 가중치 버전 및 재채점 진행 상황 조회
+    """
+    db_weights = get_scoring_weights(db, version)
+    if not db_weights:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Excel 파일을 찾을 수 없습니다"
+            detail="가중치 버전을 찾을 수 없습니다"
+        )
+    return db_weights
+
+@router.post("/scoring-weights/{version}/activate", response_model=ScoringWeights, status_code=status.HTTP_202_ACCEPTED)
+def activate_weights(
+    version: int,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    채점 가중치 버전 활성화 후 기존 평가 재채점 (이전 버전으로 되돌리거나 중단된 재채점을 다시 실행할 때도 사용)
+    """
+    db_weights = activate_scoring_weights(db, version)
+    if not db_weights:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="가중치 버전을 찾을 수 없습니다"
+        )
+    submit_rescore_job(version)
+    return db_weights
+
+@router.post("/exports", response_model=ExportJobStatus, status_code=status.HTTP_202_ACCEPTED)
+def create_export(
+    job_in: ExportJobCreate = ExportJobCreate(),
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    면접 평가 결과 내보내기 작업 생성 (Excel 또는 Parquet 스냅샷, 전용 워커에서 실행, 작업 ID로 진행 상황 조회)
+    """
+    db_job = create_export_job(db, job_in)
+    submit_export_job(db_job.id)
+    return get_export_job_status(db, db_job.id)
+
+@router.get("/exports/{job_id}", response_model=ExportJobStatus)
+def read_export(
+    job_id: int,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    내보내기 작업 진행 상황 조회 (기록한 행 수 / 전체 행 수, 완료 시 다운로드 URL)
+    """
+    job_status = get_export_job_status(db, job_id)
+    if not job_status:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="내보내기 작업을 찾을 수 없습니다"
+        )
+    return job_status
+
+@router.get("/exports/{job_id}/download", response_class=FileResponse)
+def download_export(
+    job_id: int,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    완료된 내보내기 파일 다운로드
+    """
+    db_job = get_export_job(db, job_id)
+    if not db_job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="내보내기 작업을 찾을 수 없습니다"
+        )
+    
+    export_path = get_export_file_path(db_job)
+    if not export_path:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT if db_job.status in ("pending", "running") else status.HTTP_404_NOT_FOUND,
+            detail="내보내기 파일이 아직 준비되지 않았습니다" if db_job.status in ("pending", "running") else "내보내기 파일을 찾을 수 없습니다"
         )
     
     return FileResponse(
-        excel_path,
-        filename=f"interview_evaluations_{datetime.now().strftime('%Y%m%d')}.xlsx",
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        export_path,
+        filename=f"interview_evaluations_{db_job.created_at.strftime('%Y%m%d%H%M%S')}.{db_job.format}",
+        media_type=EXPORT_MEDIA_TYPES[db_job.format]
     )
 
+@router.get("/evaluations/export")
+def stream_evaluations_export(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    interview_status: Optional[str] = Query(None, alias="status"),
+    interviewer_id: Optional[int] = None
+) -> Any:
+    """
+    평가 점수, 세부 항목 점수, 답변 전사를 CSV 또는 NDJSON으로 스트리밍 (대량 추출은 Parquet 내보내기 작업 사용)
+    """
+    filters = EvaluationExportFilter(
+        start_date=start_date,
+        end_date=end_date,
+        interview_status=interview_status,
+        interviewer_id=interviewer_id
+    )
+    filename = f"evaluations_{datetime.now().strftime('%Y%m%d%H%M%S')}.{format}"
+    
+    if format == "csv":
+        return StreamingResponse(
+            stream_evaluations_csv(filters),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    return StreamingResponse(
+        stream_evaluations_ndjson(filters),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.post("/export-excel-report", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def export_excel_report_endpoint(
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    면접 평가 결과 Excel 리포트 생성 (백그라운드 내보내기 작업으로 실행)
+    """
+    db_job = create_export_job(db, ExportJobCreate(format="xlsx"))
+    submit_export_job(db_job.id)
+    
+    return {
+        "msg": "Excel 리포트 생성이 시작되었습니다",
+        "job_id": db_job.id,
+        "status_url": f"/api/v1/admin/exports/{db_job.id}",
+        "download_url": f"/api/v1/admin/exports/{db_job.id}/download"
+    }
+
 @router.post("/init-database", response_model=dict)
 def init_database() -> Any:
     """
@@ -1,24 +1,105 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, FileResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.evaluation import (
     Evaluation, EvaluationCreate, EvaluationUpdate, 
     CriteriaScore, CriteriaScoreCreate, 
-    EvaluateInterviewRequest, EvaluationResult
+    EvaluateInterviewRequest, EvaluationResult,
+    EvaluationBatchCreate, EvaluationBatchStatus, EvaluationReportBatchCreate
 )
 from app.services.evaluation import (
     get_evaluation, get_evaluation_by_interview, 
     create_evaluation, update_evaluation, 
     create_criteria_score, get_criteria_scores_by_evaluation,
-    evaluate_interview, generate_evaluation_report
+    evaluate_interview, generate_and_store_evaluation_report,
+    generate_and_store_evaluation_reports,
+    build_report_snapshot, ensure_evaluation_report
 )
+from app.services.report_renderer import report_digest
+from app.services.cohorts import get_evaluation_percentiles
+from app.services.evaluation_batch import (
+    select_batch_interview_ids, create_evaluation_batch, get_evaluation_batch_status, start_evaluation_batch
+)
+from app.services.evaluation_stream import stream_interview_evaluation
 from app.services.interview import get_interview
 
 router = APIRouter()
 
+def _generate_report_after_stream(state: dict) -> None:
+    """
+    스트리밍 평가 종료 후 PDF 리포트 생성
+    """
+    evaluation_id = state.get("evaluation_id")
+    if evaluation_id:
+        generate_and_store_evaluation_report(evaluation_id)
+
+@router.post("/batch", response_model=EvaluationBatchStatus)
+def create_evaluation_batch_endpoint(
+    batch_in: EvaluationBatchCreate,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    여러 면접에 대한 일괄 평가 시작
+    """
+    if batch_in.interview_ids is not None and not batch_in.interview_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="면접 ID 목록이 비어 있습니다"
+        )
+    
+    # 대상이 없으면 일괄 평가를 저장하지 않음 (빈 일괄 평가가 재시작 시 재개 대상으로 남지 않도록)
+    interview_ids = select_batch_interview_ids(db, batch_in)
+    if not interview_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="평가할 면접이 없습니다"
+        )
+    
+    batch = create_evaluation_batch(db, batch_in, interview_ids)
+    
+    # 워커 풀에서 평가 수행 (진행 상황은 조회 API로 확인)
+    start_evaluation_batch(batch.id)
+    
+    return get_evaluation_batch_status(db, batch.id)
+
+@router.get("/batch/{batch_id}", response_model=EvaluationBatchStatus)
+def read_evaluation_batch(
+    batch_id: int,
+    include_items: bool = True,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    일괄 평가 진행 상황 및 부분 결과 조회
+    """
+    batch_status = get_evaluation_batch_status(db, batch_id, include_items=include_items)
+    if not batch_status:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="일괄 평가를 찾을 수 없습니다"
+        )
+    
+    return batch_status
+
+@router.post("/reports/batch", response_model=dict)
+def generate_reports_batch_endpoint(
+    batch_in: EvaluationReportBatchCreate,
+    background_tasks: BackgroundTasks
+) -> Any:
+    """
+    여러 평가의 PDF 리포트 일괄 생성 (리포트 프로세스 풀에서 병렬 렌더링)
+    """
+    evaluation_ids = list(dict.fromkeys(batch_in.evaluation_ids))
+    background_tasks.add_task(generate_and_store_evaluation_reports, evaluation_ids)
+    
+    return {"msg": "리포트 일괄 생성이 시작되었습니다", "count": len(evaluation_ids)}
+
 @router.post("", response_model=Evaluation)
 def create_evaluation_endpoint(
     evaluation_in: EvaluationCreate,
@@ -49,7 +130,13 @@ def create_evaluation_endpoint(
             detail="이미 평가가 존재합니다"
         )
     
-    evaluation = create_evaluation(db, evaluation_in)
+    try:
+        evaluation = create_evaluation(db, evaluation_in)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 평가가 존재합니다"
+        )
     return evaluation
 
 @router.get("/{evaluation_id}", response_model=Evaluation)
@@ -87,6 +174,7 @@ def read_evaluation(
 def update_evaluation_endpoint(
     evaluation_id: int,
     evaluation_in: EvaluationUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ) -> Any:
     """
@@ -114,8 +202,48 @@ def update_evaluation_endpoint(
         )
     
     evaluation = update_evaluation(db, evaluation_id, evaluation_in)
+    
+    # 점수/피드백이 바뀌었으면 새 리포트 생성 (내용이 같으면 기존 리포트 재사용)
+    background_tasks.add_task(generate_and_store_evaluation_report, evaluation_id)
+    
     return evaluation
 
+@router.get("/{evaluation_id}/report", response_class=FileResponse)
+def download_evaluation_report(
+    evaluation_id: int,
+    request: Request,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    평가 PDF 리포트 다운로드 (평가 데이터 해시 ETag, If-None-Match 일치 시 304)
+    """
+    snapshot = build_report_snapshot(db, evaluation_id)
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="평가를 찾을 수 없습니다"
+        )
+    
+    etag = f'"{report_digest(snapshot)}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    pdf_path = ensure_evaluation_report(db, evaluation_id, snapshot)
+    if not pdf_path:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="리포트 생성 중 오류가 발생했습니다"
+        )
+    
+    return FileResponse(
+        pdf_path,
+        media_type="application/pdf",
+        filename=f"evaluation_{evaluation_id}_{snapshot['candidate_name'].replace(' ', '_')}.pdf",
+        headers=headers
+    )
+
 @router.post("/{evaluation_id}/criteria", response_model=CriteriaScore)
 def create_criteria_score_endpoint(
     evaluation_id: int,
@@ -183,6 +311,36 @@ def read_criteria_scores(
     criteria_scores = get_criteria_scores_by_evaluation(db, evaluation_id)
     return criteria_scores
 
+@router.get("/evaluate-interview/{interview_id}/stream")
+def evaluate_interview_stream_endpoint(
+    interview_id: int,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    면접 평가 수행 (기준별 점수와 피드백을 SSE로 스트리밍)
+    """
+    interview = get_interview(db, interview_id)
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접을 찾을 수 없습니다"
+        )
+    
+    if interview.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="완료된 면접만 평가할 수 있습니다"
+        )
+    
+    # 스트리밍 종료 후 PDF 리포트 생성 (평가 ID는 스트림에서 기록)
+    state = {}
+    return StreamingResponse(
+        stream_interview_evaluation(interview_id, state),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(_generate_report_after_stream, state)
+    )
+
 @router.post("/evaluate-interview", response_model=EvaluationResult)
 async def evaluate_interview_endpoint(
     request: EvaluateInterviewRequest,
@@ -215,9 +373,8 @@ async def evaluate_interview_endpoint(
     # 이미 평가가 있는지 확인
     existing_evaluation = get_evaluation_by_interview(db, request.interview_id)
     if existing_evaluation:
-        # PDF 리포트 생성 (백그라운드 작업)
-        if not existing_evaluation.pdf_report_path:
-            background_tasks.add_task(generate_evaluation_report, db, existing_evaluation.id)
+        # PDF 리포트 생성 (백그라운드 작업, 현재 데이터의 리포트가 이미 있으면 생성하지 않음)
+        background_tasks.add_task(generate_and_store_evaluation_report, existing_evaluation.id)
         
         # 평가 결과 반환
         return EvaluationResult(
@@ -228,11 +385,12 @@ async def evaluate_interview_endpoint(
             nonverbal_score=existing_evaluation.nonverbal_score,
             detailed_scores=existing_evaluation.detailed_scores,
             feedback=existing_evaluation.feedback,
-            pdf_url=f"/media/{existing_evaluation.pdf_report_path}" if existing_evaluation.pdf_report_path else None
+            pdf_url=f"/api/v1/evaluations/{existing_evaluation.id}/report",
+            percentiles=get_evaluation_percentiles(db, existing_evaluation)
         )
     
-    # 면접 평가 수행
-    evaluation = evaluate_interview(db, request.interview_id)
+    # 면접 평가 수행 (GPT 호출 동안 이벤트 루프를 막지 않도록 스레드풀에서 실행)
+    evaluation = await run_in_threadpool(evaluate_interview, db, request.interview_id)
     if not evaluation:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -240,7 +398,7 @@ async def evaluate_interview_endpoint(
         )
     
     # PDF 리포트 생성 (백그라운드 작업)
-    background_tasks.add_task(generate_evaluation_report, db, evaluation.id)
+    background_tasks.add_task(generate_and_store_evaluation_report, evaluation.id)
     
     # 평가 결과 반환
     return EvaluationResult(
@@ -251,5 +409,6 @@ async def evaluate_interview_endpoint(
         nonverbal_score=evaluation.nonverbal_score,
         detailed_scores=evaluation.detailed_scores,
         feedback=evaluation.feedback,
-        pdf_url=f"/media/{evaluation.pdf_report_path}" if evaluation.pdf_report_path else None
+        pdf_url=f"/api/v1/evaluations/{evaluation.id}/report",
+        percentiles=get_evaluation_percentiles(db, evaluation)
     )
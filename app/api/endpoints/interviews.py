@@ -18,6 +18,7 @@ from app.services.interview import (
     start_interview, end_interview, create_answer, get_answers_by_interview,
     save_stt_chunk, get_stt_chunks, save_final_stt, generate_interview_questions
 )
+from app.services.speech_metrics import get_interview_speech_metrics
 
 router = APIRouter()
 
@@ -268,6 +269,16 @@ def get_stt_chunks_endpoint(
     chunks = get_stt_chunks(redis_client, interview_id, question_index)
     return chunks
 
+@router.get("/{interview_id}/speech-metrics", response_model=dict)
+def get_speech_metrics_endpoint(
+    interview_id: int,
+    redis_client: redis.Redis = Depends(get_redis)
+) -> Any:
+    """
+    질문별 발화 지표 조회 (분당 어절 수, 간투사 빈도, 답변 길이)
+    """
+    return get_interview_speech_metrics(redis_client, interview_id)
+
 @router.post("/generate-questions", response_model=GenerateQuestionsResponse)
 def generate_questions_endpoint(
     request: GenerateQuestionsRequest
@@ -1,22 +1,33 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, WebSocket, Request
+from fastapi.concurrency import run_in_threadpool
+from starlette.websockets import WebSocketState
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 import os
 import base64
 from datetime import datetime
 
-from app.db.session import get_db
+from app.db.session import get_db, SessionLocal, redis_client
 from app.models.user import User
 from app.services.media import (
-    save_video_chunk, save_audio_chunk, 
-    merge_video_chunks, merge_audio_chunks,
-    extract_audio_from_video, decode_base64_video, process_video_frame
+    save_video_chunk, save_audio_chunk, decode_base64_video
 )
+from app.services.frame_analyzer import analyze_frames_async
+from app.services.frame_metrics import append_frame_metrics
+from app.services.frame_stream import run_frame_stream
+from app.services.video_analysis import process_merged_video, analyze_recorded_video_task
+from app.services.audio_analysis import process_merged_audio, analyze_interview_audio_task, load_audio_features
 from app.services.stt import transcribe_audio_chunk
+from app.services.pcm import decode_to_pcm, save_pcm_chunk, list_pcm_chunks
+from app.services.clips import get_answer_audio_clip
+from app.services.thumbnails import (
+    generate_thumbnails_task, get_current_thumbnail_manifest, claim_thumbnail_generation, get_thumbnail_path
+)
 from app.services.interview import get_interview, save_stt_chunk
 from app.schemas.interview import STTChunk
 from app.core.config import settings
+from app.utils.range_response import range_file_response
 
 router = APIRouter()
 
@@ -86,8 +97,13 @@ async def upload_audio_chunk(
             detail="오디오 청크 저장 중 오류가 발생했습니다"
         )
     
+    # 16kHz 모노 PCM으로 한 번만 디코딩하여 저장 (STT와 음성 분석이 공유)
+    pcm = await run_in_threadpool(decode_to_pcm, chunk_bytes)
+    if pcm is not None:
+        save_pcm_chunk(interview_id, pcm, chunk_index)
+    
     # STT 처리
-    transcript = transcribe_audio_chunk(chunk_bytes)
+    transcript = await run_in_threadpool(transcribe_audio_chunk, chunk_bytes, "ko", pcm) if pcm else None
     
     # STT 결과가 있으면 Redis에 저장
     if transcript:
@@ -97,7 +113,7 @@ async def upload_audio_chunk(
             content=transcript,
             timestamp=datetime.now().timestamp()
         )
-        save_stt_chunk(db, stt_chunk)
+        save_stt_chunk(redis_client, stt_chunk)
     
     return {
         "msg": "오디오 청크가 저장되었습니다", 
@@ -147,14 +163,85 @@ async def process_video_frame_endpoint(
     """
     비디오 프레임 처리 (Computer Vision 분석)
     """
+    received_at = datetime.now().timestamp()
+    
     # Base64 디코딩
     frame_data = base64.b64decode(base64_data.split(",")[1] if "," in base64_data else base64_data)
     
-    # 프레임 처리
-    result = process_video_frame(frame_data)
+    # 프레임 처리 (프로세스 풀에서 분석)
+    try:
+        result = (await analyze_frames_async([frame_data], interview_id=interview_id, timestamps=[received_at]))[0]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"프레임 분석 중 오류가 발생했습니다: {str(e)}"
+        )
+    
+    # 비언어적 평가를 위한 시계열 저장
+    append_frame_metrics(interview_id, [result])
     
     return result
 
+@router.post("/process-video-frames", response_model=List[dict])
+async def process_video_frames_endpoint(
+    interview_id: int = Form(...),
+    frames: List[UploadFile] = File(...),
+    timestamps: Optional[List[float]] = Form(None)
+) -> Any:
+    """
+    비디오 프레임 묶음 처리 (JPEG 파일 여러 장을 한 번에 분석)
+    
+    timestamps: 프레임별 촬영 시각 (Unix 초, 프레임 순서대로, 없으면 요청 수신 시각)
+    """
+    received_at = datetime.now().timestamp()
+    if timestamps is not None and len(timestamps) != len(frames):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="프레임 수와 타임스탬프 수가 일치하지 않습니다"
+        )
+    frame_bytes = [await frame.read() for frame in frames]
+    
+    try:
+        results = await analyze_frames_async(
+            frame_bytes, interview_id=interview_id,
+            timestamps=timestamps or [received_at] * len(frame_bytes)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"프레임 분석 중 오류가 발생했습니다: {str(e)}"
+        )
+    
+    # 비언어적 평가를 위한 시계열 저장
+    append_frame_metrics(interview_id, results)
+    
+    return results
+
+@router.websocket("/{interview_id}/frames/ws")
+async def frame_analysis_websocket(
+    websocket: WebSocket,
+    interview_id: int
+) -> None:
+    """
+    실시간 프레임 분석 (바이너리 JPEG 프레임 수신, 축약 분석 결과 JSON 회신)
+    """
+    # 면접 정보 조회 (연결 동안 DB 세션을 점유하지 않도록 바로 닫음)
+    db = SessionLocal()
+    try:
+        interview = get_interview(db, interview_id)
+    finally:
+        db.close()
+    
+    if not interview:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="면접을 찾을 수 없습니다")
+        return
+    
+    await websocket.accept()
+    await run_frame_stream(websocket, interview_id)
+    
+    if websocket.client_state == WebSocketState.CONNECTED:
+        await websocket.close()
+
 @router.post("/{interview_id}/merge-video", response_model=dict)
 def merge_video_chunks_endpoint(
     interview_id: int,
@@ -172,11 +259,39 @@ def merge_video_chunks_endpoint(
             detail="면접을 찾을 수 없습니다"
         )
     
-    # 백그라운드 작업으로 비디오 병합
-    background_tasks.add_task(merge_video_chunks, db, interview_id)
+    # 백그라운드 작업으로 비디오 병합 (실시간 분석 데이터가 없으면 녹화 영상 분석까지 수행)
+    background_tasks.add_task(process_merged_video, interview_id)
     
     return {"msg": "비디오 병합이 시작되었습니다"}
 
+@router.post("/{interview_id}/analyze-video", response_model=dict)
+def analyze_video_endpoint(
+    interview_id: int,
+    background_tasks: BackgroundTasks,
+    force: bool = False,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    병합된 녹화 영상 비언어적 분석 (프레임 샘플링)
+    """
+    interview = get_interview(db, interview_id)
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접을 찾을 수 없습니다"
+        )
+    
+    if not interview.video_path:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="병합된 비디오가 없습니다"
+        )
+    
+    # 백그라운드 작업으로 영상 분석
+    background_tasks.add_task(analyze_recorded_video_task, interview_id, force)
+    
+    return {"msg": "녹화 영상 분석이 시작되었습니다"}
+
 @router.post("/{interview_id}/merge-audio", response_model=dict)
 def merge_audio_chunks_endpoint(
     interview_id: int,
@@ -194,11 +309,113 @@ def merge_audio_chunks_endpoint(
             detail="면접을 찾을 수 없습니다"
         )
     
-    # 백그라운드 작업으로 오디오 병합
-    background_tasks.add_task(merge_audio_chunks, db, interview_id)
+    # 백그라운드 작업으로 오디오 병합 후 음성 특징 추출
+    background_tasks.add_task(process_merged_audio, interview_id)
     
     return {"msg": "오디오 병합이 시작되었습니다"}
 
+@router.post("/{interview_id}/analyze-audio", response_model=dict)
+def analyze_audio_endpoint(
+    interview_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    면접 음성 특징 추출 (음량, 피치 변화, 발화 비율, 휴지)
+    """
+    interview = get_interview(db, interview_id)
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접을 찾을 수 없습니다"
+        )
+    
+    if not list_pcm_chunks(interview_id) and not interview.audio_path and not interview.video_path:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="분석할 오디오가 없습니다"
+        )
+    
+    # 백그라운드 작업으로 음성 분석
+    background_tasks.add_task(analyze_interview_audio_task, interview_id)
+    
+    return {"msg": "음성 분석이 시작되었습니다"}
+
+@router.get("/{interview_id}/audio-features", response_model=dict)
+def get_audio_features(
+    interview_id: int,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    면접 음성 특징 조회 (전체 및 질문별)
+    """
+    interview = get_interview(db, interview_id)
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접을 찾을 수 없습니다"
+        )
+    
+    features = load_audio_features(interview_id)
+    if features is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="음성 분석 결과가 없습니다"
+        )
+    
+    return features
+
+@router.get("/{interview_id}/thumbnails", response_model=dict)
+def get_thumbnails(
+    interview_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    질문별 썸네일 및 스프라이트 시트 매니페스트 조회 (없거나 비디오가 다시 병합되었으면 백그라운드로 생성 시작)
+    """
+    interview = get_interview(db, interview_id)
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접을 찾을 수 없습니다"
+        )
+    
+    manifest = get_current_thumbnail_manifest(interview)
+    if manifest is None:
+        if not interview.video_path:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="비디오가 없습니다"
+            )
+        # 생성 중이면 다시 등록하지 않음 (폴링 요청마다 생성 작업이 쌓이지 않도록)
+        if claim_thumbnail_generation(interview_id):
+            background_tasks.add_task(generate_thumbnails_task, interview_id)
+        return {"msg": "썸네일을 생성 중입니다"}
+    
+    return manifest
+
+@router.get("/{interview_id}/thumbnails/{filename}", response_class=FileResponse)
+def get_thumbnail_file(
+    interview_id: int,
+    filename: str
+) -> Any:
+    """
+    썸네일/스프라이트 이미지 조회 (파일명에 비디오 버전이 포함되어 내용이 바뀌지 않으므로 장기 캐시 허용)
+    """
+    path = get_thumbnail_path(interview_id, filename)
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="썸네일을 찾을 수 없습니다"
+        )
+    
+    return FileResponse(
+        path,
+        media_type="image/jpeg",
+        headers={"Cache-Control": f"public, max-age={settings.THUMBNAIL_CACHE_MAX_AGE}, immutable"}
+    )
+
 @router.get("/{interview_id}/video", response_class=FileResponse)
 def get_interview_video(
     interview_id: int,
@@ -233,6 +450,7 @@ def get_interview_video(
 @router.get("/{interview_id}/audio", response_class=FileResponse)
 def get_interview_audio(
     interview_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ) -> Any:
     """
@@ -265,4 +483,42 @@ def get_interview_audio(
             detail="오디오 파일을 찾을 수 없습니다"
         )
     
-    return FileResponse(audio_path)
+    return range_file_response(request, audio_path, "audio/mpeg")
+
+@router.get("/{interview_id}/answers/{question_index}/audio", response_class=FileResponse)
+def get_answer_audio(
+    interview_id: int,
+    question_index: int,
+    request: Request,
+    db: Session = Depends(get_db)
+) -> Any:
+    """
+    질문별 답변 오디오 클립 조회 (병합된 오디오에서 재인코딩 없이 잘라 캐시, Range 요청 지원)
+    """
+    interview = get_interview(db, interview_id)
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접을 찾을 수 없습니다"
+        )
+    
+    if not current_user.is_admin and interview.interviewer_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="권한이 없습니다"
+        )
+    
+    if not interview.audio_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="오디오가 없습니다"
+        )
+    
+    clip_path = get_answer_audio_clip(db, interview_id, question_index)
+    if not clip_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="답변 구간의 오디오를 찾을 수 없습니다"
+        )
+    
+    return range_file_response(request, clip_path, "audio/mpeg")
@@ -34,9 +34,62 @@ class Settings(BaseSettings):
     # 미디어 저장 경로
     MEDIA_STORAGE_PATH: str = os.getenv("MEDIA_STORAGE_PATH", "./media_storage")
     
+    # 프레임 분석 설정
+    FRAME_ANALYZER_WORKERS: int = int(os.getenv("FRAME_ANALYZER_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+    FRAME_ANALYZER_BATCH_SIZE: int = int(os.getenv("FRAME_ANALYZER_BATCH_SIZE", "8"))
+    FRAME_DEDUP_HAMMING_THRESHOLD: int = int(os.getenv("FRAME_DEDUP_HAMMING_THRESHOLD", "4"))  # 음수이면 중복 제거 사용 안 함
+    FRAME_TRACKING_ENABLED: bool = os.getenv("FRAME_TRACKING_ENABLED", "True").lower() in ("true", "1", "t")
+    FRAME_FULL_DETECTION_INTERVAL: int = int(os.getenv("FRAME_FULL_DETECTION_INTERVAL", "10"))  # 추적 모드에서 전체 검출 주기 (프레임)
+    FRAME_TRACKING_MIN_CONFIDENCE: float = float(os.getenv("FRAME_TRACKING_MIN_CONFIDENCE", "0.6"))
+    FRAME_ANALYZER_PRELOAD: bool = os.getenv("FRAME_ANALYZER_PRELOAD", "True").lower() in ("true", "1", "t")
+    
+    # 녹화 영상 분석 설정
+    VIDEO_ANALYSIS_FPS: float = float(os.getenv("VIDEO_ANALYSIS_FPS", "2"))  # 초당 샘플링 프레임 수
+    VIDEO_ANALYSIS_WIDTH: int = int(os.getenv("VIDEO_ANALYSIS_WIDTH", "640"))
+    VIDEO_ANALYSIS_BATCH_SIZE: int = int(os.getenv("VIDEO_ANALYSIS_BATCH_SIZE", "16"))
+    
+    # 썸네일 설정
+    THUMBNAIL_WIDTH: int = int(os.getenv("THUMBNAIL_WIDTH", "320"))
+    THUMBNAIL_SPRITE_TILE_WIDTH: int = int(os.getenv("THUMBNAIL_SPRITE_TILE_WIDTH", "160"))
+    THUMBNAIL_SPRITE_COLUMNS: int = int(os.getenv("THUMBNAIL_SPRITE_COLUMNS", "10"))
+    THUMBNAIL_SPRITE_ROWS: int = int(os.getenv("THUMBNAIL_SPRITE_ROWS", "10"))
+    THUMBNAIL_CACHE_MAX_AGE: int = int(os.getenv("THUMBNAIL_CACHE_MAX_AGE", "86400"))  # 초
+    
+    # 음성 분석 설정
+    AUDIO_SILENCE_DB: float = float(os.getenv("AUDIO_SILENCE_DB", "-45"))  # 이 음량(dBFS) 이하는 무음으로 판단
+    AUDIO_MIN_PAUSE_SECONDS: float = float(os.getenv("AUDIO_MIN_PAUSE_SECONDS", "0.3"))
+    
     # 면접 설정
     INTERVIEW_QUESTIONS_COUNT: int = 5
     
+    # 일괄 평가 설정
+    EVALUATION_BATCH_CONCURRENCY: int = int(os.getenv("EVALUATION_BATCH_CONCURRENCY", "4"))
+    EVALUATION_BATCH_MAX_CONCURRENCY: int = int(os.getenv("EVALUATION_BATCH_MAX_CONCURRENCY", "16"))
+    
+    # 평가 중복 방지 락 설정
+    EVALUATION_LOCK_LEASE_MS: int = int(os.getenv("EVALUATION_LOCK_LEASE_MS", "60000"))
+    EVALUATION_LOCK_WAIT_SECONDS: int = int(os.getenv("EVALUATION_LOCK_WAIT_SECONDS", "300"))
+    
+    # 리포트 렌더링 설정
+    REPORT_RENDER_WORKERS: int = int(os.getenv("REPORT_RENDER_WORKERS", "2"))
+    REPORT_RENDERER_PRELOAD: bool = os.getenv("REPORT_RENDERER_PRELOAD", "True").lower() in ("true", "1", "t")
+    
+    # 내보내기 설정
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))  # 조회/기록 배치 크기 (행)
+    EXPORT_MAX_CONCURRENT_JOBS: int = int(os.getenv("EXPORT_MAX_CONCURRENT_JOBS", "2"))  # 동시에 실행할 내보내기 작업 수
+    EXPORT_RETENTION_HOURS: int = int(os.getenv("EXPORT_RETENTION_HOURS", "24"))  # 내보내기 파일 보관 기간 (시간)
+    
+    # 통계 설정
+    STATS_RECONCILE_INTERVAL_SECONDS: int = int(os.getenv("STATS_RECONCILE_INTERVAL_SECONDS", "3600"))  # 카운터 재집계 주기 (초)
+    DASHBOARD_CACHE_TTL_SECONDS: int = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))  # 대시보드 캐시 유지 시간 (초)
+    DASHBOARD_CACHE_REFRESH_AHEAD_SECONDS: int = int(os.getenv("DASHBOARD_CACHE_REFRESH_AHEAD_SECONDS", "10"))  # 만료 전 미리 갱신 시작 (초)
+    DASHBOARD_CACHE_LOCK_WAIT_SECONDS: float = float(os.getenv("DASHBOARD_CACHE_LOCK_WAIT_SECONDS", "3"))  # 다른 요청의 계산 대기 (초)
+    
+    # 채점 설정 (가중치 버전이 없을 때의 기본값, 버전은 관리자 API로 추가)
+    SCORING_CATEGORY_WEIGHTS: ClassVar[Dict[str, float]] = {"verbal": 0.6, "nonverbal": 0.4}
+    SCORE_SCALE: float = 20.0  # 기준별 5점 만점 -> 100점 만점 변환 배율
+    RESCORE_BATCH_SIZE: int = int(os.getenv("RESCORE_BATCH_SIZE", "1000"))  # 재채점 조회/갱신 배치 크기 (평가 수)
+    
     # 평가 기준 설정
     EVALUATION_CRITERIA: ClassVar[Dict[str, List[str]]] = {
         "verbal": ["clarity", "relevance", "depth", "conciseness", "confidence"],
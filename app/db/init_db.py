@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from app.db.session import Base, engine
-from app.models import user, interview, evaluation
+from app.models import user, interview, evaluation, export, stats, analytics, scoring
 import logging
 
 logger = logging.getLogger(__name__)
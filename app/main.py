@@ -5,6 +5,12 @@ import os
 
 from app.api.api import api_router
 from app.core.config import settings
+from app.services.frame_analyzer import warm_up_frame_analyzer, shutdown_frame_analyzer
+from app.services.report_renderer import warm_up_report_renderer, shutdown_report_renderer
+from app.services.export_jobs import get_export_worker, cleanup_expired_exports, resubmit_pending_exports, shutdown_export_worker
+from app.services.stats import start_stats_reconciler, stop_stats_reconciler
+from app.services.scoring import resume_rescore_jobs, shutdown_rescore_worker
+from app.services.evaluation_batch import resume_evaluation_batches
 
 app = FastAPI(
     title="SK AXIS API",
@@ -28,6 +34,33 @@ app.include_router(api_router, prefix="")
 os.makedirs(settings.MEDIA_STORAGE_PATH, exist_ok=True)
 app.mount("/media", StaticFiles(directory=settings.MEDIA_STORAGE_PATH), name="media")
 
+@app.on_event("startup")
+def startup_event():
+    # 프레임 분석 워커 예열 (MediaPipe 모델 로드)
+    if settings.FRAME_ANALYZER_PRELOAD:
+        warm_up_frame_analyzer()
+    # 리포트 렌더링 워커 예열 (폰트/스타일 로드)
+    if settings.REPORT_RENDERER_PRELOAD:
+        warm_up_report_renderer()
+    # 보관 기간이 지난 내보내기 파일 정리
+    get_export_worker().submit(cleanup_expired_exports)
+    # 중단된 내보내기 작업 재제출
+    resubmit_pending_exports()
+    # 대시보드 통계 카운터 주기적 재집계
+    start_stats_reconciler()
+    # 중단된 일괄 평가 재개
+    resume_evaluation_batches()
+    # 중단된 재채점 재개
+    resume_rescore_jobs()
+
+@app.on_event("shutdown")
+def shutdown_event():
+    shutdown_frame_analyzer()
+    shutdown_report_renderer()
+    shutdown_export_worker()
+    stop_stats_reconciler()
+    shutdown_rescore_worker()
+
 @app.get("/")
 async def root():
     return {"message": "SK AXIS API 서버에 오신 것을 환영합니다!"}
@@ -1,3 +1,7 @@
 from app.models.user import User
 from app.models.interview import Interview, Answer
-from app.models.evaluation import Evaluation, CriteriaScore
+from app.models.evaluation import Evaluation, CriteriaScore, EvaluationBatch, EvaluationBatchItem
+from app.models.export import ExportJob
+from app.models.stats import StatCounter
+from app.models.analytics import InterviewDailyRollup, EvaluationDailyRollup, ScoreCohortSketch
+from app.models.scoring import ScoringWeights
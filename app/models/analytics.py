@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, func, JSON, UniqueConstraint
+
+from app.db.session import Base
+
+class InterviewDailyRollup(Base):
+    __tablename__ = "interview_daily_rollups"
+    __table_args__ = (UniqueConstraint("day", "interviewer_id", "status", name="uq_interview_daily_rollup"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)  # 면접 시작일
+    interviewer_id = Column(Integer, nullable=False, default=0)  # 면접관 ID (없으면 0)
+    status = Column(String(50), nullable=False)  # 면접 상태
+    count = Column(Integer, nullable=False, default=0)  # 면접 수
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<InterviewDailyRollup {self.day} - {self.interviewer_id} - {self.status}: {self.count}>"
+
+
+class EvaluationDailyRollup(Base):
+    __tablename__ = "evaluation_daily_rollups"
+    __table_args__ = (UniqueConstraint("day", "interviewer_id", name="uq_evaluation_daily_rollup"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)  # 평가일
+    interviewer_id = Column(Integer, nullable=False, default=0)  # 면접관 ID (없으면 0)
+    count = Column(Integer, nullable=False, default=0)  # 총점이 있는 평가 수
+    score_sum = Column(Float, nullable=False, default=0)  # 총점 합계
+    histogram = Column(JSON, nullable=True)  # 총점 히스토그램 (구간별 건수)
+    digest = Column(JSON, nullable=True)  # 총점 분위수 스케치 (t-digest)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<EvaluationDailyRollup {self.day} - {self.interviewer_id}: {self.count}>"
+
+
+class ScoreCohortSketch(Base):
+    __tablename__ = "score_cohort_sketches"
+    __table_args__ = (UniqueConstraint("month", "metric", name="uq_score_cohort_sketch"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(Date, nullable=False)  # 코호트 (평가 월의 1일)
+    metric = Column(String(100), nullable=False)  # total 또는 category.criteria (예: verbal.clarity)
+    count = Column(Integer, nullable=False, default=0)  # 점수 수
+    digest = Column(JSON, nullable=True)  # 점수 분위수 스케치 (t-digest)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ScoreCohortSketch {self.month} - {self.metric}: {self.count}>"
@@ -7,7 +7,7 @@ class Evaluation(Base):
     __tablename__ = "evaluations"
 
     id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("interviews.id"))
+    interview_id = Column(Integer, ForeignKey("interviews.id"), unique=True)  # 면접당 평가 1건 (동시 저장 시 하나만 커밋)
     total_score = Column(Float, nullable=True)  # 총점 (100점 만점)
     verbal_score = Column(Float, nullable=True)  # 언어적 평가 점수
     nonverbal_score = Column(Float, nullable=True)  # 비언어적 평가 점수
@@ -42,3 +42,44 @@ class CriteriaScore(Base):
 
     def __repr__(self):
         return f"<CriteriaScore {self.id} - {self.category}.{self.criteria}>"
+
+
+class EvaluationBatch(Base):
+    __tablename__ = "evaluation_batches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(50), default="pending")  # pending, running, completed
+    concurrency = Column(Integer, nullable=False)  # 동시 평가 작업 수
+    filters = Column(JSON, nullable=True)  # 대상 면접 선정 조건 (JSON)
+    total_count = Column(Integer, default=0)  # 대상 면접 수
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 관계 정의
+    items = relationship("EvaluationBatchItem", back_populates="batch", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<EvaluationBatch {self.id} - {self.status}>"
+
+
+class EvaluationBatchItem(Base):
+    __tablename__ = "evaluation_batch_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    batch_id = Column(Integer, ForeignKey("evaluation_batches.id"), index=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id"))
+    status = Column(String(50), default="pending")  # pending, running, completed, failed
+    evaluation_id = Column(Integer, ForeignKey("evaluations.id"), nullable=True)
+    total_score = Column(Float, nullable=True)  # 부분 결과 조회용 총점
+    error = Column(Text, nullable=True)  # 실패 사유
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 관계 정의
+    batch = relationship("EvaluationBatch", back_populates="items")
+
+    def __repr__(self):
+        return f"<EvaluationBatchItem {self.id} - Batch {self.batch_id} - Interview {self.interview_id}>"
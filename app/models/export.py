@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, JSON
+
+from app.db.session import Base
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    format = Column(String(20), nullable=False)  # xlsx, parquet
+    status = Column(String(50), default="pending")  # pending, running, completed, failed, expired
+    filters = Column(JSON, nullable=True)  # 내보내기 대상 조건 (JSON)
+    total_rows = Column(Integer, nullable=True)  # 전체 행 수
+    rows_written = Column(Integer, default=0)  # 기록한 행 수
+    file_path = Column(String(255), nullable=True)  # 결과 파일 경로 (MEDIA_STORAGE_PATH 기준)
+    error = Column(Text, nullable=True)  # 실패 사유
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ExportJob {self.id} - {self.format} - {self.status}>"
@@ -10,7 +10,7 @@ class Interview(Base):
     candidate_name = Column(String(255), nullable=False)
     candidate_resume = Column(Text, nullable=True)
     interviewer_id = Column(Integer, ForeignKey("users.id"))
-    start_time = Column(DateTime(timezone=True), server_default=func.now())
+    start_time = Column(DateTime(timezone=True), server_default=func.now(), index=True)  # 최근 면접 조회/기간 조건용 인덱스
     end_time = Column(DateTime(timezone=True), nullable=True)
     status = Column(String(50), default="scheduled")  # scheduled, in_progress, completed, cancelled
     video_path = Column(String(255), nullable=True)
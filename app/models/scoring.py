@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, func, JSON
+
+from app.db.session import Base
+
+class ScoringWeights(Base):
+    __tablename__ = "scoring_weights"
+
+    version = Column(Integer, primary_key=True, index=True)  # 가중치 버전 (증가만 하며 수정하지 않음)
+    category_weights = Column(JSON, nullable=False)  # 영역별 가중치 (예: {"verbal": 0.6, "nonverbal": 0.4})
+    criteria_weights = Column(JSON, nullable=True)  # 영역 안 기준별 가중치 (없는 기준은 1, 예: {"verbal": {"depth": 2}})
+    description = Column(Text, nullable=True)
+    is_active = Column(Boolean, default=False, index=True)  # 새 평가에 적용 중인 버전 (하나만 활성)
+    rescore_status = Column(String(50), nullable=True)  # 기존 평가 재채점 상태: pending, running, completed, failed
+    rescored_count = Column(Integer, default=0)  # 재채점한 평가 수
+    rescore_error = Column(Text, nullable=True)
+    rescored_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ScoringWeights v{self.version} - {self.category_weights}>"
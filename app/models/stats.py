@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Float, DateTime, func
+
+from app.db.session import Base
+
+class StatCounter(Base):
+    __tablename__ = "stat_counters"
+
+    name = Column(String(100), primary_key=True)  # 카운터 이름 (예: interviews.status.completed)
+    value = Column(Float, nullable=False, default=0)  # 누적 값 (건수 또는 점수 합계)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<StatCounter {self.name} = {self.value}>"
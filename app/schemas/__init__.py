@@ -1,3 +1,5 @@
 from app.schemas.user import User, UserCreate, UserUpdate
 from app.schemas.interview import Interview, InterviewCreate, InterviewUpdate, Answer, AnswerCreate, STTChunk, GenerateQuestionsRequest, GenerateQuestionsResponse, Question
-from app.schemas.evaluation import Evaluation, EvaluationCreate, EvaluationUpdate, CriteriaScore, CriteriaScoreCreate, EvaluateInterviewRequest, EvaluationResult
+from app.schemas.evaluation import Evaluation, EvaluationCreate, EvaluationUpdate, CriteriaScore, CriteriaScoreCreate, EvaluateInterviewRequest, EvaluationResult, EvaluationBatchCreate, EvaluationBatchItem, EvaluationBatchStatus, EvaluationReportBatchCreate
+from app.schemas.export import EvaluationExportFilter, ExportJobCreate, ExportJobStatus
+from app.schemas.scoring import ScoringWeights, ScoringWeightsCreate
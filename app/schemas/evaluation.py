@@ -70,3 +70,45 @@ class EvaluationResult(BaseModel):
     detailed_scores: Dict[str, Any]
     feedback: str
     pdf_url: Optional[str] = None
+    percentiles: Optional[Dict[str, Any]] = None  # 평가 월 코호트 내 백분위 (총점 및 기준별)
+
+# 일괄 평가 요청 스키마 (interview_ids가 없으면 조건으로 대상 면접 선정)
+class EvaluationBatchCreate(BaseModel):
+    interview_ids: Optional[List[int]] = None
+    interviewer_id: Optional[int] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    only_unevaluated: bool = True
+    concurrency: Optional[int] = Field(None, ge=1)
+
+# 일괄 평가 항목 스키마
+class EvaluationBatchItem(BaseModel):
+    id: int
+    interview_id: int
+    status: str
+    evaluation_id: Optional[int] = None
+    total_score: Optional[float] = None
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+# 일괄 평가 진행 상황 스키마
+class EvaluationBatchStatus(BaseModel):
+    batch_id: int
+    status: str
+    concurrency: int
+    total: int
+    pending: int
+    running: int
+    completed: int
+    failed: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    items: List[EvaluationBatchItem] = []
+
+# 리포트 일괄 생성 요청 스키마
+class EvaluationReportBatchCreate(BaseModel):
+    evaluation_ids: List[int] = Field(..., min_items=1)
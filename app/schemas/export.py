@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any
+from datetime import datetime
+
+# 내보내기 대상 조건 스키마
+class EvaluationExportFilter(BaseModel):
+    start_date: Optional[datetime] = None  # 면접 시작 시각 (이상)
+    end_date: Optional[datetime] = None  # 면접 시작 시각 (미만)
+    interview_status: Optional[str] = None  # scheduled, in_progress, completed, cancelled
+    interviewer_id: Optional[int] = None
+
+# 내보내기 작업 생성 요청 스키마
+class ExportJobCreate(EvaluationExportFilter):
+    format: str = Field("xlsx", pattern="^(xlsx|parquet)$")
+
+# 내보내기 작업 상태 스키마
+class ExportJobStatus(BaseModel):
+    job_id: int
+    format: str
+    status: str
+    filters: Optional[Dict[str, Any]] = None
+    total_rows: Optional[int] = None
+    rows_written: int = 0
+    progress: float = 0.0  # 진행률 (0 ~ 1)
+    error: Optional[str] = None
+    download_url: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import Optional, Dict
+from datetime import datetime
+
+# 채점 가중치 생성 스키마
+class ScoringWeightsCreate(BaseModel):
+    category_weights: Dict[str, float]  # 영역별 가중치 (verbal, nonverbal, 합이 1이 아니어도 비율로 적용)
+    criteria_weights: Optional[Dict[str, Dict[str, float]]] = None  # 영역 안 기준별 가중치 (없는 기준은 1)
+    description: Optional[str] = None
+    activate: bool = True  # 생성 즉시 활성화 후 기존 평가 재채점
+
+# 채점 가중치 응답 스키마
+class ScoringWeights(BaseModel):
+    version: int
+    category_weights: Dict[str, float]
+    criteria_weights: Optional[Dict[str, Dict[str, float]]] = None
+    description: Optional[str] = None
+    is_active: bool
+    rescore_status: Optional[str] = None
+    rescored_count: Optional[int] = 0
+    rescore_error: Optional[str] = None
+    rescored_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
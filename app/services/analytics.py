@@ -0,0 +1,416 @@
+from typing import Optional, List, Dict, Any, Tuple, Iterable
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from datetime import date, datetime, timedelta
+import math
+import logging
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.analytics import InterviewDailyRollup, EvaluationDailyRollup
+from app.models.evaluation import Evaluation
+from app.models.interview import Interview
+from app.utils.tdigest import TDigest
+
+logger = logging.getLogger(__name__)
+
+SCORE_MAX = 5 * settings.SCORE_SCALE  # 총점 만점 (기준별 5점 만점 x 변환 배율)
+SCORE_HISTOGRAM_BIN_WIDTH = 5  # 총점 히스토그램 구간 폭
+SCORE_HISTOGRAM_BINS = max(math.ceil(SCORE_MAX / SCORE_HISTOGRAM_BIN_WIDTH), 1)
+SCORE_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+InterviewRollupKey = Tuple[date, int, str]  # (시작일, 면접관 ID, 상태)
+
+def _to_date(value: Any) -> Optional[date]:
+    """
+    datetime/date/'YYYY-MM-DD' 문자열을 date로 변환 (DB별 date() 반환 형식 차이 흡수)
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def histogram_bin(score: float) -> int:
+    """
+    총점이 속한 히스토그램 구간 번호 (만점은 마지막 구간)
+    """
+    return min(max(int(score // SCORE_HISTOGRAM_BIN_WIDTH), 0), SCORE_HISTOGRAM_BINS - 1)
+
+def period_start(day: date, granularity: str) -> Optional[date]:
+    """
+    집계 단위(일/주/월/전체)의 시작일 (주는 월요일 시작, 전체는 None)
+    """
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "all":
+        return None
+    return day
+
+# ---------------------------------------------------------------------------
+# 면접 롤업 (일별 x 면접관 x 상태 건수)
+# ---------------------------------------------------------------------------
+
+def interview_rollup_key(interview: Interview) -> Optional[InterviewRollupKey]:
+    """
+    면접이 속한 일별 롤업 버킷
+    """
+    if interview.start_time is None or interview.status is None:
+        return None
+    return _to_date(interview.start_time), interview.interviewer_id or 0, interview.status
+
+def _increment_interview_rollup(db: Session, key: InterviewRollupKey, delta: int) -> None:
+    """
+    버킷 건수 증감 (행이 없으면 생성, 동시 생성 충돌 시 갱신으로 재시도)
+    """
+    day, interviewer_id, status = key
+    query = db.query(InterviewDailyRollup).filter(
+        InterviewDailyRollup.day == day,
+        InterviewDailyRollup.interviewer_id == interviewer_id,
+        InterviewDailyRollup.status == status
+    )
+    if query.update({InterviewDailyRollup.count: InterviewDailyRollup.count + delta}, synchronize_session=False):
+        return
+    try:
+        with db.begin_nested():
+            db.add(InterviewDailyRollup(day=day, interviewer_id=interviewer_id, status=status, count=delta))
+    except IntegrityError:
+        query.update({InterviewDailyRollup.count: InterviewDailyRollup.count + delta}, synchronize_session=False)
+
+def apply_interview_rollup(db: Session, old_key: Optional[InterviewRollupKey], new_key: Optional[InterviewRollupKey]) -> None:
+    """
+    면접 생성/상태·시작일 변경/삭제를 현재 트랜잭션 안에서 롤업에 반영 (커밋은 호출자가 수행)
+    """
+    if old_key == new_key:
+        return
+    deltas = []
+    if old_key is not None:
+        deltas.append((old_key, -1))
+    if new_key is not None:
+        deltas.append((new_key, 1))
+    for key, delta in sorted(deltas):
+        _increment_interview_rollup(db, key, delta)
+
+# ---------------------------------------------------------------------------
+# 평가 롤업 (일별 x 면접관 총점 건수/합계/히스토그램/분위수 스케치)
+# ---------------------------------------------------------------------------
+
+def _lock_evaluation_rollup(db: Session, day: date, interviewer_id: int) -> EvaluationDailyRollup:
+    """
+    평가 롤업 행을 잠금 조회 (없으면 생성), JSON 열을 읽고 고쳐 쓰는 동안 동시 갱신 방지
+    """
+    query = db.query(EvaluationDailyRollup).filter(
+        EvaluationDailyRollup.day == day,
+        EvaluationDailyRollup.interviewer_id == interviewer_id
+    )
+    rollup = query.with_for_update().first()
+    if rollup is not None:
+        return rollup
+    try:
+        with db.begin_nested():
+            rollup = EvaluationDailyRollup(
+                day=day, interviewer_id=interviewer_id, count=0, score_sum=0,
+                histogram=[0] * SCORE_HISTOGRAM_BINS, digest=None
+            )
+            db.add(rollup)
+        return rollup
+    except IntegrityError:
+        return query.with_for_update().first()
+
+def _fill_evaluation_rollup(rollup: EvaluationDailyRollup, scores: Iterable[float]) -> None:
+    """
+    총점 목록으로 평가 롤업 값 채우기
+    """
+    histogram = [0] * SCORE_HISTOGRAM_BINS
+    digest = TDigest()
+    score_sum = 0.0
+    for score in scores:
+        histogram[histogram_bin(score)] += 1
+        digest.add(score)
+        score_sum += score
+    rollup.count = int(digest.count)
+    rollup.score_sum = score_sum
+    rollup.histogram = histogram
+    rollup.digest = digest.to_dict()
+
+def _evaluation_bucket(db: Session, evaluation: Evaluation) -> Tuple[date, int]:
+    """
+    평가가 속한 일별 롤업 버킷 (평가일, 면접관 ID)
+    """
+    if evaluation.created_at is None:
+        db.flush()
+        db.refresh(evaluation, ["created_at"])
+    interviewer_id = db.query(Interview.interviewer_id).filter(Interview.id == evaluation.interview_id).scalar()
+    return _to_date(evaluation.created_at), interviewer_id or 0
+
+def add_evaluation_to_rollup(db: Session, evaluation: Evaluation) -> None:
+    """
+    새 평가 총점을 현재 트랜잭션 안에서 롤업에 누적 (커밋은 호출자가 수행)
+    """
+    if evaluation.total_score is None:
+        return
+    day, interviewer_id = _evaluation_bucket(db, evaluation)
+    rollup = _lock_evaluation_rollup(db, day, interviewer_id)
+
+    score = float(evaluation.total_score)
+    histogram = list(rollup.histogram or [])
+    histogram += [0] * (SCORE_HISTOGRAM_BINS - len(histogram))  # 배율 변경 전에 만든 롤업은 구간 수가 다를 수 있음
+    histogram[histogram_bin(score)] += 1
+    digest = TDigest.from_dict(rollup.digest)
+    digest.add(score)
+
+    rollup.count = (rollup.count or 0) + 1
+    rollup.score_sum = (rollup.score_sum or 0) + score
+    rollup.histogram = histogram
+    rollup.digest = digest.to_dict()
+
+def rebuild_evaluation_rollup(db: Session, day: date, interviewer_id: int) -> None:
+    """
+    평가 롤업 버킷 1개를 원본에서 다시 계산 (스케치는 값을 뺄 수 없으므로 점수 수정/삭제 시 사용)
+    """
+    rollup = _lock_evaluation_rollup(db, day, interviewer_id)
+    start = datetime.combine(day, datetime.min.time())
+    scores = (
+        db.query(Evaluation.total_score)
+        .join(Interview, Interview.id == Evaluation.interview_id)
+        .filter(
+            Evaluation.created_at >= start,
+            Evaluation.created_at < start + timedelta(days=1),
+            func.coalesce(Interview.interviewer_id, 0) == interviewer_id,
+            Evaluation.total_score.isnot(None)
+        )
+    )
+    _fill_evaluation_rollup(rollup, (float(score) for score, in scores))
+    if rollup.count == 0:
+        db.delete(rollup)
+
+def refresh_evaluation_rollup(db: Session, evaluation: Evaluation) -> None:
+    """
+    평가 점수 수정을 현재 트랜잭션 안에서 롤업에 반영 (해당 버킷 재계산)
+    """
+    db.flush()
+    rebuild_evaluation_rollup(db, *_evaluation_bucket(db, evaluation))
+
+def evaluation_buckets_for_interview(db: Session, interview: Interview) -> List[Tuple[date, int]]:
+    """
+    면접의 평가들이 속한 롤업 버킷 목록 (면접 삭제 시 재계산 대상)
+    """
+    days = {
+        _to_date(created_at)
+        for created_at, in db.query(Evaluation.created_at).filter(Evaluation.interview_id == interview.id)
+    }
+    return [(day, interview.interviewer_id or 0) for day in sorted(days) if day is not None]
+
+# ---------------------------------------------------------------------------
+# 전체 재계산
+# ---------------------------------------------------------------------------
+
+def _rebuild_interview_rollup(db: Session, key: InterviewRollupKey) -> None:
+    """
+    면접 롤업 버킷 1개를 잠근 뒤 원본에서 다시 계산 (건수가 0이면 삭제)
+    """
+    day, interviewer_id, status = key
+    query = db.query(InterviewDailyRollup).filter(
+        InterviewDailyRollup.day == day,
+        InterviewDailyRollup.interviewer_id == interviewer_id,
+        InterviewDailyRollup.status == status
+    )
+    rollup = query.with_for_update().first()
+    if rollup is None:
+        try:
+            with db.begin_nested():
+                rollup = InterviewDailyRollup(day=day, interviewer_id=interviewer_id, status=status, count=0)
+                db.add(rollup)
+        except IntegrityError:
+            rollup = query.with_for_update().first()
+
+    start = datetime.combine(day, datetime.min.time())
+    rollup.count = (
+        db.query(func.count(Interview.id))
+        .filter(
+            Interview.start_time >= start,
+            Interview.start_time < start + timedelta(days=1),
+            func.coalesce(Interview.interviewer_id, 0) == interviewer_id,
+            Interview.status == status
+        )
+        .scalar()
+    )
+    if rollup.count == 0:
+        db.delete(rollup)
+
+def rebuild_interview_rollups(db: Session) -> int:
+    """
+    모든 면접 롤업을 버킷 단위로 다시 계산, 남은 버킷 수 반환
+
+    버킷마다 행을 잠그고 재계산 후 커밋하므로 동시에 진행되는 면접 생성/상태 변경과 충돌하지 않음
+    """
+    interview_day = func.date(Interview.start_time)
+    source_keys = {
+        (_to_date(day), interviewer_id, status)
+        for day, interviewer_id, status in (
+            db.query(interview_day, func.coalesce(Interview.interviewer_id, 0), Interview.status)
+            .filter(Interview.start_time.isnot(None), Interview.status.isnot(None))
+            .group_by(interview_day, func.coalesce(Interview.interviewer_id, 0), Interview.status)
+        )
+    }
+    existing_keys = {
+        (_to_date(day), interviewer_id, status)
+        for day, interviewer_id, status in db.query(
+            InterviewDailyRollup.day, InterviewDailyRollup.interviewer_id, InterviewDailyRollup.status
+        )
+    }
+    db.rollback()  # 버킷 조회 트랜잭션 종료 (버킷별 재계산이 최신 커밋을 읽도록)
+
+    for key in sorted(source_keys | existing_keys):
+        _rebuild_interview_rollup(db, key)
+        db.commit()
+    return len(source_keys)
+
+def rebuild_evaluation_rollups(db: Session) -> int:
+    """
+    모든 평가 롤업을 버킷 단위로 다시 계산, 남은 버킷 수 반환
+
+    버킷마다 rebuild_evaluation_rollup으로 행을 잠그고 재계산 후 커밋하므로
+    동시에 저장되는 평가(add_evaluation_to_rollup)와 충돌하지 않음 (메모리는 버킷 수에 비례)
+    """
+    evaluation_day = func.date(Evaluation.created_at)
+    source_keys = {
+        (_to_date(day), interviewer_id)
+        for day, interviewer_id in (
+            db.query(evaluation_day, func.coalesce(Interview.interviewer_id, 0))
+            .join(Interview, Interview.id == Evaluation.interview_id)
+            .filter(Evaluation.total_score.isnot(None), Evaluation.created_at.isnot(None))
+            .group_by(evaluation_day, func.coalesce(Interview.interviewer_id, 0))
+        )
+    }
+    existing_keys = {
+        (_to_date(day), interviewer_id)
+        for day, interviewer_id in db.query(EvaluationDailyRollup.day, EvaluationDailyRollup.interviewer_id)
+    }
+    db.rollback()  # 버킷 조회 트랜잭션 종료 (버킷별 재계산이 최신 커밋을 읽도록)
+
+    for day, interviewer_id in sorted(source_keys | existing_keys):
+        rebuild_evaluation_rollup(db, day, interviewer_id)
+        db.commit()
+    return len(source_keys)
+
+def rebuild_rollups(db: Session) -> Dict[str, int]:
+    """
+    모든 롤업을 원본 테이블에서 다시 계산 (버킷 단위로 잠금/재계산/커밋)
+    """
+    try:
+        return {
+            "interview_buckets": rebuild_interview_rollups(db),
+            "evaluation_buckets": rebuild_evaluation_rollups(db),
+        }
+    except Exception:
+        db.rollback()
+        raise
+
+def rebuild_rollups_task() -> None:
+    """
+    롤업 전체 재계산 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        result = rebuild_rollups(db)
+        logger.info(f"분석 롤업 재계산 완료: {result}")
+    except Exception as e:
+        logger.error(f"분석 롤업 재계산 실패: {e}")
+    finally:
+        db.close()
+
+# ---------------------------------------------------------------------------
+# 기간 조회
+# ---------------------------------------------------------------------------
+
+def get_interview_trends(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    granularity: str = "day",
+    interviewer_id: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    기간별 면접 수, 상태별 건수, 완료율 (일별 롤업을 집계 단위로 합산)
+    """
+    query = (
+        db.query(InterviewDailyRollup.day, InterviewDailyRollup.status, func.sum(InterviewDailyRollup.count))
+        .filter(InterviewDailyRollup.day >= start_date, InterviewDailyRollup.day <= end_date)
+    )
+    if interviewer_id is not None:
+        query = query.filter(InterviewDailyRollup.interviewer_id == interviewer_id)
+
+    periods: Dict[Optional[date], Dict[str, int]] = {}
+    for day, status, count in query.group_by(InterviewDailyRollup.day, InterviewDailyRollup.status):
+        statuses = periods.setdefault(period_start(_to_date(day), granularity), {})
+        statuses[status] = statuses.get(status, 0) + int(count or 0)
+
+    trends = []
+    for period in sorted(periods, key=lambda p: p or start_date):
+        statuses = {status: count for status, count in periods[period].items() if count}
+        total = sum(statuses.values())
+        trends.append({
+            "period": (period or start_date).isoformat(),
+            "total": total,
+            "statuses": statuses,
+            "completion_rate": round(statuses.get("completed", 0) / total, 4) if total else None,
+        })
+    return trends
+
+def get_score_distributions(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    granularity: str = "week",
+    interviewer_id: Optional[int] = None,
+    by_interviewer: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    기간별(선택적으로 면접관별) 총점 분포: 평균, 분위수, 히스토그램 (일별 스케치/히스토그램 병합)
+    """
+    query = db.query(EvaluationDailyRollup).filter(
+        EvaluationDailyRollup.day >= start_date,
+        EvaluationDailyRollup.day <= end_date
+    )
+    if interviewer_id is not None:
+        query = query.filter(EvaluationDailyRollup.interviewer_id == interviewer_id)
+
+    groups: Dict[Tuple[Optional[date], Optional[int]], Dict[str, Any]] = {}
+    for rollup in query:
+        key = (period_start(rollup.day, granularity), rollup.interviewer_id if by_interviewer else None)
+        group = groups.setdefault(key, {
+            "count": 0, "score_sum": 0.0,
+            "histogram": [0] * SCORE_HISTOGRAM_BINS, "digest": TDigest()
+        })
+        group["count"] += rollup.count
+        group["score_sum"] += rollup.score_sum
+        for i, value in enumerate(rollup.histogram or []):
+            group["histogram"][min(i, SCORE_HISTOGRAM_BINS - 1)] += value
+        group["digest"].merge(TDigest.from_dict(rollup.digest))
+
+    distributions = []
+    for (period, group_interviewer_id) in sorted(groups, key=lambda k: (k[0] or start_date, k[1] or 0)):
+        group = groups[(period, group_interviewer_id)]
+        distribution = {
+            "period": (period or start_date).isoformat(),
+            "count": group["count"],
+            "avg_score": round(group["score_sum"] / group["count"], 2) if group["count"] else None,
+            "quantiles": {
+                f"p{int(q * 100)}": round(group["digest"].quantile(q), 2) if group["count"] else None
+                for q in SCORE_QUANTILES
+            },
+            "histogram": {
+                "bin_width": SCORE_HISTOGRAM_BIN_WIDTH,
+                "counts": group["histogram"],
+            },
+        }
+        if by_interviewer:
+            distribution["interviewer_id"] = group_interviewer_id
+        distributions.append(distribution)
+    return distributions
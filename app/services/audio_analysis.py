@@ -0,0 +1,312 @@
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from sqlalchemy.orm import Session
+import os
+import json
+import logging
+import ffmpeg
+import numpy as np
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.interview import get_interview, get_answer_offsets
+from app.services.media import merge_audio_chunks
+from app.services.pcm import PCM_SAMPLE_RATE, list_pcm_chunks, iter_pcm_frames
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = PCM_SAMPLE_RATE
+FRAME_SAMPLES = 480  # 30ms 분석 프레임
+FRAME_SECONDS = FRAME_SAMPLES / SAMPLE_RATE
+BLOCK_FRAMES = 100  # 한 번에 읽는 프레임 수 (3초, 메모리 사용량 상한)
+
+# 음성 피치 탐색 범위 (Hz)
+PITCH_MIN_HZ, PITCH_MAX_HZ = 75, 400
+PITCH_MIN_LAG = SAMPLE_RATE // PITCH_MAX_HZ
+PITCH_MAX_LAG = SAMPLE_RATE // PITCH_MIN_HZ
+
+def frame_features(frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    프레임 행렬 (N x FRAME_SAMPLES, -1~1)에 대한 프레임별 RMS 음량(dBFS), 발화 여부, 피치(Hz, 무성은 NaN) 계산
+    """
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    level_db = 20 * np.log10(rms + 1e-10)
+    voiced = level_db > settings.AUDIO_SILENCE_DB
+
+    pitch = np.full(len(frames), np.nan, dtype=np.float32)
+    if voiced.any():
+        # FFT 기반 자기상관으로 발화 프레임의 기본 주파수 추정
+        voiced_frames = frames[voiced]
+        voiced_frames = voiced_frames - voiced_frames.mean(axis=1, keepdims=True)
+        spectrum = np.fft.rfft(voiced_frames, n=2 * FRAME_SAMPLES, axis=1)
+        autocorr = np.fft.irfft(np.abs(spectrum) ** 2, axis=1)[:, :FRAME_SAMPLES]
+        search = autocorr[:, PITCH_MIN_LAG:PITCH_MAX_LAG + 1]
+        lag = np.argmax(search, axis=1)
+        strength = search[np.arange(len(lag)), lag] / (autocorr[:, 0] + 1e-10)
+        voiced_pitch = np.where(strength > 0.3, SAMPLE_RATE / (lag + PITCH_MIN_LAG), np.nan)
+        pitch[voiced] = voiced_pitch
+
+    return level_db, voiced, pitch
+
+class AudioFeatureAccumulator:
+    """
+    프레임별 특징을 누적하여 음량/피치/발화 비율/휴지 통계를 계산 (고정 크기 상태만 보관)
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.voiced = 0
+        self.level_sum = 0.0
+        self.level_sq_sum = 0.0
+        self.pitch_count = 0
+        self.pitch_sum = 0.0
+        self.pitch_sq_sum = 0.0
+        self.pause_count = 0
+        self.pause_frames = 0
+        self.max_pause_frames = 0
+        self._silence_run = 0  # 아직 끝나지 않은 무음 구간 길이 (프레임)
+        self._seen_speech = False
+
+    def update(self, level_db: np.ndarray, voiced: np.ndarray, pitch: np.ndarray) -> None:
+        """
+        연속된 프레임 구간의 특징 누적
+        """
+        if len(voiced) == 0:
+            return
+
+        self.frames += len(voiced)
+        voiced_level = level_db[voiced]
+        self.voiced += len(voiced_level)
+        self.level_sum += float(voiced_level.sum())
+        self.level_sq_sum += float((voiced_level ** 2).sum())
+
+        valid_pitch = pitch[~np.isnan(pitch)]
+        self.pitch_count += len(valid_pitch)
+        self.pitch_sum += float(valid_pitch.sum())
+        self.pitch_sq_sum += float((valid_pitch.astype(np.float64) ** 2).sum())
+
+        # 발화/무음 구간 길이 (run-length)
+        silence = ~voiced
+        starts = np.r_[0, np.flatnonzero(np.diff(silence.astype(np.int8))) + 1]
+        lengths = np.diff(np.r_[starts, len(silence)])
+        is_silence = silence[starts]
+
+        for length, run_is_silence in zip(lengths, is_silence):
+            if run_is_silence:
+                self._silence_run += int(length)
+            else:
+                self._close_silence_run()
+                self._seen_speech = True
+
+    def _close_silence_run(self) -> None:
+        """
+        발화 사이의 무음 구간을 휴지로 집계 (첫 발화 이전의 무음은 제외)
+        """
+        run = self._silence_run
+        self._silence_run = 0
+        if not self._seen_speech or run * FRAME_SECONDS < settings.AUDIO_MIN_PAUSE_SECONDS:
+            return
+        self.pause_count += 1
+        self.pause_frames += run
+        self.max_pause_frames = max(self.max_pause_frames, run)
+
+    def result(self) -> Dict[str, Any]:
+        """
+        누적 통계 반환 (끝부분 무음은 휴지로 집계하지 않음)
+        """
+        duration = self.frames * FRAME_SECONDS
+        level_mean = self.level_sum / self.voiced if self.voiced else None
+        level_var = self.level_sq_sum / self.voiced - level_mean ** 2 if self.voiced else None
+        pitch_mean = self.pitch_sum / self.pitch_count if self.pitch_count else None
+        pitch_var = self.pitch_sq_sum / self.pitch_count - pitch_mean ** 2 if self.pitch_count else None
+
+        def _round(value: Optional[float], digits: int = 2) -> Optional[float]:
+            return None if value is None else round(float(value), digits)
+
+        return {
+            "duration_seconds": _round(duration),
+            "speaking_ratio": _round(self.voiced / self.frames if self.frames else 0.0, 3),
+            "loudness_mean_db": _round(level_mean),
+            "loudness_std_db": _round(np.sqrt(max(level_var, 0.0)) if level_var is not None else None),
+            "pitch_mean_hz": _round(pitch_mean),
+            "pitch_variance": _round(max(pitch_var, 0.0) if pitch_var is not None else None),
+            "pause_count": self.pause_count,
+            "pause_total_seconds": _round(self.pause_frames * FRAME_SECONDS),
+            "pause_mean_seconds": _round(self.pause_frames * FRAME_SECONDS / self.pause_count) if self.pause_count else 0.0,
+            "pause_max_seconds": _round(self.max_pause_frames * FRAME_SECONDS),
+            "pauses_per_minute": _round(self.pause_count / (duration / 60)) if duration else 0.0,
+        }
+
+def iter_pcm_blocks(audio_path: str) -> Iterator[np.ndarray]:
+    """
+    ffmpeg 파이프로 16kHz 모노 PCM을 디코딩하여 프레임 행렬 (BLOCK_FRAMES x FRAME_SAMPLES) 단위로 순차 반환
+    """
+    process = (
+        ffmpeg
+        .input(audio_path)
+        .output("pipe:", format="s16le", acodec="pcm_s16le", ac=1, ar=SAMPLE_RATE)
+        .global_args("-loglevel", "error", "-nostdin")
+        .run_async(pipe_stdout=True)
+    )
+    block_bytes = BLOCK_FRAMES * FRAME_SAMPLES * 2
+    try:
+        while True:
+            data = process.stdout.read(block_bytes)
+            usable = len(data) // (FRAME_SAMPLES * 2) * FRAME_SAMPLES * 2
+            if usable == 0:
+                break
+            samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+            yield samples.reshape(-1, FRAME_SAMPLES)
+            if len(data) < block_bytes:
+                break
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(f"오디오 디코딩 실패 (ffmpeg 종료 코드 {returncode}): {audio_path}")
+
+def extract_audio_features(blocks: Iterator[np.ndarray], segments: List[Tuple[int, float, float]]) -> Dict[str, Any]:
+    """
+    프레임 블록 스트림 전체와 답변 구간별 음성 특징 추출 (블록 단위 스트리밍 처리)
+    """
+    overall = AudioFeatureAccumulator()
+    per_question = {question_index: AudioFeatureAccumulator() for question_index, _, _ in segments}
+
+    frame_offset = 0
+    for block in blocks:
+        level_db, voiced, pitch = frame_features(block)
+        overall.update(level_db, voiced, pitch)
+
+        # 블록과 겹치는 답변 구간만 잘라서 누적
+        block_start = frame_offset * FRAME_SECONDS
+        block_end = (frame_offset + len(block)) * FRAME_SECONDS
+        for question_index, start, end in segments:
+            if end <= block_start or start >= block_end:
+                continue
+            lo = max(0, int(start / FRAME_SECONDS) - frame_offset)
+            hi = min(len(block), int(end / FRAME_SECONDS) - frame_offset)
+            if hi > lo:
+                per_question[question_index].update(level_db[lo:hi], voiced[lo:hi], pitch[lo:hi])
+
+        frame_offset += len(block)
+
+    return {
+        "overall": overall.result(),
+        "questions": {str(question_index): acc.result() for question_index, acc in per_question.items()},
+    }
+
+def get_audio_features_path(interview_id: int) -> str:
+    """
+    면접별 음성 특징 파일 경로
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "audio_features", f"interview_{interview_id}.json")
+
+def load_audio_features(interview_id: int) -> Optional[Dict[str, Any]]:
+    """
+    저장된 음성 특징 조회
+    """
+    path = get_audio_features_path(interview_id)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def analyze_interview_audio(db: Session, interview_id: int) -> Optional[Dict[str, Any]]:
+    """
+    면접 음성 특징 추출 후 질문별로 저장
+
+    업로드 시 정규화해 둔 PCM 청크를 우선 사용하고, 없으면 병합된 오디오(없으면 비디오)를 디코딩
+    """
+    try:
+        interview = get_interview(db, interview_id)
+        if not interview:
+            logger.error(f"면접 ID {interview_id}에 대한 음성 분석 실패: 면접이 존재하지 않습니다.")
+            return None
+
+        pcm_chunks = list_pcm_chunks(interview_id)
+        media_path = interview.audio_path or interview.video_path
+        if pcm_chunks:
+            blocks = iter_pcm_frames(pcm_chunks, FRAME_SAMPLES, BLOCK_FRAMES)
+        elif media_path:
+            blocks = iter_pcm_blocks(os.path.join(settings.MEDIA_STORAGE_PATH, media_path))
+        else:
+            logger.error(f"면접 ID {interview_id}에 대한 음성 분석 실패: 오디오가 없습니다.")
+            return None
+
+        features = extract_audio_features(blocks, get_answer_offsets(db, interview))
+        if not features["overall"]["duration_seconds"]:
+            # 빈 결과는 저장하지 않아 다음 평가 때 다시 추출
+            logger.error(f"면접 ID {interview_id}에 대한 음성 분석 실패: 디코딩된 오디오 프레임이 없습니다.")
+            return None
+
+        path = get_audio_features_path(interview_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(features, f, ensure_ascii=False, indent=2)
+
+        return features
+    except Exception as e:
+        logger.error(f"면접 음성 분석 실패: {e}")
+        return None
+
+def _answer_voice_stats(features: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    답변 구간의 발화 평균 음량과 피치 분산 (질문별 값을 발화 시간으로 가중 평균, 답변 구간이 없으면 전체 값)
+
+    답변 사이의 대기/질문 낭독 구간을 제외해 지원자 발화만 반영
+    """
+    questions = [
+        question for question in features.get("questions", {}).values()
+        if question.get("loudness_mean_db") is not None
+    ]
+    if not questions:
+        overall = features.get("overall", {})
+        return overall.get("loudness_mean_db"), overall.get("pitch_variance")
+
+    weights = np.array([(question["duration_seconds"] or 0) * (question["speaking_ratio"] or 0) for question in questions])
+    if weights.sum() <= 0:
+        weights = np.ones(len(questions))
+    loudness = float(np.average([question["loudness_mean_db"] for question in questions], weights=weights))
+
+    pitched = [(question["pitch_variance"], weight) for question, weight in zip(questions, weights) if question.get("pitch_variance") is not None]
+    pitch_variance = None
+    if pitched and sum(weight for _, weight in pitched) > 0:
+        pitch_variance = float(np.average([value for value, _ in pitched], weights=[weight for _, weight in pitched]))
+    return loudness, pitch_variance
+
+def score_volume(features: Dict[str, Any]) -> Optional[float]:
+    """
+    음성 특징으로 성량 점수 계산 (1-5점): 답변 구간 발화 평균 음량 70%, 억양 변화(피치 표준편차) 30%
+    """
+    loudness, pitch_variance = _answer_voice_stats(features)
+    if loudness is None:
+        return None
+
+    # -40dBFS 이하 1점 ~ -26dBFS 이상 5점
+    loudness_score = 1 + 4 * np.clip((loudness + 40) / 14, 0, 1)
+    if pitch_variance is None:
+        return round(float(loudness_score), 1)
+
+    # 피치 표준편차 30Hz 이상이면 단조롭지 않은 것으로 판단
+    intonation_score = 1 + 4 * np.clip(np.sqrt(pitch_variance) / 30, 0, 1)
+    return round(float(0.7 * loudness_score + 0.3 * intonation_score), 1)
+
+def process_merged_audio(interview_id: int) -> None:
+    """
+    오디오 병합 후 음성 특징 추출 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        if merge_audio_chunks(db, interview_id):
+            analyze_interview_audio(db, interview_id)
+    finally:
+        db.close()
+
+def analyze_interview_audio_task(interview_id: int) -> None:
+    """
+    음성 특징 추출 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        analyze_interview_audio(db, interview_id)
+    finally:
+        db.close()
@@ -0,0 +1,71 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+import os
+import uuid
+import logging
+import ffmpeg
+
+from app.core.config import settings
+from app.services.interview import get_interview, get_answer_offsets
+
+logger = logging.getLogger(__name__)
+
+def get_clip_dir(interview_id: int) -> str:
+    """
+    면접별 답변 클립 캐시 디렉토리
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "audios", "clips", f"interview_{interview_id}")
+
+def cut_audio_clip(source_path: str, output_path: str, start: float, end: float) -> bool:
+    """
+    스트림 복사로 오디오 구간 잘라내기 (재인코딩 없음, 입력 측 탐색)
+
+    MP3는 프레임(약 26ms) 단위로 독립 디코딩되므로 복사해도 경계 오차가 프레임 이내
+    """
+    # 같은 프로세스의 여러 스레드가 같은 클립을 만들어도 임시 파일이 겹치지 않도록 고유 이름 사용
+    temp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        (
+            ffmpeg
+            .input(source_path, ss=f"{start:.3f}")
+            .output(temp_path, t=f"{end - start:.3f}", c="copy", f="mp3", map_metadata=-1)
+            .run(quiet=True, overwrite_output=True)
+        )
+        # 다른 요청이 같은 클립을 만들고 있어도 완성된 파일만 보이도록 교체
+        os.replace(temp_path, output_path)
+        return True
+    except ffmpeg.Error as e:
+        logger.error(f"오디오 클립 생성 실패: {e.stderr.decode(errors='ignore') if e.stderr else e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def get_answer_audio_clip(db: Session, interview_id: int, question_index: int) -> Optional[str]:
+    """
+    질문별 답변 오디오 클립 경로 (디스크 캐시, 없으면 생성)
+
+    캐시 파일명에 구간을 포함하므로 답변 시각이 바뀌거나 원본이 다시 병합되면 새로 생성
+    """
+    interview = get_interview(db, interview_id)
+    if not interview or not interview.audio_path:
+        return None
+
+    offsets = {index: (start, end) for index, start, end in get_answer_offsets(db, interview)}
+    if question_index not in offsets:
+        return None
+    start, end = offsets[question_index]
+
+    source_path = os.path.join(settings.MEDIA_STORAGE_PATH, interview.audio_path)
+    if not os.path.exists(source_path):
+        return None
+
+    # 오디오가 다시 병합된 경우 이전 캐시는 사용하지 않음
+    clip_dir = get_clip_dir(interview_id)
+    clip_path = os.path.join(clip_dir, f"q{question_index}_{int(start * 1000)}_{int(end * 1000)}.mp3")
+    if os.path.exists(clip_path) and os.path.getmtime(clip_path) >= os.path.getmtime(source_path):
+        return clip_path
+
+    os.makedirs(clip_dir, exist_ok=True)
+    if not cut_audio_clip(source_path, clip_path, start, end):
+        return None
+    return clip_path
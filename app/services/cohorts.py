@@ -0,0 +1,206 @@
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from datetime import date, datetime
+import logging
+
+from app.db.session import SessionLocal
+from app.models.analytics import ScoreCohortSketch
+from app.models.evaluation import Evaluation, CriteriaScore
+from app.utils.tdigest import TDigest
+
+logger = logging.getLogger(__name__)
+
+TOTAL_METRIC = "total"
+
+def criteria_metric(category: str, criteria: str) -> str:
+    """
+    평가 기준별 스케치 이름
+    """
+    return f"{category}.{criteria}"
+
+def cohort_month(value: Any) -> date:
+    """
+    평가 시각이 속한 코호트 (해당 월의 1일)
+    """
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.replace(day=1)
+
+def _month_range(month: date) -> Tuple[datetime, datetime]:
+    """
+    코호트 기간 [시작, 다음 달 시작)
+    """
+    start = datetime.combine(month, datetime.min.time())
+    end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+    return start, end
+
+def _lock_cohort_sketch(db: Session, month: date, metric: str) -> ScoreCohortSketch:
+    """
+    코호트 스케치 행을 잠금 조회 (없으면 생성), 스케치를 읽고 고쳐 쓰는 동안 동시 갱신 방지
+    """
+    query = db.query(ScoreCohortSketch).filter(
+        ScoreCohortSketch.month == month,
+        ScoreCohortSketch.metric == metric
+    )
+    sketch = query.with_for_update().first()
+    if sketch is not None:
+        return sketch
+    try:
+        with db.begin_nested():
+            sketch = ScoreCohortSketch(month=month, metric=metric, count=0, digest=None)
+            db.add(sketch)
+        return sketch
+    except IntegrityError:
+        return query.with_for_update().first()
+
+def add_to_cohort(db: Session, month: date, values: Dict[str, float]) -> None:
+    """
+    코호트 스케치에 점수 누적 (현재 트랜잭션 안에서, 교착 상태를 피하기 위해 이름 순서로 잠금)
+    """
+    for metric in sorted(values):
+        sketch = _lock_cohort_sketch(db, month, metric)
+        digest = TDigest.from_dict(sketch.digest)
+        digest.add(values[metric])
+        sketch.count = (sketch.count or 0) + 1
+        sketch.digest = digest.to_dict()
+
+def _evaluation_month(db: Session, evaluation: Evaluation) -> date:
+    """
+    평가의 코호트 (생성 시각이 아직 없으면 flush 후 서버 기본값 조회)
+    """
+    if evaluation.created_at is None:
+        db.flush()
+        db.refresh(evaluation, ["created_at"])
+    return cohort_month(evaluation.created_at)
+
+def record_evaluation_in_cohort(db: Session, evaluation: Evaluation, criteria_scores: Optional[List[Dict[str, Any]]] = None) -> None:
+    """
+    새 평가의 총점과 기준별 점수를 월별 코호트 스케치에 반영 (커밋은 호출자가 수행)
+    """
+    values = {
+        criteria_metric(criteria_score["category"], criteria_score["criteria"]): float(criteria_score["score"])
+        for criteria_score in criteria_scores or []
+    }
+    if evaluation.total_score is not None:
+        values[TOTAL_METRIC] = float(evaluation.total_score)
+    if values:
+        add_to_cohort(db, _evaluation_month(db, evaluation), values)
+
+def record_criteria_score_in_cohort(db: Session, criteria_score: CriteriaScore) -> None:
+    """
+    개별로 추가된 기준별 점수를 해당 평가의 코호트 스케치에 반영 (커밋은 호출자가 수행)
+    """
+    created_at = db.query(Evaluation.created_at).filter(Evaluation.id == criteria_score.evaluation_id).scalar()
+    if created_at is None:
+        return
+    add_to_cohort(db, cohort_month(created_at), {
+        criteria_metric(criteria_score.category, criteria_score.criteria): float(criteria_score.score)
+    })
+
+def rebuild_cohort_month(db: Session, month: date, total_only: bool = False) -> None:
+    """
+    월별 코호트 스케치를 원본 점수에서 다시 계산 (스케치는 값을 뺄 수 없으므로 점수 수정/삭제 시 사용)
+
+    total_only이면 총점 스케치만 재계산 (재채점은 기준별 점수를 바꾸지 않음)
+    """
+    # 기존 행을 먼저 잠가 재계산 중 누적되는 점수가 덮어써지지 않게 함
+    query = db.query(ScoreCohortSketch).filter(ScoreCohortSketch.month == month)
+    if total_only:
+        query = query.filter(ScoreCohortSketch.metric == TOTAL_METRIC)
+    existing = {sketch.metric: sketch for sketch in query.with_for_update()}
+    start, end = _month_range(month)
+
+    digests: Dict[str, TDigest] = {}
+    for score, in (
+        db.query(Evaluation.total_score)
+        .filter(Evaluation.created_at >= start, Evaluation.created_at < end, Evaluation.total_score.isnot(None))
+    ):
+        digests.setdefault(TOTAL_METRIC, TDigest()).add(score)
+    if not total_only:
+        for category, criteria, score in (
+            db.query(CriteriaScore.category, CriteriaScore.criteria, CriteriaScore.score)
+            .join(Evaluation, Evaluation.id == CriteriaScore.evaluation_id)
+            .filter(Evaluation.created_at >= start, Evaluation.created_at < end)
+        ):
+            digests.setdefault(criteria_metric(category, criteria), TDigest()).add(score)
+
+    for metric in sorted(set(existing) | set(digests)):
+        digest = digests.get(metric)
+        if digest is None:
+            db.delete(existing[metric])
+            continue
+        sketch = existing.get(metric) or _lock_cohort_sketch(db, month, metric)
+        sketch.count = int(digest.count)
+        sketch.digest = digest.to_dict()
+
+def rebuild_cohorts(db: Session, total_only: bool = False) -> int:
+    """
+    모든 월별 코호트 스케치 재계산, 재계산한 월 수 반환 (total_only이면 총점 스케치만)
+    """
+    try:
+        months = sorted({
+            cohort_month(day)
+            for day, in db.query(func.date(Evaluation.created_at)).filter(Evaluation.created_at.isnot(None)).distinct()
+        })
+        stale = db.query(ScoreCohortSketch).filter(ScoreCohortSketch.month.notin_(months))
+        if total_only:
+            stale = stale.filter(ScoreCohortSketch.metric == TOTAL_METRIC)
+        stale.delete(synchronize_session=False)
+        for month in months:
+            rebuild_cohort_month(db, month, total_only)
+            db.commit()
+        return len(months)
+    except Exception:
+        db.rollback()
+        raise
+
+def rebuild_cohorts_task() -> None:
+    """
+    코호트 스케치 전체 재계산 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        months = rebuild_cohorts(db)
+        logger.info(f"코호트 스케치 재계산 완료: {months}개월")
+    except Exception as e:
+        logger.error(f"코호트 스케치 재계산 실패: {e}")
+    finally:
+        db.close()
+
+def get_evaluation_percentiles(db: Session, evaluation: Evaluation) -> Optional[Dict[str, Any]]:
+    """
+    평가 월 코호트 안에서의 백분위 (총점 및 기준별, 0 ~ 100)
+
+    정렬 없이 월별 스케치의 누적 분포로 계산하므로 평가 수와 무관하게 조회 1회
+    """
+    if evaluation.created_at is None:
+        return None
+    month = cohort_month(evaluation.created_at)
+    sketches = {
+        metric: TDigest.from_dict(digest)
+        for metric, digest in db.query(ScoreCohortSketch.metric, ScoreCohortSketch.digest).filter(ScoreCohortSketch.month == month)
+    }
+
+    def _percentile(metric: str, score: Optional[float]) -> Optional[float]:
+        digest = sketches.get(metric)
+        if score is None or digest is None or digest.count == 0:
+            return None
+        return round(digest.cdf(float(score)) * 100, 1)
+
+    criteria = {}
+    for criteria_score in evaluation.criteria_scores:
+        percentile = _percentile(criteria_metric(criteria_score.category, criteria_score.criteria), criteria_score.score)
+        if percentile is not None:
+            criteria.setdefault(criteria_score.category, {})[criteria_score.criteria] = percentile
+
+    total_digest = sketches.get(TOTAL_METRIC)
+    return {
+        "cohort": month.strftime("%Y-%m"),
+        "cohort_size": int(total_digest.count) if total_digest else 0,
+        "total": _percentile(TOTAL_METRIC, evaluation.total_score),
+        "criteria": criteria,
+    }
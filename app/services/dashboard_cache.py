@@ -0,0 +1,115 @@
+from typing import Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+import json
+import time
+import threading
+import logging
+import redis
+
+from app.core.config import settings
+from app.db.session import SessionLocal, redis_client
+from app.services.lock import RedisLock
+from app.services.stats import compute_dashboard_stats
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_CACHE_KEY = "dashboard:snapshot"
+DASHBOARD_VERSION_KEY = "dashboard:version"  # 무효화 시 증가, 이전 버전으로 계산된 스냅샷은 갱신 대상
+DASHBOARD_LOCK_NAME = "lock:dashboard:refresh"
+DASHBOARD_LOCK_LEASE_MS = 30000
+
+def invalidate_dashboard_cache() -> None:
+    """
+    대시보드 캐시 무효화 (면접 상태/평가 변경 커밋 후 호출)
+
+    키를 지우는 대신 버전을 올려 스냅샷을 오래된 것으로 표시 (다음 조회에서 한 번만 재계산하고 그동안은 기존 스냅샷 제공)
+    """
+    try:
+        redis_client.incr(DASHBOARD_VERSION_KEY)
+    except redis.RedisError as e:
+        logger.warning(f"대시보드 캐시 무효화 실패: {e}")
+
+def _read_snapshot() -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    캐시된 스냅샷과 현재 버전 조회 (1회 왕복)
+    """
+    cached, version = redis_client.mget(DASHBOARD_CACHE_KEY, DASHBOARD_VERSION_KEY)
+    version = version or "0"
+    if cached is None:
+        return None, version
+    return json.loads(cached), version
+
+def _is_stale(snapshot: Dict[str, Any], version: str) -> bool:
+    """
+    재계산이 필요한 스냅샷인지 확인 (무효화 이후 계산되지 않았거나 만료가 임박한 경우)
+    """
+    if snapshot.get("version") != version:
+        return True
+    age = time.time() - snapshot["computed_at"]
+    return age >= settings.DASHBOARD_CACHE_TTL_SECONDS - settings.DASHBOARD_CACHE_REFRESH_AHEAD_SECONDS
+
+def _refresh_snapshot(db: Session, version: str) -> Dict[str, Any]:
+    """
+    대시보드 통계 계산 후 캐시에 저장 (저장 실패 시에도 계산 결과 반환)
+    """
+    data = compute_dashboard_stats(db)
+    snapshot = {"version": version, "computed_at": time.time(), "data": data}
+    try:
+        redis_client.set(
+            DASHBOARD_CACHE_KEY,
+            json.dumps(snapshot, ensure_ascii=False),
+            ex=settings.DASHBOARD_CACHE_TTL_SECONDS
+        )
+    except redis.RedisError as e:
+        logger.warning(f"대시보드 캐시 저장 실패: {e}")
+    return data
+
+def _refresh_in_background(lock: RedisLock, version: str) -> None:
+    """
+    만료 전 미리 재계산 (락은 호출자가 획득, 완료 후 해제)
+    """
+    def _run() -> None:
+        db = SessionLocal()
+        try:
+            _refresh_snapshot(db, version)
+        except Exception as e:
+            logger.error(f"대시보드 캐시 갱신 실패: {e}")
+        finally:
+            db.close()
+            lock.release()
+
+    threading.Thread(target=_run, name="dashboard-refresh", daemon=True).start()
+
+def get_cached_dashboard_stats(db: Session) -> Dict[str, Any]:
+    """
+    캐시된 대시보드 통계 조회
+
+    - 무효화되었거나 만료 DASHBOARD_CACHE_REFRESH_AHEAD_SECONDS초 전부터는 기존 캐시를 반환하면서
+      락을 얻은 하나의 요청만 백그라운드에서 재계산 (변경이 잦아도 조회가 계산을 기다리지 않음)
+    - 캐시가 없으면 락을 얻은 하나의 요청만 계산하고, 나머지는 계산이 끝나길 기다렸다가 방금 저장된 캐시를 사용
+    - Redis 장애 시에는 직접 계산
+    """
+    try:
+        snapshot, version = _read_snapshot()
+        lock = RedisLock(redis_client, DASHBOARD_LOCK_NAME, lease_ms=DASHBOARD_LOCK_LEASE_MS, auto_renew=False)
+
+        if snapshot is not None:
+            if _is_stale(snapshot, version) and lock.acquire():
+                _refresh_in_background(lock, version)
+            return snapshot["data"]
+
+        if lock.acquire():
+            try:
+                return _refresh_snapshot(db, version)
+            finally:
+                lock.release()
+
+        # 다른 요청이 계산 중: 완료를 기다렸다가 캐시 사용
+        if lock.wait_released(settings.DASHBOARD_CACHE_LOCK_WAIT_SECONDS, poll_interval=0.05):
+            snapshot, _ = _read_snapshot()
+            if snapshot is not None:
+                return snapshot["data"]
+    except (redis.RedisError, ValueError) as e:
+        logger.warning(f"대시보드 캐시 조회 실패, 직접 계산: {e}")
+
+    return compute_dashboard_stats(db)
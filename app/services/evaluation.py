@@ -1,24 +1,29 @@
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 import os
 import json
 import logging
 import openai
-import numpy as np
-from datetime import datetime
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-import openpyxl
+import redis
 
+from app.db.session import SessionLocal, redis_client
 from app.models.evaluation import Evaluation, CriteriaScore
 from app.models.interview import Interview, Answer
 from app.schemas.evaluation import EvaluationCreate, EvaluationUpdate, CriteriaScoreCreate
 from app.core.config import settings
 from app.services.interview import get_interview, get_answers_by_interview
+from app.services.lock import RedisLock
+from app.services.frame_metrics import load_frame_metrics, score_frame_metrics
+from app.services.audio_analysis import load_audio_features, analyze_interview_audio, score_volume
+from app.services.speech_metrics import get_interview_speech_metrics
+from app.services.report_renderer import render_reports, get_report_path
+from app.services.stats import increment_counters, evaluation_deltas, merge_deltas
+from app.services.dashboard_cache import invalidate_dashboard_cache
+from app.services.analytics import add_evaluation_to_rollup, refresh_evaluation_rollup
+from app.services.cohorts import record_evaluation_in_cohort, record_criteria_score_in_cohort, rebuild_cohort_month, cohort_month
+from app.services.scoring import get_active_scoring_weights, compute_scores, SCORING_VERSION_KEY
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,13 @@ def get_evaluation_by_interview(db: Session, interview_id: int) -> Optional[Eval
     """
     return db.query(Evaluation).filter(Evaluation.interview_id == interview_id).first()
 
+def get_committed_evaluation(db: Session, interview_id: int) -> Optional[Evaluation]:
+    """
+    현재 트랜잭션을 끝낸 뒤 면접 ID로 평가 조회 (다른 작업자가 커밋한 평가까지 보이도록, REPEATABLE READ 대응)
+    """
+    db.rollback()
+    return get_evaluation_by_interview(db, interview_id)
+
 def create_evaluation(db: Session, evaluation_in: EvaluationCreate) -> Evaluation:
     """
     새 평가 생성
@@ -46,11 +58,52 @@ def create_evaluation(db: Session, evaluation_in: EvaluationCreate) -> Evaluatio
         detailed_scores=evaluation_in.detailed_scores,
         feedback=evaluation_in.feedback
     )
-    db.add(db_evaluation)
-    db.commit()
+    try:
+        db.add(db_evaluation)
+        increment_counters(db, evaluation_deltas(db_evaluation.total_score))
+        add_evaluation_to_rollup(db, db_evaluation)
+        record_evaluation_in_cohort(db, db_evaluation)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    invalidate_dashboard_cache()
     db.refresh(db_evaluation)
     return db_evaluation
 
+def create_evaluation_with_scores(db: Session, evaluation_in: EvaluationCreate, criteria_scores: List[Dict[str, Any]]) -> Evaluation:
+    """
+    평가와 평가 기준별 점수를 하나의 트랜잭션으로 저장 (기준 점수는 일괄 INSERT)
+    """
+    try:
+        db_evaluation = Evaluation(
+            interview_id=evaluation_in.interview_id,
+            total_score=evaluation_in.total_score,
+            verbal_score=evaluation_in.verbal_score,
+            nonverbal_score=evaluation_in.nonverbal_score,
+            detailed_scores=evaluation_in.detailed_scores,
+            feedback=evaluation_in.feedback
+        )
+        db.add(db_evaluation)
+        db.flush()  # 평가 ID 확보 (커밋 없이)
+        
+        if criteria_scores:
+            db.execute(
+                insert(CriteriaScore),
+                [{**criteria_score, "evaluation_id": db_evaluation.id} for criteria_score in criteria_scores]
+            )
+        increment_counters(db, evaluation_deltas(db_evaluation.total_score))
+        add_evaluation_to_rollup(db, db_evaluation)
+        record_evaluation_in_cohort(db, db_evaluation, criteria_scores)
+        
+        db.commit()
+        invalidate_dashboard_cache()
+        db.refresh(db_evaluation)
+        return db_evaluation
+    except Exception:
+        db.rollback()
+        raise
+
 def update_evaluation(db: Session, evaluation_id: int, evaluation_in: EvaluationUpdate) -> Optional[Evaluation]:
     """
     평가 정보 업데이트
@@ -60,12 +113,19 @@ def update_evaluation(db: Session, evaluation_id: int, evaluation_in: Evaluation
         return None
     
     update_data = evaluation_in.dict(exclude_unset=True)
+    old_total_score = db_evaluation.total_score
     
     for field, value in update_data.items():
         setattr(db_evaluation, field, value)
     
     db.add(db_evaluation)
+    if db_evaluation.total_score != old_total_score:
+        increment_counters(db, merge_deltas(evaluation_deltas(old_total_score, -1), evaluation_deltas(db_evaluation.total_score)))
+        refresh_evaluation_rollup(db, db_evaluation)
+        rebuild_cohort_month(db, cohort_month(db_evaluation.created_at))
     db.commit()
+    if db_evaluation.total_score != old_total_score:
+        invalidate_dashboard_cache()
     db.refresh(db_evaluation)
     return db_evaluation
 
@@ -81,6 +141,7 @@ def create_criteria_score(db: Session, criteria_score_in: CriteriaScoreCreate) -
         comment=criteria_score_in.comment
     )
     db.add(db_criteria_score)
+    record_criteria_score_in_cohort(db, db_criteria_score)
     db.commit()
     db.refresh(db_criteria_score)
     return db_criteria_score
@@ -93,7 +154,7 @@ def get_criteria_scores_by_evaluation(db: Session, evaluation_id: int) -> List[C
 
 def evaluate_interview(db: Session, interview_id: int) -> Optional[Evaluation]:
     """
-    면접 평가 수행
+    면접 평가 수행 (면접별 분산 락으로 중복 평가 방지)
     """
     try:
         # 면접 정보 조회
@@ -108,66 +169,210 @@ def evaluate_interview(db: Session, interview_id: int) -> Optional[Evaluation]:
             logger.info(f"면접 ID {interview_id}에 대한 평가가 이미 존재합니다.")
             return existing_evaluation
         
-        # 답변 목록 조회
-        answers = get_answers_by_interview(db, interview_id)
-        
-        # 언어적 평가 (OpenAI API 사용)
-        verbal_scores, verbal_feedback = evaluate_verbal_aspects(interview, answers)
-        
-        # 비언어적 평가 (가상 데이터 - 실제로는 Computer Vision 분석 결과 사용)
-        nonverbal_scores, nonverbal_feedback = evaluate_nonverbal_aspects(interview_id)
-        
-        # 종합 점수 계산
-        detailed_scores = {
-            "verbal": verbal_scores,
-            "nonverbal": nonverbal_scores
-        }
-        
-        verbal_avg = np.mean(list(verbal_scores.values()))
-        nonverbal_avg = np.mean(list(nonverbal_scores.values()))
-        
-        # 총점 계산 (100점 만점, 언어적 60%, 비언어적 40%)
-        total_score = (verbal_avg * 0.6 + nonverbal_avg * 0.4) * 20  # 5점 만점을 100점 만점으로 변환
-        
-        # 종합 피드백
-        feedback = f"{verbal_feedback}\n\n{nonverbal_feedback}"
-        
-        # 평가 생성
-        evaluation_data = EvaluationCreate(
-            interview_id=interview_id,
-            total_score=total_score,
-            verbal_score=verbal_avg * 20,  # 5점 만점을 100점 만점으로 변환
-            nonverbal_score=nonverbal_avg * 20,  # 5점 만점을 100점 만점으로 변환
-            detailed_scores=detailed_scores,
-            feedback=feedback
-        )
-        
-        evaluation = create_evaluation(db, evaluation_data)
-        
-        # 평가 기준별 점수 저장
-        for category, scores in detailed_scores.items():
-            for criteria, score in scores.items():
-                criteria_score_data = CriteriaScoreCreate(
-                    evaluation_id=evaluation.id,
-                    category=category,
-                    criteria=criteria,
-                    score=score,
-                    comment=f"{criteria.capitalize()} 점수: {score}/5"
-                )
-                create_criteria_score(db, criteria_score_data)
-        
-        # PDF 리포트 생성
-        pdf_path = generate_evaluation_report(db, evaluation.id)
-        if pdf_path:
-            # PDF 경로 업데이트
-            evaluation_update = EvaluationUpdate(pdf_report_path=pdf_path)
-            evaluation = update_evaluation(db, evaluation.id, evaluation_update)
-        
-        return evaluation
+        lock = RedisLock(redis_client, f"lock:evaluation:{interview_id}", lease_ms=settings.EVALUATION_LOCK_LEASE_MS)
+        try:
+            acquired = lock.acquire()
+        except redis.RedisError as e:
+            logger.warning(f"평가 락 획득 실패, 락 없이 평가를 진행합니다: {e}")
+            return _run_evaluation_pipeline(db, interview, None)
+        
+        if not acquired:
+            # 다른 작업자가 평가 중이면 새로 평가하지 않고 그 결과를 기다림
+            logger.info(f"면접 ID {interview_id}에 대한 평가가 진행 중입니다. 결과를 기다립니다.")
+            if not lock.wait_released(timeout=settings.EVALUATION_LOCK_WAIT_SECONDS):
+                logger.error(f"면접 ID {interview_id}에 대한 진행 중인 평가 대기 시간이 초과되었습니다.")
+                return None
+            return get_committed_evaluation(db, interview_id)
+        
+        try:
+            # 락 획득 전에 다른 작업자가 평가를 끝냈을 수 있으므로 새 트랜잭션에서 다시 확인
+            existing_evaluation = get_committed_evaluation(db, interview_id)
+            if existing_evaluation:
+                return existing_evaluation
+            
+            return _run_evaluation_pipeline(db, interview, lock)
+        finally:
+            lock.release()
     except Exception as e:
         logger.error(f"면접 평가 실패: {e}")
         return None
 
+def _run_evaluation_pipeline(db: Session, interview: Interview, lock: Optional[RedisLock]) -> Optional[Evaluation]:
+    """
+    언어적/비언어적 평가 후 결과 저장
+    """
+    interview_id = interview.id
+    
+    # 답변 목록 조회
+    answers = get_answers_by_interview(db, interview_id)
+    
+    # 언어적 평가 (OpenAI API 사용)
+    verbal_scores, verbal_feedback = evaluate_verbal_aspects(interview, answers)
+    
+    # 비언어적 평가 (프레임 분석 시계열 및 음성 특징 사용)
+    nonverbal_scores, nonverbal_feedback = run_nonverbal_evaluation(db, interview_id)
+    
+    return save_evaluation_result(
+        db, interview_id,
+        verbal_scores, verbal_feedback,
+        nonverbal_scores, nonverbal_feedback,
+        lock
+    )
+
+def run_nonverbal_evaluation(db: Session, interview_id: int) -> tuple:
+    """
+    비언어적 평가 (음성 특징이 아직 추출되지 않았으면 먼저 추출, 일반/스트리밍 평가 공용)
+    """
+    if load_audio_features(interview_id) is None:
+        analyze_interview_audio(db, interview_id)
+    return evaluate_nonverbal_aspects(interview_id)
+
+def save_evaluation_result(
+    db: Session,
+    interview_id: int,
+    verbal_scores: Dict[str, float],
+    verbal_feedback: str,
+    nonverbal_scores: Dict[str, float],
+    nonverbal_feedback: str,
+    lock: Optional[RedisLock] = None
+) -> Optional[Evaluation]:
+    """
+    종합 점수 계산 후 평가 저장 (저장 직전 펜싱 토큰 확인)
+    """
+    # 종합 점수 계산
+    detailed_scores = {
+        "verbal": verbal_scores,
+        "nonverbal": nonverbal_scores
+    }
+    
+    # 발화 지표 (STT 청크 저장 시 누적된 통계, 점수에는 반영하지 않음)
+    try:
+        detailed_scores["speech_metrics"] = get_interview_speech_metrics(redis_client, interview_id)
+    except redis.RedisError as e:
+        logger.warning(f"면접 ID {interview_id}에 대한 발화 지표 조회 실패: {e}")
+    
+    # 총점 계산 (100점 만점, 활성 가중치 버전 적용, 재채점 시 같은 계산식 사용)
+    # 커밋까지 활성 가중치를 공유 잠금: 저장 도중 새 버전이 활성화되어 재채점에서 누락되는 것을 방지
+    weights = get_active_scoring_weights(db, lock=True)
+    scores = compute_scores(detailed_scores, weights)
+    detailed_scores[SCORING_VERSION_KEY] = weights.version
+    
+    # 종합 피드백
+    feedback = f"{verbal_feedback}\n\n{nonverbal_feedback}"
+    
+    # 평가 생성
+    evaluation_data = EvaluationCreate(
+        interview_id=interview_id,
+        total_score=scores["total_score"],
+        verbal_score=scores["verbal_score"],
+        nonverbal_score=scores["nonverbal_score"],
+        detailed_scores=detailed_scores,
+        feedback=feedback
+    )
+    
+    # 평가 기준별 점수
+    criteria_scores = [
+        {
+            "category": category,
+            "criteria": criteria,
+            "score": float(score),
+            "comment": f"{criteria.capitalize()} 점수: {score}/5"
+        }
+        for category in ("verbal", "nonverbal")
+        for criteria, score in detailed_scores[category].items()
+    ]
+    
+    # 펜싱 토큰 확인: 임대가 만료되어 다른 작업자가 락을 가져갔다면 저장하지 않음 (불필요한 쓰기를 줄이는 조기 확인)
+    if lock is not None and not lock.is_held():
+        logger.error(f"면접 ID {interview_id}에 대한 평가 락을 잃어 결과를 저장하지 않습니다 (토큰 {lock.token}).")
+        return get_committed_evaluation(db, interview_id)
+    
+    # 평가 및 기준별 점수 저장 (단일 트랜잭션, PDF 리포트는 이후 비동기로 생성)
+    # 확인 후 커밋 사이의 경쟁은 interview_id 유일 제약으로 차단: 늦게 커밋한 쪽은 먼저 저장된 평가를 반환
+    try:
+        return create_evaluation_with_scores(db, evaluation_data, criteria_scores)
+    except IntegrityError:
+        logger.warning(f"면접 ID {interview_id}에 대한 평가가 다른 작업자에 의해 먼저 저장되었습니다.")
+        return get_evaluation_by_interview(db, interview_id)
+
+VERBAL_SYSTEM_PROMPT = "당신은 전문 면접 평가자입니다. 지원자의 답변을 객관적으로 평가합니다."
+
+def build_verbal_prompt(interview: Interview, answers: List[Answer]) -> str:
+    """
+    언어적 측면 평가 요청 프롬프트 작성
+    """
+    # 답변 내용 정리
+    answer_contents = {}
+    for answer in answers:
+        answer_contents[answer.question_index] = answer.content
+    
+    # 질문 목록
+    questions = interview.questions if interview.questions else []
+    
+    # 평가 요청 프롬프트 작성
+    prompt = f"""
+    다음은 면접 질문과 지원자 {interview.candidate_name}의 답변입니다:
+    
+    """
+    
+    for q in questions:
+        q_idx = q.get("index", 0)
+        q_content = q.get("content", "")
+        a_content = answer_contents.get(q_idx, "")
+        prompt += f"질문 {q_idx+1}: {q_content}\n답변: {a_content}\n\n"
+    
+    prompt += f"""
+    위 답변을 바탕으로 다음 기준에 따라 1-5점 척도로 평가해주세요:
+    1. 명확성(clarity): 답변이 명확하고 이해하기 쉬운가?
+    2. 관련성(relevance): 답변이 질문과 관련이 있는가?
+    3. 깊이(depth): 답변이 충분한 깊이와 통찰력을 보여주는가?
+    4. 간결성(conciseness): 답변이 간결하고 핵심을 잘 전달하는가?
+    5. 자신감(confidence): 답변에서 자신감이 느껴지는가?
+    
+    JSON 형식으로 다음과 같이 응답해주세요:
+    {{
+      "clarity": 점수,
+      "relevance": 점수,
+      "depth": 점수,
+      "conciseness": 점수,
+      "confidence": 점수,
+      "feedback": "종합적인 피드백"
+    }}
+    """
+    return prompt
+
+def parse_verbal_result(content: str) -> tuple:
+    """
+    GPT 응답에서 언어적 평가 점수 및 피드백 추출
+    """
+    # JSON 부분만 추출하는 로직
+    json_str = content.strip()
+    if not json_str.startswith("{"):
+        # JSON 시작 부분 찾기
+        start_idx = json_str.find("{")
+        if start_idx != -1:
+            json_str = json_str[start_idx:]
+            # JSON 끝 부분 찾기
+            end_idx = json_str.rfind("}")
+            if end_idx != -1:
+                json_str = json_str[:end_idx+1]
+        else:
+            raise ValueError("응답에서 JSON 형식을 찾을 수 없습니다.")
+    
+    result = json.loads(json_str)
+    
+    scores = {
+        "clarity": result.get("clarity", 3),
+        "relevance": result.get("relevance", 3),
+        "depth": result.get("depth", 3),
+        "conciseness": result.get("conciseness", 3),
+        "confidence": result.get("confidence", 3)
+    }
+    
+    feedback = result.get("feedback", "언어적 측면에 대한 평가 피드백이 없습니다.")
+    
+    return scores, feedback
+
 def evaluate_verbal_aspects(interview: Interview, answers: List[Answer]) -> tuple:
     """
     언어적 측면 평가 (OpenAI API 사용)
@@ -175,49 +380,12 @@ def evaluate_verbal_aspects(interview: Interview, answers: List[Answer]) -> tupl
     try:
         openai.api_key = settings.OPENAI_API_KEY
         
-        # 답변 내용 정리
-        answer_contents = {}
-        for answer in answers:
-            answer_contents[answer.question_index] = answer.content
-        
-        # 질문 목록
-        questions = interview.questions if interview.questions else []
-        
-        # 평가 요청 프롬프트 작성
-        prompt = f"""
-        다음은 면접 질문과 지원자 {interview.candidate_name}의 답변입니다:
-        
-        """
-        
-        for q in questions:
-            q_idx = q.get("index", 0)
-            q_content = q.get("content", "")
-            a_content = answer_contents.get(q_idx, "")
-            prompt += f"질문 {q_idx+1}: {q_content}\n답변: {a_content}\n\n"
-        
-        prompt += f"""
-        위 답변을 바탕으로 다음 기준에 따라 1-5점 척도로 평가해주세요:
-        1. 명확성(clarity): 답변이 명확하고 이해하기 쉬운가?
-        2. 관련성(relevance): 답변이 질문과 관련이 있는가?
-        3. 깊이(depth): 답변이 충분한 깊이와 통찰력을 보여주는가?
-        4. 간결성(conciseness): 답변이 간결하고 핵심을 잘 전달하는가?
-        5. 자신감(confidence): 답변에서 자신감이 느껴지는가?
-        
-        JSON 형식으로 다음과 같이 응답해주세요:
-        {{
-          "clarity": 점수,
-          "relevance": 점수,
-          "depth": 점수,
-          "conciseness": 점수,
-          "confidence": 점수,
-          "feedback": "종합적인 피드백"
-        }}
-        """
+        prompt = build_verbal_prompt(interview, answers)
         
         response = openai.ChatCompletion.create(
             model="gpt-4",
             messages=[
-                {"role": "system", "content": "당신은 전문 면접 평가자입니다. 지원자의 답변을 객관적으로 평가합니다."},
+                {"role": "system", "content": VERBAL_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
@@ -225,33 +393,7 @@ def evaluate_verbal_aspects(interview: Interview, answers: List[Answer]) -> tupl
         
         # 응답에서 JSON 부분 추출
         content = response.choices[0].message.content
-        # JSON 부분만 추출하는 로직
-        json_str = content.strip()
-        if not json_str.startswith("{"):
-            # JSON 시작 부분 찾기
-            start_idx = json_str.find("{")
-            if start_idx != -1:
-                json_str = json_str[start_idx:]
-                # JSON 끝 부분 찾기
-                end_idx = json_str.rfind("}")
-                if end_idx != -1:
-                    json_str = json_str[:end_idx+1]
-            else:
-                raise ValueError("응답에서 JSON 형식을 찾을 수 없습니다.")
-        
-        result = json.loads(json_str)
-        
-        scores = {
-            "clarity": result.get("clarity", 3),
-            "relevance": result.get("relevance", 3),
-            "depth": result.get("depth", 3),
-            "conciseness": result.get("conciseness", 3),
-            "confidence": result.get("confidence", 3)
-        }
-        
-        feedback = result.get("feedback", "언어적 측면에 대한 평가 피드백이 없습니다.")
-        
-        return scores, feedback
+        return parse_verbal_result(content)
     except Exception as e:
         logger.error(f"언어적 측면 평가 실패: {e}")
         # 기본 점수 및 피드백 반환
@@ -267,23 +409,30 @@ def evaluate_verbal_aspects(interview: Interview, answers: List[Answer]) -> tupl
 
 def evaluate_nonverbal_aspects(interview_id: int) -> tuple:
     """
-    비언어적 측면 평가 (가상 데이터 - 실제로는 Computer Vision 분석 결과 사용)
+    비언어적 측면 평가 (저장된 프레임 분석 시계열 및 음성 특징 기반)
     """
     try:
-        # 실제 구현에서는 mediapipe 또는 openCV를 사용한 분석 결과를 사용
-        # 현재는 가상 데이터 생성
-        
-        # 랜덤 점수 생성 (3~5점 사이)
-        np.random.seed(interview_id)  # 동일한 면접 ID에 대해 일관된 결과 생성
-        
+        series = load_frame_metrics(interview_id)
+        if len(series) == 0:
+            logger.warning(f"면접 ID {interview_id}에 대한 프레임 분석 데이터가 없어 기본 점수가 적용됩니다.")
+        audio_features = load_audio_features(interview_id)
+        volume = score_volume(audio_features) if audio_features else None
+        if volume is None:
+            logger.warning(f"면접 ID {interview_id}에 대한 음성 분석 데이터가 없어 성량은 기본 점수가 적용됩니다.")
+        
+        # 기본 점수 (측정 데이터가 없는 항목)
         scores = {
-            "volume": round(np.random.uniform(3, 5), 1),
-            "posture": round(np.random.uniform(3, 5), 1),
-            "attire": round(np.random.uniform(3, 5), 1),
-            "facial_expression": round(np.random.uniform(3, 5), 1),
-            "eye_contact": round(np.random.uniform(3, 5), 1),
-            "gestures": round(np.random.uniform(3, 5), 1)
+            "volume": 3.0,
+            "posture": 3.0,
+            "attire": 3.0,
+            "facial_expression": 3.0,
+            "eye_contact": 3.0,
+            "gestures": 3.0
         }
+        if len(series):
+            scores.update(score_frame_metrics(series))
+        if volume is not None:
+            scores["volume"] = volume
         
         # 피드백 생성
         feedback_items = []
@@ -335,173 +484,79 @@ def evaluate_nonverbal_aspects(interview_id: int) -> tuple:
         default_feedback = "비언어적 측면 평가 중 오류가 발생했습니다. 기본 점수가 적용됩니다."
         return default_scores, default_feedback
 
-def generate_evaluation_report(db: Session, evaluation_id: int) -> Optional[str]:
+def build_report_snapshot(db: Session, evaluation_id: int) -> Optional[Dict[str, Any]]:
     """
-    평가 결과 PDF 리포트 생성
+    리포트 렌더링용 평가 데이터 스냅샷 (ORM 객체 대신 프로세스 간 전달 가능한 dict)
     """
-    try:
-        # 평가 정보 조회
+    # 평가 정보 조회
+    evaluation = get_evaluation(db, evaluation_id)
+    if not evaluation:
+        logger.error(f"평가 ID {evaluation_id}에 대한 리포트 생성 실패: 평가가 존재하지 않습니다.")
+        return None
+    
+    # 면접 정보 조회
+    interview = get_interview(db, evaluation.interview_id)
+    if not interview:
+        logger.error(f"면접 ID {evaluation.interview_id}에 대한 리포트 생성 실패: 면접이 존재하지 않습니다.")
+        return None
+    
+    detailed_scores = evaluation.detailed_scores or {}
+    return {
+        "evaluation_id": evaluation.id,
+        "candidate_name": interview.candidate_name,
+        "interview_time": interview.start_time.strftime('%Y-%m-%d %H:%M') if interview.start_time else None,
+        "total_score": evaluation.total_score,
+        "verbal_score": evaluation.verbal_score,
+        "nonverbal_score": evaluation.nonverbal_score,
+        "verbal": detailed_scores.get("verbal", {}),
+        "nonverbal": detailed_scores.get("nonverbal", {}),
+        "feedback": evaluation.feedback or "",
+    }
+
+def store_evaluation_reports(db: Session, snapshots: List[Dict[str, Any]]) -> Dict[int, Optional[str]]:
+    """
+    스냅샷별 리포트 생성 (내용이 같은 리포트가 있으면 재사용) 후 바뀐 PDF 경로만 저장
+    """
+    pdf_paths = dict(zip((snapshot["evaluation_id"] for snapshot in snapshots), render_reports(snapshots)))
+    
+    for evaluation_id, pdf_path in pdf_paths.items():
         evaluation = get_evaluation(db, evaluation_id)
-        if not evaluation:
-            logger.error(f"평가 ID {evaluation_id}에 대한 리포트 생성 실패: 평가가 존재하지 않습니다.")
-            return None
-        
-        # 면접 정보 조회
-        interview = get_interview(db, evaluation.interview_id)
-        if not interview:
-            logger.error(f"면접 ID {evaluation.interview_id}에 대한 리포트 생성 실패: 면접이 존재하지 않습니다.")
-            return None
-        
-        # 평가 기준 점수 목록 조회
-        criteria_scores = get_criteria_scores_by_evaluation(db, evaluation_id)
-        
-        # PDF 파일 경로 설정
-        os.makedirs(os.path.join(settings.MEDIA_STORAGE_PATH, "reports"), exist_ok=True)
-        pdf_filename = f"evaluation_{evaluation_id}_{interview.candidate_name.replace(' ', '_')}.pdf"
-        pdf_path = os.path.join(settings.MEDIA_STORAGE_PATH, "reports", pdf_filename)
-        
-        # PDF 생성
-        doc = SimpleDocTemplate(pdf_path, pagesize=letter)
-        styles = getSampleStyleSheet()
-        elements = []
-        
-        # 제목
-        title_style = ParagraphStyle(
-            'Title',
-            parent=styles['Title'],
-            fontSize=16,
-            spaceAfter=12
-        )
-        elements.append(Paragraph(f"SK AXIS 면접 평가 리포트", title_style))
-        elements.append(Spacer(1, 0.25 * inch))
-        
-        # 기본 정보
-        elements.append(Paragraph(f"지원자: {interview.candidate_name}", styles["Normal"]))
-        elements.append(Paragraph(f"면접 일시: {interview.start_time.strftime('%Y-%m-%d %H:%M')}", styles["Normal"]))
-        elements.append(Paragraph(f"총점: {evaluation.total_score:.1f}/100", styles["Normal"]))
-        elements.append(Spacer(1, 0.25 * inch))
-        
-        # 평가 결과 테이블
-        data = [["평가 영역", "점수 (5점 만점)"]]
-        
-        # 언어적 측면
-        data.append(["언어적 측면", f"{evaluation.verbal_score/20:.1f}"])
-        verbal_scores = evaluation.detailed_scores.get("verbal", {})
-        for criteria, score in verbal_scores.items():
-            data.append([f"  - {criteria.capitalize()}", f"{score:.1f}"])
-        
-        # 비언어적 측면
-        data.append(["비언어적 측면", f"{evaluation.nonverbal_score/20:.1f}"])
-        nonverbal_scores = evaluation.detailed_scores.get("nonverbal", {})
-        for criteria, score in nonverbal_scores.items():
-            data.append([f"  - {criteria.capitalize()}", f"{score:.1f}"])
-        
-        table = Table(data, colWidths=[4*inch, 1*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (1, 0), 12),
-            ('BACKGROUND', (0, 1), (1, 1), colors.lightblue),
-            ('BACKGROUND', (0, len(verbal_scores)+2), (1, len(verbal_scores)+2), colors.lightblue),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        elements.append(table)
-        elements.append(Spacer(1, 0.25 * inch))
-        
-        # 피드백
-        elements.append(Paragraph("종합 피드백:", styles["Heading2"]))
-        feedback_paragraphs = evaluation.feedback.split("\n")
-        for p in feedback_paragraphs:
-            if p.strip():
-                elements.append(Paragraph(p, styles["Normal"]))
-                elements.append(Spacer(1, 0.1 * inch))
-        
-        # PDF 생성
-        doc.build(elements)
-        
-        return f"reports/{pdf_filename}"
-    except Exception as e:
-        logger.error(f"평가 리포트 생성 실패: {e}")
+        if pdf_path and evaluation and evaluation.pdf_report_path != pdf_path:
+            update_evaluation(db, evaluation_id, EvaluationUpdate(pdf_report_path=pdf_path))
+    
+    return pdf_paths
+
+def ensure_evaluation_report(db: Session, evaluation_id: int, snapshot: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    현재 평가 데이터에 맞는 리포트 경로 (없거나 데이터가 바뀌었으면 생성)
+    """
+    snapshot = snapshot or build_report_snapshot(db, evaluation_id)
+    if not snapshot:
         return None
+    
+    pdf_path = os.path.join(settings.MEDIA_STORAGE_PATH, get_report_path(snapshot))
+    if os.path.exists(pdf_path):
+        return pdf_path
+    
+    relative_path = store_evaluation_reports(db, [snapshot]).get(evaluation_id)
+    return os.path.join(settings.MEDIA_STORAGE_PATH, relative_path) if relative_path else None
 
-def generate_excel_report(db: Session) -> Optional[str]:
+def generate_and_store_evaluation_reports(evaluation_ids: List[int]) -> Dict[int, Optional[str]]:
     """
-    모든 면접 평가 결과를 포함한 Excel 리포트 생성
+    여러 평가 리포트를 병렬 생성 후 PDF 경로 저장 (백그라운드 작업용, 자체 DB 세션 사용)
     """
+    db = SessionLocal()
     try:
-        # 모든 면접 정보 조회
-        interviews = db.query(Interview).all()
-        
-        # Excel 파일 경로 설정
-        os.makedirs(os.path.join(settings.MEDIA_STORAGE_PATH, "reports"), exist_ok=True)
-        excel_filename = f"interview_evaluations_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
-        excel_path = os.path.join(settings.MEDIA_STORAGE_PATH, "reports", excel_filename)
-        
-        # Excel 워크북 생성
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "면접 평가 결과"
-        
-        # 헤더 설정
-        headers = [
-            "면접 ID", "지원자 이름", "면접 일시", "총점", 
-            "언어적 점수", "비언어적 점수",
-            "명확성", "관련성", "깊이", "간결성", "자신감",
-            "성량", "자세", "복장", "표정", "시선처리", "제스처",
-            "피드백"
-        ]
-        ws.append(headers)
-        
-        # 데이터 추가
-        for interview in interviews:
-            # 평가 정보 조회
-            evaluation = get_evaluation_by_interview(db, interview.id)
-            if not evaluation:
-                continue
-            
-            # 세부 점수 추출
-            verbal_scores = evaluation.detailed_scores.get("verbal", {})
-            nonverbal_scores = evaluation.detailed_scores.get("nonverbal", {})
-            
-            row = [
-                interview.id,
-                interview.candidate_name,
-                interview.start_time.strftime("%Y-%m-%d %H:%M") if interview.start_time else "",
-                f"{evaluation.total_score:.1f}",
-                f"{evaluation.verbal_score:.1f}",
-                f"{evaluation.nonverbal_score:.1f}",
-                f"{verbal_scores.get('clarity', 0):.1f}",
-                f"{verbal_scores.get('relevance', 0):.1f}",
-                f"{verbal_scores.get('depth', 0):.1f}",
-                f"{verbal_scores.get('conciseness', 0):.1f}",
-                f"{verbal_scores.get('confidence', 0):.1f}",
-                f"{nonverbal_scores.get('volume', 0):.1f}",
-                f"{nonverbal_scores.get('posture', 0):.1f}",
-                f"{nonverbal_scores.get('attire', 0):.1f}",
-                f"{nonverbal_scores.get('facial_expression', 0):.1f}",
-                f"{nonverbal_scores.get('eye_contact', 0):.1f}",
-                f"{nonverbal_scores.get('gestures', 0):.1f}",
-                evaluation.feedback[:1000] if evaluation.feedback else ""  # 피드백 길이 제한
-            ]
-            ws.append(row)
-        
-        # 열 너비 조정
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            adjusted_width = (max_length + 2) * 1.2
-            ws.column_dimensions[column].width = adjusted_width
-        
-        # Excel 파일 저장
-        wb.save(excel_path)
-        
-        return f"reports/{excel_filename}"
+        snapshots = [snapshot for snapshot in (build_report_snapshot(db, evaluation_id) for evaluation_id in evaluation_ids) if snapshot]
+        return store_evaluation_reports(db, snapshots)
     except Exception as e:
-        logger.error(f"Excel 리포트 생성 실패: {e}")
-        return None
+        logger.error(f"평가 리포트 일괄 저장 실패: {e}")
+        return {}
+    finally:
+        db.close()
+
+def generate_and_store_evaluation_report(evaluation_id: int) -> Optional[str]:
+    """
+    평가 리포트 생성 후 PDF 경로 저장 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    return generate_and_store_evaluation_reports([evaluation_id]).get(evaluation_id)
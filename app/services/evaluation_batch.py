@@ -0,0 +1,241 @@
+from typing import Optional, List, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import threading
+import json
+import logging
+import redis
+
+from app.db.session import SessionLocal, redis_client
+from app.models.evaluation import Evaluation, EvaluationBatch, EvaluationBatchItem
+from app.models.interview import Interview
+from app.schemas.evaluation import EvaluationBatchCreate
+from app.core.config import settings
+from app.services.evaluation import evaluate_interview, generate_and_store_evaluation_report
+from app.services.lock import RedisLock
+
+logger = logging.getLogger(__name__)
+
+def get_evaluation_batch(db: Session, batch_id: int) -> Optional[EvaluationBatch]:
+    """
+    ID로 일괄 평가 조회
+    """
+    return db.query(EvaluationBatch).filter(EvaluationBatch.id == batch_id).first()
+
+def select_batch_interview_ids(db: Session, batch_in: EvaluationBatchCreate) -> List[int]:
+    """
+    일괄 평가 대상 면접 ID 목록 선정 (완료된 면접만 대상)
+    """
+    query = db.query(Interview.id).filter(Interview.status == "completed")
+
+    if batch_in.interview_ids is not None:
+        query = query.filter(Interview.id.in_(batch_in.interview_ids))
+    if batch_in.interviewer_id is not None:
+        query = query.filter(Interview.interviewer_id == batch_in.interviewer_id)
+    if batch_in.start_date is not None:
+        query = query.filter(Interview.start_time >= batch_in.start_date)
+    if batch_in.end_date is not None:
+        query = query.filter(Interview.start_time < batch_in.end_date)
+    if batch_in.only_unevaluated:
+        evaluated = db.query(Evaluation.interview_id)
+        query = query.filter(~Interview.id.in_(evaluated))
+
+    return [row[0] for row in query.order_by(Interview.id).all()]
+
+def create_evaluation_batch(db: Session, batch_in: EvaluationBatchCreate, interview_ids: List[int]) -> EvaluationBatch:
+    """
+    새 일괄 평가 생성 (select_batch_interview_ids로 선정한 대상 면접별 항목 포함)
+    """
+    concurrency = min(
+        batch_in.concurrency or settings.EVALUATION_BATCH_CONCURRENCY,
+        settings.EVALUATION_BATCH_MAX_CONCURRENCY
+    )
+
+    db_batch = EvaluationBatch(
+        status="pending",
+        concurrency=concurrency,
+        filters=json.loads(batch_in.json(exclude={"concurrency"}, exclude_none=True)),
+        total_count=len(interview_ids)
+    )
+    db_batch.items = [
+        EvaluationBatchItem(interview_id=interview_id, status="pending")
+        for interview_id in interview_ids
+    ]
+    db.add(db_batch)
+    db.commit()
+    db.refresh(db_batch)
+    return db_batch
+
+def get_evaluation_batch_status(db: Session, batch_id: int, include_items: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    일괄 평가 진행 상황 및 부분 결과 조회
+    """
+    db_batch = get_evaluation_batch(db, batch_id)
+    if not db_batch:
+        return None
+
+    # 항목 상태별 집계
+    counts = dict(
+        db.query(EvaluationBatchItem.status, func.count(EvaluationBatchItem.id))
+        .filter(EvaluationBatchItem.batch_id == batch_id)
+        .group_by(EvaluationBatchItem.status)
+        .all()
+    )
+
+    items = []
+    if include_items:
+        items = (
+            db.query(EvaluationBatchItem)
+            .filter(EvaluationBatchItem.batch_id == batch_id)
+            .order_by(EvaluationBatchItem.id)
+            .all()
+        )
+
+    return {
+        "batch_id": db_batch.id,
+        "status": db_batch.status,
+        "concurrency": db_batch.concurrency,
+        "total": db_batch.total_count,
+        "pending": counts.get("pending", 0),
+        "running": counts.get("running", 0),
+        "completed": counts.get("completed", 0),
+        "failed": counts.get("failed", 0),
+        "created_at": db_batch.created_at,
+        "finished_at": db_batch.finished_at,
+        "items": items
+    }
+
+def _update_batch_item(db: Session, item_id: int, **fields: Any) -> None:
+    """
+    일괄 평가 항목 상태 갱신
+    """
+    db.query(EvaluationBatchItem).filter(EvaluationBatchItem.id == item_id).update(fields)
+    db.commit()
+
+def _evaluate_batch_item(item_id: int, interview_id: int) -> None:
+    """
+    일괄 평가 항목 1건 처리 (워커 스레드에서 실행, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        _update_batch_item(db, item_id, status="running", started_at=datetime.now())
+
+        evaluation = evaluate_interview(db, interview_id)
+        if evaluation:
+            _update_batch_item(
+                db, item_id,
+                status="completed",
+                evaluation_id=evaluation.id,
+                total_score=evaluation.total_score,
+                finished_at=datetime.now()
+            )
+            
+            # PDF 리포트는 평가 저장 이후 별도로 생성
+            if not evaluation.pdf_report_path:
+                generate_and_store_evaluation_report(evaluation.id)
+        else:
+            _update_batch_item(
+                db, item_id,
+                status="failed",
+                error="면접 평가 중 오류가 발생했습니다",
+                finished_at=datetime.now()
+            )
+    except Exception as e:
+        logger.error(f"일괄 평가 항목 {item_id} 처리 실패: {e}")
+        db.rollback()
+        try:
+            _update_batch_item(db, item_id, status="failed", error=str(e), finished_at=datetime.now())
+        except Exception as update_error:
+            logger.error(f"일괄 평가 항목 {item_id} 상태 저장 실패: {update_error}")
+    finally:
+        db.close()
+
+def run_evaluation_batch(batch_id: int) -> None:
+    """
+    일괄 평가 실행 (워커 풀에서 대기 중인 항목을 동시 처리, 여러 서버 중 하나만 실행)
+    """
+    lock = RedisLock(redis_client, f"lock:evaluation_batch:{batch_id}")
+    try:
+        if not lock.acquire():
+            logger.info(f"일괄 평가 ID {batch_id}는 다른 작업자가 실행 중입니다.")
+            return
+    except redis.RedisError as e:
+        # 면접별 평가 락이 중복 평가를 막으므로 락 없이 진행
+        logger.warning(f"일괄 평가 ID {batch_id} 락 획득 실패, 락 없이 진행: {e}")
+        lock = None
+
+    db = SessionLocal()
+    try:
+        db_batch = get_evaluation_batch(db, batch_id)
+        if not db_batch:
+            logger.error(f"일괄 평가 ID {batch_id} 실행 실패: 일괄 평가가 존재하지 않습니다.")
+            return
+
+        # 중단된 항목(running)도 다시 처리
+        pending_items = (
+            db.query(EvaluationBatchItem.id, EvaluationBatchItem.interview_id)
+            .filter(
+                EvaluationBatchItem.batch_id == batch_id,
+                EvaluationBatchItem.status.in_(["pending", "running"])
+            )
+            .order_by(EvaluationBatchItem.id)
+            .all()
+        )
+        concurrency = db_batch.concurrency
+
+        db_batch.status = "running"
+        db.commit()
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"eval-batch-{batch_id}") as executor:
+            for item_id, interview_id in pending_items:
+                executor.submit(_evaluate_batch_item, item_id, interview_id)
+
+        db_batch = get_evaluation_batch(db, batch_id)
+        db_batch.status = "completed"
+        db_batch.finished_at = datetime.now()
+        db.commit()
+        logger.info(f"일괄 평가 ID {batch_id} 완료 ({len(pending_items)}건 처리)")
+    except Exception as e:
+        logger.error(f"일괄 평가 실행 실패: {e}")
+    finally:
+        db.close()
+        if lock is not None:
+            lock.release()
+
+def start_evaluation_batch(batch_id: int) -> None:
+    """
+    일괄 평가를 백그라운드 스레드에서 시작 (요청 처리와 분리)
+    """
+    thread = threading.Thread(
+        target=run_evaluation_batch,
+        args=(batch_id,),
+        name=f"eval-batch-{batch_id}",
+        daemon=True
+    )
+    thread.start()
+
+def resume_evaluation_batches() -> int:
+    """
+    서버 재시작 등으로 중단된 일괄 평가(pending, running) 재개, 재개한 일괄 평가 수 반환
+    """
+    db = SessionLocal()
+    try:
+        batch_ids = [
+            batch_id for batch_id, in
+            db.query(EvaluationBatch.id)
+            .filter(EvaluationBatch.status.in_(["pending", "running"]))
+            .order_by(EvaluationBatch.id)
+        ]
+    except Exception as e:
+        logger.error(f"중단된 일괄 평가 조회 실패: {e}")
+        return 0
+    finally:
+        db.close()
+
+    for batch_id in batch_ids:
+        start_evaluation_batch(batch_id)
+    if batch_ids:
+        logger.info(f"중단된 일괄 평가 재개: {batch_ids}")
+    return len(batch_ids)
@@ -0,0 +1,252 @@
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+import re
+import json
+import logging
+from openai import OpenAI
+import redis
+
+from app.db.session import SessionLocal, redis_client
+from app.core.config import settings
+from app.models.evaluation import Evaluation
+from app.services.interview import get_interview, get_answers_by_interview
+from app.services.lock import RedisLock
+from app.services.evaluation import (
+    get_evaluation_by_interview, get_committed_evaluation, build_verbal_prompt, parse_verbal_result,
+    run_nonverbal_evaluation, save_evaluation_result, VERBAL_SYSTEM_PROMPT
+)
+
+logger = logging.getLogger(__name__)
+
+VERBAL_CRITERIA = settings.EVALUATION_CRITERIA["verbal"]
+
+_SCORE_PATTERN = re.compile(
+    r'"(' + "|".join(VERBAL_CRITERIA) + r')"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}\n]'
+)
+_FEEDBACK_PATTERN = re.compile(r'"feedback"\s*:\s*"')
+
+_JSON_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+class IncrementalVerdictParser:
+    """
+    GPT 스트리밍 응답(JSON 평가 결과)을 조각 단위로 받아 완성된 점수와 피드백 텍스트를 즉시 추출
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.scores: Dict[str, float] = {}
+        self._feedback_pos: Optional[int] = None  # 피드백 문자열에서 아직 읽지 않은 위치
+        self._feedback_done = False
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        응답 조각 추가 후 새로 완성된 이벤트 목록 반환 (("score", (기준, 점수)) 또는 ("feedback", 텍스트))
+        """
+        self.buffer += text
+        events: List[Tuple[str, Any]] = []
+
+        # 새로 완성된 점수 (숫자 뒤 구분자까지 도착해야 확정)
+        for match in _SCORE_PATTERN.finditer(self.buffer):
+            criteria = match.group(1)
+            if criteria not in self.scores:
+                self.scores[criteria] = float(match.group(2))
+                events.append(("score", (criteria, self.scores[criteria])))
+
+        # 피드백 문자열 증분
+        if self._feedback_pos is None:
+            match = _FEEDBACK_PATTERN.search(self.buffer)
+            if match:
+                self._feedback_pos = match.end()
+        if self._feedback_pos is not None and not self._feedback_done:
+            delta = self._read_feedback()
+            if delta:
+                events.append(("feedback", delta))
+
+        return events
+
+    def _read_feedback(self) -> str:
+        """
+        피드백 JSON 문자열을 이스케이프를 해석하며 가능한 만큼 읽음 (미완성 이스케이프는 다음 조각에서 처리)
+        """
+        chars = []
+        pos = self._feedback_pos
+        buffer = self.buffer
+        while pos < len(buffer):
+            ch = buffer[pos]
+            if ch == '"':
+                self._feedback_done = True
+                pos += 1
+                break
+            if ch != "\\":
+                chars.append(ch)
+                pos += 1
+                continue
+
+            # 이스케이프 시퀀스
+            if pos + 1 >= len(buffer):
+                break
+            code = buffer[pos + 1]
+            if code == "u":
+                if pos + 6 > len(buffer):
+                    break
+                chars.append(chr(int(buffer[pos + 2:pos + 6], 16)))
+                pos += 6
+            else:
+                chars.append(_JSON_ESCAPES.get(code, code))
+                pos += 2
+
+        self._feedback_pos = pos
+        return "".join(chars)
+
+    def result(self) -> tuple:
+        """
+        전체 응답 수신 후 최종 점수와 피드백 반환
+        """
+        return parse_verbal_result(self.buffer)
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    SSE(Server-Sent Events) 메시지 포맷
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _evaluation_events(evaluation: Evaluation) -> Iterator[str]:
+    """
+    저장된 평가 결과를 SSE 이벤트로 변환
+    """
+    detailed_scores = evaluation.detailed_scores or {}
+    for category in ("verbal", "nonverbal"):
+        for criteria, score in detailed_scores.get(category, {}).items():
+            yield format_sse("score", {"category": category, "criteria": criteria, "score": score})
+    yield format_sse("done", {
+        "evaluation_id": evaluation.id,
+        "total_score": evaluation.total_score,
+        "verbal_score": evaluation.verbal_score,
+        "nonverbal_score": evaluation.nonverbal_score,
+        "feedback": evaluation.feedback
+    })
+
+def _stream_verbal_evaluation(prompt: str, parser: IncrementalVerdictParser) -> Iterator[str]:
+    """
+    GPT 스트리밍 응답을 받아 점수/피드백 이벤트 생성
+    """
+    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+
+    response = client.chat.completions.create(
+        model="gpt-4",
+        messages=[
+            {"role": "system", "content": VERBAL_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.3,
+        stream=True,
+    )
+
+    for chunk in response:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        for event, value in parser.feed(delta):
+            if event == "score":
+                criteria, score = value
+                yield format_sse("score", {"category": "verbal", "criteria": criteria, "score": score})
+            else:
+                yield format_sse("feedback", {"text": value})
+
+def stream_interview_evaluation(interview_id: int, state: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    면접 평가를 수행하며 기준별 점수와 피드백을 SSE로 스트리밍 (완료 시 평가 저장)
+
+    state가 주어지면 저장된 평가 ID를 state["evaluation_id"]에 기록
+    """
+    state = state if state is not None else {}
+    db = SessionLocal()
+    lock: Optional[RedisLock] = None
+    try:
+        interview = get_interview(db, interview_id)
+        if not interview or interview.status != "completed":
+            yield format_sse("error", {"detail": "완료된 면접만 평가할 수 있습니다"})
+            return
+
+        # 이미 평가가 있으면 저장된 결과를 그대로 전송
+        existing_evaluation = get_evaluation_by_interview(db, interview_id)
+        if existing_evaluation:
+            state["evaluation_id"] = existing_evaluation.id
+            yield from _evaluation_events(existing_evaluation)
+            return
+
+        lock = RedisLock(redis_client, f"lock:evaluation:{interview_id}", lease_ms=settings.EVALUATION_LOCK_LEASE_MS)
+        try:
+            acquired = lock.acquire()
+        except redis.RedisError as e:
+            logger.warning(f"평가 락 획득 실패, 락 없이 평가를 진행합니다: {e}")
+            lock, acquired = None, True
+
+        if not acquired:
+            # 다른 작업자의 평가 결과를 기다렸다가 전송
+            lock = None
+            yield format_sse("waiting", {"detail": "진행 중인 평가 결과를 기다립니다"})
+            waiter = RedisLock(redis_client, f"lock:evaluation:{interview_id}")
+            if waiter.wait_released(timeout=settings.EVALUATION_LOCK_WAIT_SECONDS):
+                evaluation = get_committed_evaluation(db, interview_id)
+                if evaluation:
+                    state["evaluation_id"] = evaluation.id
+                    yield from _evaluation_events(evaluation)
+                    return
+            yield format_sse("error", {"detail": "면접 평가 중 오류가 발생했습니다"})
+            return
+
+        # 락 획득 전에 다른 작업자가 평가를 끝냈을 수 있으므로 새 트랜잭션에서 다시 확인
+        existing_evaluation = get_committed_evaluation(db, interview_id)
+        if existing_evaluation:
+            state["evaluation_id"] = existing_evaluation.id
+            yield from _evaluation_events(existing_evaluation)
+            return
+
+        # 언어적 평가 (스트리밍)
+        answers = get_answers_by_interview(db, interview_id)
+        parser = IncrementalVerdictParser()
+        try:
+            yield from _stream_verbal_evaluation(build_verbal_prompt(interview, answers), parser)
+            verbal_scores, verbal_feedback = parser.result()
+        except Exception as e:
+            logger.error(f"언어적 측면 스트리밍 평가 실패: {e}")
+            verbal_scores = {criteria: 3 for criteria in VERBAL_CRITERIA}
+            verbal_feedback = "언어적 측면 평가 중 오류가 발생했습니다. 기본 점수가 적용됩니다."
+
+        # 스트리밍 중 누락된 점수(기본값 포함) 보완 전송
+        for criteria, score in verbal_scores.items():
+            if criteria not in parser.scores:
+                yield format_sse("score", {"category": "verbal", "criteria": criteria, "score": score})
+
+        # 비언어적 평가 (일반 평가와 같이 음성 특징 추출 포함)
+        nonverbal_scores, nonverbal_feedback = run_nonverbal_evaluation(db, interview_id)
+        for criteria, score in nonverbal_scores.items():
+            yield format_sse("score", {"category": "nonverbal", "criteria": criteria, "score": score})
+
+        evaluation = save_evaluation_result(
+            db, interview_id,
+            verbal_scores, verbal_feedback,
+            nonverbal_scores, nonverbal_feedback,
+            lock
+        )
+        if not evaluation:
+            yield format_sse("error", {"detail": "면접 평가 중 오류가 발생했습니다"})
+            return
+
+        state["evaluation_id"] = evaluation.id
+        yield format_sse("done", {
+            "evaluation_id": evaluation.id,
+            "total_score": evaluation.total_score,
+            "verbal_score": evaluation.verbal_score,
+            "nonverbal_score": evaluation.nonverbal_score,
+            "feedback": evaluation.feedback
+        })
+    except Exception as e:
+        logger.error(f"면접 스트리밍 평가 실패: {e}")
+        yield format_sse("error", {"detail": "면접 평가 중 오류가 발생했습니다"})
+    finally:
+        if lock is not None:
+            lock.release()
+        db.close()
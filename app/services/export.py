@@ -0,0 +1,403 @@
+from typing import Optional, List, Dict, Any, Iterator, Callable
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+import os
+import io
+import csv
+import json
+import logging
+import openpyxl
+from datetime import datetime
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.evaluation import Evaluation, CriteriaScore
+from app.models.interview import Interview, Answer
+from app.schemas.export import EvaluationExportFilter
+
+logger = logging.getLogger(__name__)
+
+VERBAL_CRITERIA = ["clarity", "relevance", "depth", "conciseness", "confidence"]
+NONVERBAL_CRITERIA = ["volume", "posture", "attire", "facial_expression", "eye_contact", "gestures"]
+
+# Excel 열 정의 (헤더, 고정 너비), 지원자 이름 열은 데이터 통계로 너비 계산
+EXCEL_COLUMNS = [
+    ("면접 ID", 10),
+    ("지원자 이름", None),
+    ("면접 일시", 18),
+    ("총점", 8),
+    ("언어적 점수", 12),
+    ("비언어적 점수", 14),
+    ("명확성", 8), ("관련성", 8), ("깊이", 8), ("간결성", 8), ("자신감", 8),
+    ("성량", 8), ("자세", 8), ("복장", 8), ("표정", 8), ("시선처리", 10), ("제스처", 8),
+    ("피드백", 100),
+]
+FEEDBACK_MAX_LENGTH = 1000  # 피드백 길이 제한
+
+# CSV/Parquet 열 정의 (세부 항목 점수는 category_criteria 열로 평탄화)
+RECORD_COLUMNS = [
+    "evaluation_id", "interview_id", "candidate_name", "interviewer_id", "interview_status",
+    "interview_start", "interview_end", "evaluated_at",
+    "total_score", "verbal_score", "nonverbal_score",
+    *[f"verbal_{criteria}" for criteria in VERBAL_CRITERIA],
+    *[f"nonverbal_{criteria}" for criteria in NONVERBAL_CRITERIA],
+    "transcript", "feedback",
+]
+
+def apply_export_filters(query, filters: Optional[EvaluationExportFilter]):
+    """
+    내보내기 대상 조건 적용 (면접 시작 시각 범위, 면접 상태, 면접관)
+    """
+    if filters is None:
+        return query
+    if filters.start_date is not None:
+        query = query.filter(Interview.start_time >= filters.start_date)
+    if filters.end_date is not None:
+        query = query.filter(Interview.start_time < filters.end_date)
+    if filters.interview_status is not None:
+        query = query.filter(Interview.status == filters.interview_status)
+    if filters.interviewer_id is not None:
+        query = query.filter(Interview.interviewer_id == filters.interviewer_id)
+    return query
+
+def count_export_rows(db: Session, filters: Optional[EvaluationExportFilter] = None) -> int:
+    """
+    내보내기 대상 행 수 (평가 1건당 1행)
+    """
+    return evaluation_rows_query(db, filters).count()
+
+def evaluation_rows_query(db: Session, filters: Optional[EvaluationExportFilter] = None):
+    """
+    면접-평가 조인 조회 (ORM 객체 대신 필요한 열만 조회)
+    """
+    query = (
+        db.query(
+            Interview.id,
+            Interview.candidate_name,
+            Interview.start_time,
+            Evaluation.total_score,
+            Evaluation.verbal_score,
+            Evaluation.nonverbal_score,
+            Evaluation.detailed_scores,
+            Evaluation.feedback,
+        )
+        .join(Evaluation, Evaluation.interview_id == Interview.id)
+    )
+    return apply_export_filters(query, filters)
+
+def iter_evaluation_rows(
+    db: Session,
+    batch_size: Optional[int] = None,
+    filters: Optional[EvaluationExportFilter] = None
+) -> Iterator[Any]:
+    """
+    면접-평가 행을 면접 ID 기준 키셋 페이지네이션으로 순차 조회 (메모리에는 한 배치만 유지)
+
+    mysql-connector는 서버 측 커서를 지원하지 않아 stream_results로는 전체 결과가 버퍼링됨
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    last_id = 0
+    while True:
+        rows = (
+            evaluation_rows_query(db, filters)
+            .filter(Interview.id > last_id)
+            .order_by(Interview.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1].id
+
+def _excel_row(row) -> List[Any]:
+    """
+    조회 행을 Excel 행으로 변환
+    """
+    detailed_scores = row.detailed_scores or {}
+    verbal_scores = detailed_scores.get("verbal", {})
+    nonverbal_scores = detailed_scores.get("nonverbal", {})
+
+    def _score(value: Optional[float]) -> float:
+        return round(float(value or 0), 1)
+
+    return [
+        row.id,
+        row.candidate_name,
+        row.start_time.strftime("%Y-%m-%d %H:%M") if row.start_time else "",
+        _score(row.total_score),
+        _score(row.verbal_score),
+        _score(row.nonverbal_score),
+        *[_score(verbal_scores.get(criteria)) for criteria in VERBAL_CRITERIA],
+        *[_score(nonverbal_scores.get(criteria)) for criteria in NONVERBAL_CRITERIA],
+        row.feedback[:FEEDBACK_MAX_LENGTH] if row.feedback else "",
+    ]
+
+def _excel_column_widths(db: Session, filters: Optional[EvaluationExportFilter] = None) -> List[float]:
+    """
+    열 너비 계산 (셀을 다시 훑지 않고 고정 너비와 집계 통계 사용)
+    """
+    max_name_length = (
+        evaluation_rows_query(db, filters)
+        .with_entities(func.max(func.length(Interview.candidate_name)))
+        .scalar()
+    ) or 0
+    widths = []
+    for header, width in EXCEL_COLUMNS:
+        if width is None:
+            width = min(max(max_name_length, len(header)) + 2, 40) * 1.2
+        widths.append(width)
+    return widths
+
+def write_evaluations_excel(
+    db: Session,
+    excel_path: str,
+    progress: Optional[Callable[[int], None]] = None,
+    filters: Optional[EvaluationExportFilter] = None
+) -> int:
+    """
+    면접 평가 결과를 쓰기 전용 워크북으로 저장 (행 단위 기록, 메모리 사용량 일정), 기록한 행 수 반환
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("면접 평가 결과")
+
+    # 쓰기 전용 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+    for index, width in enumerate(_excel_column_widths(db, filters), start=1):
+        ws.column_dimensions[openpyxl.utils.get_column_letter(index)].width = width
+
+    ws.append([header for header, _ in EXCEL_COLUMNS])
+
+    count = 0
+    for row in iter_evaluation_rows(db, filters=filters):
+        ws.append(_excel_row(row))
+        count += 1
+        if progress and count % settings.EXPORT_BATCH_SIZE == 0:
+            progress(count)
+
+    # 완성된 파일만 보이도록 임시 파일에 저장 후 교체
+    temp_path = f"{excel_path}.tmp"
+    wb.save(temp_path)
+    os.replace(temp_path, excel_path)
+    if progress:
+        progress(count)
+    return count
+
+# ---------------------------------------------------------------------------
+# 원본 데이터 내보내기 (CSV/NDJSON 스트리밍, Parquet 스냅샷)
+# ---------------------------------------------------------------------------
+
+def evaluation_records_query(db: Session, filters: Optional[EvaluationExportFilter] = None):
+    """
+    평가-면접 조인 조회 (원본 데이터 내보내기용, 평가 1건당 1행)
+    """
+    query = (
+        db.query(
+            Evaluation.id.label("evaluation_id"),
+            Evaluation.interview_id,
+            Interview.candidate_name,
+            Interview.interviewer_id,
+            Interview.status.label("interview_status"),
+            Interview.start_time,
+            Interview.end_time,
+            Interview.questions,
+            Evaluation.created_at,
+            Evaluation.total_score,
+            Evaluation.verbal_score,
+            Evaluation.nonverbal_score,
+            Evaluation.feedback,
+        )
+        .join(Interview, Interview.id == Evaluation.interview_id)
+    )
+    return apply_export_filters(query, filters)
+
+def _evaluation_record(row, criteria_scores: Dict[str, Dict[str, Any]], answers: List[Any]) -> Dict[str, Any]:
+    """
+    조회 행과 세부 항목 점수, 답변으로 평가 레코드 생성
+    """
+    questions = row.questions or []
+    return {
+        "evaluation_id": row.evaluation_id,
+        "interview_id": row.interview_id,
+        "candidate_name": row.candidate_name,
+        "interviewer_id": row.interviewer_id,
+        "interview_status": row.interview_status,
+        "interview_start": row.start_time,
+        "interview_end": row.end_time,
+        "evaluated_at": row.created_at,
+        "total_score": row.total_score,
+        "verbal_score": row.verbal_score,
+        "nonverbal_score": row.nonverbal_score,
+        "criteria_scores": criteria_scores,
+        "answers": [
+            {
+                "question_index": answer.question_index,
+                "question": questions[answer.question_index] if 0 <= answer.question_index < len(questions) else None,
+                "content": answer.content,
+                "start_time": answer.start_time,
+                "end_time": answer.end_time,
+            }
+            for answer in answers
+        ],
+        "feedback": row.feedback,
+    }
+
+def iter_evaluation_records(
+    db: Session,
+    filters: Optional[EvaluationExportFilter] = None,
+    batch_size: Optional[int] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    평가 레코드(점수, 세부 항목 점수, 답변 전사)를 배치 단위로 반환
+
+    평가 행은 평가 ID 기준 키셋 페이지네이션으로 조회하고 (mysql-connector는 서버 측 커서를 지원하지 않음)
+    배치별 세부 점수/답변은 IN 조회로 한 번에 가져옴
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    last_id = 0
+    while True:
+        batch = (
+            evaluation_records_query(db, filters)
+            .filter(Evaluation.id > last_id)
+            .order_by(Evaluation.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return
+        last_id = batch[-1].evaluation_id
+
+        evaluation_ids = [row.evaluation_id for row in batch]
+        interview_ids = list({row.interview_id for row in batch})
+
+        criteria_scores: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        for score in (
+            db.query(
+                CriteriaScore.evaluation_id, CriteriaScore.category,
+                CriteriaScore.criteria, CriteriaScore.score, CriteriaScore.comment
+            )
+            .filter(CriteriaScore.evaluation_id.in_(evaluation_ids))
+        ):
+            category_scores = criteria_scores.setdefault(score.evaluation_id, {}).setdefault(score.category, {})
+            category_scores[score.criteria] = {"score": score.score, "comment": score.comment}
+
+        answers: Dict[int, List[Any]] = {}
+        for answer in (
+            db.query(
+                Answer.interview_id, Answer.question_index, Answer.content,
+                Answer.start_time, Answer.end_time
+            )
+            .filter(Answer.interview_id.in_(interview_ids))
+            .order_by(Answer.interview_id, Answer.question_index)
+        ):
+            answers.setdefault(answer.interview_id, []).append(answer)
+
+        yield [
+            _evaluation_record(row, criteria_scores.get(row.evaluation_id, {}), answers.get(row.interview_id, []))
+            for row in batch
+        ]
+
+def flatten_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    평가 레코드를 RECORD_COLUMNS 기준 평탄한 행으로 변환 (답변은 질문 순서대로 하나의 전사 텍스트로 결합)
+    """
+    flat = {column: record.get(column) for column in RECORD_COLUMNS}
+    for category, criteria_list in (("verbal", VERBAL_CRITERIA), ("nonverbal", NONVERBAL_CRITERIA)):
+        category_scores = record["criteria_scores"].get(category, {})
+        for criteria in criteria_list:
+            flat[f"{category}_{criteria}"] = category_scores.get(criteria, {}).get("score")
+    flat["transcript"] = "\n".join(
+        f"[Q{answer['question_index'] + 1}] {answer['content']}" for answer in record["answers"]
+    )
+    return flat
+
+def _json_default(value: Any) -> Any:
+    """
+    JSON 직렬화 보조 (datetime은 ISO 8601 문자열)
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def stream_evaluations_csv(filters: Optional[EvaluationExportFilter] = None) -> Iterator[bytes]:
+    """
+    평가 데이터를 CSV로 스트리밍 (배치 단위로 인코딩해 전송, 자체 DB 세션 사용)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(RECORD_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+
+    db = SessionLocal()
+    try:
+        for batch in iter_evaluation_records(db, filters):
+            buffer.seek(0)
+            buffer.truncate(0)
+            for record in batch:
+                flat = flatten_record(record)
+                writer.writerow([flat[column] for column in RECORD_COLUMNS])
+            yield buffer.getvalue().encode("utf-8")
+    finally:
+        db.close()
+
+def stream_evaluations_ndjson(filters: Optional[EvaluationExportFilter] = None) -> Iterator[bytes]:
+    """
+    평가 데이터를 NDJSON으로 스트리밍 (한 줄에 평가 1건, 세부 항목 점수와 답변은 중첩 구조 유지)
+    """
+    db = SessionLocal()
+    try:
+        for batch in iter_evaluation_records(db, filters):
+            yield "".join(
+                json.dumps(record, ensure_ascii=False, default=_json_default) + "\n"
+                for record in batch
+            ).encode("utf-8")
+    finally:
+        db.close()
+
+def _parquet_schema(pa):
+    """
+    Parquet 스키마 (배치마다 타입 추론이 달라지지 않도록 고정)
+    """
+    types = {
+        "evaluation_id": pa.int64(),
+        "interview_id": pa.int64(),
+        "interviewer_id": pa.int64(),
+        "interview_start": pa.timestamp("us"),
+        "interview_end": pa.timestamp("us"),
+        "evaluated_at": pa.timestamp("us"),
+    }
+    text_columns = {"candidate_name", "interview_status", "transcript", "feedback"}
+    return pa.schema([
+        (column, types.get(column, pa.string() if column in text_columns else pa.float64()))
+        for column in RECORD_COLUMNS
+    ])
+
+def write_evaluations_parquet(
+    db: Session,
+    parquet_path: str,
+    progress: Optional[Callable[[int], None]] = None,
+    filters: Optional[EvaluationExportFilter] = None
+) -> int:
+    """
+    평가 데이터를 Parquet 스냅샷으로 저장 (배치마다 row group 1개 기록, 메모리 사용량 일정), 기록한 행 수 반환
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow 패키지가 필요합니다")
+
+    schema = _parquet_schema(pa)
+    temp_path = f"{parquet_path}.tmp"
+    count = 0
+    with pq.ParquetWriter(temp_path, schema, compression="zstd") as writer:
+        for batch in iter_evaluation_records(db, filters):
+            rows = [flatten_record(record) for record in batch]
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            count += len(rows)
+            if progress:
+                progress(count)
+
+    os.replace(temp_path, parquet_path)
+    if progress:
+        progress(count)
+    return count
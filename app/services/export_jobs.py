@@ -0,0 +1,283 @@
+from typing import Optional, Dict, Any, Callable
+from sqlalchemy.orm import Session
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import os
+import json
+import threading
+import logging
+import redis
+
+from app.core.config import settings
+from app.db.session import SessionLocal, redis_client
+from app.models.export import ExportJob
+from app.schemas.export import ExportJobCreate, EvaluationExportFilter
+from app.services.export import count_export_rows, write_evaluations_excel, write_evaluations_parquet
+from app.services.lock import RedisLock
+
+logger = logging.getLogger(__name__)
+
+EXPORT_MEDIA_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# 형식별 파일 기록 함수 (db, 경로, 진행률 콜백, 대상 조건) -> 기록한 행 수
+EXPORT_WRITERS: Dict[str, Callable[..., int]] = {
+    "xlsx": write_evaluations_excel,
+    "parquet": write_evaluations_parquet,
+}
+
+def get_export_dir() -> str:
+    """
+    내보내기 파일 디렉토리
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "reports", "exports")
+
+def get_export_job(db: Session, job_id: int) -> Optional[ExportJob]:
+    """
+    ID로 내보내기 작업 조회
+    """
+    return db.query(ExportJob).filter(ExportJob.id == job_id).first()
+
+def create_export_job(db: Session, job_in: ExportJobCreate) -> ExportJob:
+    """
+    새 내보내기 작업 생성
+    """
+    db_job = ExportJob(
+        format=job_in.format,
+        status="pending",
+        filters=json.loads(job_in.json(exclude={"format"}, exclude_none=True)),
+        rows_written=0
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def get_export_job_status(db: Session, job_id: int) -> Optional[Dict[str, Any]]:
+    """
+    내보내기 작업 진행 상황 조회 (완료된 작업은 다운로드 경로 포함)
+    """
+    db_job = get_export_job(db, job_id)
+    if not db_job:
+        return None
+
+    progress = 0.0
+    if db_job.status == "completed":
+        progress = 1.0
+    elif db_job.total_rows:
+        progress = round(min(db_job.rows_written / db_job.total_rows, 1.0), 3)
+
+    return {
+        "job_id": db_job.id,
+        "format": db_job.format,
+        "status": db_job.status,
+        "filters": db_job.filters,
+        "total_rows": db_job.total_rows,
+        "rows_written": db_job.rows_written or 0,
+        "progress": progress,
+        "error": db_job.error,
+        "download_url": f"/api/v1/admin/exports/{db_job.id}/download" if db_job.status == "completed" else None,
+        "created_at": db_job.created_at,
+        "started_at": db_job.started_at,
+        "finished_at": db_job.finished_at,
+    }
+
+def get_export_file_path(db_job: ExportJob) -> Optional[str]:
+    """
+    완료된 내보내기 작업의 파일 절대 경로 (파일이 없으면 None)
+    """
+    if db_job.status != "completed" or not db_job.file_path:
+        return None
+    path = os.path.join(settings.MEDIA_STORAGE_PATH, db_job.file_path)
+    return path if os.path.exists(path) else None
+
+def _update_export_job(db: Session, job_id: int, **fields: Any) -> None:
+    """
+    내보내기 작업 상태 갱신
+    """
+    db.query(ExportJob).filter(ExportJob.id == job_id).update(fields)
+    db.commit()
+
+def run_export_job(job_id: int) -> None:
+    """
+    내보내기 작업 실행 (워커 스레드에서 실행)
+
+    조회 결과를 스트리밍하는 동안 같은 세션에서 커밋하면 커서가 닫히므로 진행률은 별도 세션으로 기록
+    재시작 후 재제출된 작업이 여러 서버에서 같은 파일을 동시에 쓰지 않도록 작업별 락을 보유한 채 실행
+    """
+    lock = RedisLock(redis_client, f"lock:export_job:{job_id}")
+    try:
+        if not lock.acquire():
+            logger.info(f"내보내기 작업 ID {job_id}는 다른 작업자가 실행 중입니다.")
+            return
+    except redis.RedisError as e:
+        logger.warning(f"내보내기 작업 ID {job_id} 락 획득 실패, 락 없이 진행: {e}")
+        lock = None
+
+    db = SessionLocal()
+    progress_db = SessionLocal()
+    try:
+        db_job = get_export_job(db, job_id)
+        if not db_job:
+            logger.error(f"내보내기 작업 ID {job_id} 실행 실패: 작업이 존재하지 않습니다.")
+            return
+        if db_job.status not in ("pending", "running"):
+            return
+
+        filters = EvaluationExportFilter(**(db_job.filters or {}))
+        writer = EXPORT_WRITERS[db_job.format]
+        total_rows = count_export_rows(db, filters)
+        relative_path = f"reports/exports/export_{job_id}.{db_job.format}"
+        _update_export_job(db, job_id, status="running", total_rows=total_rows, started_at=datetime.now())
+
+        os.makedirs(get_export_dir(), exist_ok=True)
+        rows_written = writer(
+            db,
+            os.path.join(settings.MEDIA_STORAGE_PATH, relative_path),
+            progress=lambda count: _update_export_job(progress_db, job_id, rows_written=count),
+            filters=filters
+        )
+
+        _update_export_job(
+            progress_db, job_id,
+            status="completed",
+            rows_written=rows_written,
+            file_path=relative_path,
+            finished_at=datetime.now()
+        )
+        logger.info(f"내보내기 작업 ID {job_id} 완료 ({rows_written}행)")
+    except Exception as e:
+        logger.error(f"내보내기 작업 ID {job_id} 실패: {e}")
+        progress_db.rollback()
+        try:
+            _update_export_job(progress_db, job_id, status="failed", error=str(e), finished_at=datetime.now())
+        except Exception as update_error:
+            logger.error(f"내보내기 작업 ID {job_id} 상태 저장 실패: {update_error}")
+    finally:
+        progress_db.close()
+        db.close()
+        if lock is not None:
+            lock.release()
+
+# ---------------------------------------------------------------------------
+# 전용 워커 (동시 실행 작업 수 제한)
+# ---------------------------------------------------------------------------
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_export_worker() -> ThreadPoolExecutor:
+    """
+    내보내기 워커 풀 조회 (최초 호출 시 생성, 초과 작업은 대기열에서 순서대로 실행)
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.EXPORT_MAX_CONCURRENT_JOBS,
+                    thread_name_prefix="export-job"
+                )
+    return _executor
+
+def submit_export_job(job_id: int) -> None:
+    """
+    내보내기 작업을 워커 풀에 제출 (제출 시 만료된 내보내기 파일 정리)
+    """
+    get_export_worker().submit(cleanup_expired_exports)
+    get_export_worker().submit(run_export_job, job_id)
+
+def resubmit_pending_exports() -> int:
+    """
+    서버 재시작 등으로 중단된 내보내기 작업(pending, running)을 워커 풀에 다시 제출, 제출한 작업 수 반환
+
+    보관 기간이 지난 작업은 cleanup_expired_exports에서 실패 처리하므로 제외
+    """
+    db = SessionLocal()
+    try:
+        expires_before = datetime.now() - timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+        job_ids = [
+            job_id for job_id, in
+            db.query(ExportJob.id)
+            .filter(ExportJob.status.in_(["pending", "running"]), ExportJob.created_at >= expires_before)
+            .order_by(ExportJob.id)
+        ]
+    except Exception as e:
+        logger.error(f"중단된 내보내기 작업 조회 실패: {e}")
+        return 0
+    finally:
+        db.close()
+
+    for job_id in job_ids:
+        get_export_worker().submit(run_export_job, job_id)
+    if job_ids:
+        logger.info(f"중단된 내보내기 작업 재제출: {job_ids}")
+    return len(job_ids)
+
+def shutdown_export_worker() -> None:
+    """
+    내보내기 워커 풀 종료 (대기 중인 작업은 취소)
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+def cleanup_expired_exports() -> int:
+    """
+    보관 기간이 지난 내보내기 파일 삭제 후 작업을 만료 처리, 삭제한 작업 수 반환
+
+    보관 기간이 지나도록 끝나지 않은 작업(서버 재시작 등으로 중단)은 실패 처리
+    """
+    db = SessionLocal()
+    try:
+        expires_before = datetime.now() - timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+        expired_jobs = (
+            db.query(ExportJob)
+            .filter(ExportJob.status == "completed", ExportJob.finished_at < expires_before)
+            .all()
+        )
+        for db_job in expired_jobs:
+            if db_job.file_path:
+                path = os.path.join(settings.MEDIA_STORAGE_PATH, db_job.file_path)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"내보내기 파일 삭제 실패 ({path}): {e}")
+                    continue
+            db_job.status = "expired"
+            db_job.file_path = None
+
+        (
+            db.query(ExportJob)
+            .filter(ExportJob.status.in_(["pending", "running"]), ExportJob.created_at < expires_before)
+            .update({"status": "failed", "error": "작업이 중단되었습니다", "finished_at": datetime.now()}, synchronize_session=False)
+        )
+        db.commit()
+
+        # 작업 기록 없이 남은 임시/고아 파일 정리
+        export_dir = get_export_dir()
+        if os.path.isdir(export_dir):
+            cutoff = expires_before.timestamp()
+            for filename in os.listdir(export_dir):
+                path = os.path.join(export_dir, filename)
+                if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+        if expired_jobs:
+            logger.info(f"만료된 내보내기 파일 {len(expired_jobs)}개 정리")
+        return len(expired_jobs)
+    except Exception as e:
+        logger.error(f"내보내기 파일 정리 실패: {e}")
+        db.rollback()
+        return 0
+    finally:
+        db.close()
@@ -0,0 +1,553 @@
+from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, Future, wait
+from datetime import datetime
+import multiprocessing
+import itertools
+import threading
+import asyncio
+import math
+import logging
+import numpy as np
+
+from app.core.config import settings
+from app.services.frame_metrics import GAZE_CONTACT_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# FaceMesh 랜드마크 인덱스 (refine_landmarks=True 기준)
+RIGHT_IRIS_CENTER, LEFT_IRIS_CENTER = 468, 473
+RIGHT_EYE_CORNERS, LEFT_EYE_CORNERS = (33, 133), (362, 263)
+RIGHT_EYE_LIDS, LEFT_EYE_LIDS = (159, 145), (386, 374)
+NOSE_TIP = 1
+FACE_EDGES = (234, 454)
+MOUTH_CORNERS = (61, 291)
+
+# Pose 랜드마크 인덱스
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+
+# ---------------------------------------------------------------------------
+# 워커 프로세스 (모델은 프로세스 시작 시 한 번만 로드)
+# ---------------------------------------------------------------------------
+
+_face_mesh = None
+_pose = None
+
+def _init_worker() -> None:
+    """
+    워커 프로세스 초기화: MediaPipe 얼굴 메시/포즈 모델 로드
+    """
+    global _face_mesh, _pose
+    import cv2
+    import mediapipe as mp
+
+    cv2.setNumThreads(1)  # 워커 프로세스 간 CPU 경합 방지
+    _face_mesh = mp.solutions.face_mesh.FaceMesh(
+        static_image_mode=True,
+        max_num_faces=1,
+        refine_landmarks=True,
+        min_detection_confidence=0.5
+    )
+    _pose = mp.solutions.pose.Pose(
+        static_image_mode=True,
+        model_complexity=0,
+        min_detection_confidence=0.5
+    )
+
+def _ping() -> bool:
+    """
+    워커 예열 확인용
+    """
+    return _face_mesh is not None
+
+def _ratio(value: float, start: float, end: float) -> float:
+    """
+    start~end 구간에서 value의 상대 위치 (0~1)
+    """
+    span = end - start
+    return (value - start) / span if span else 0.5
+
+def _face_metrics(landmarks) -> Dict[str, float]:
+    """
+    얼굴 랜드마크로 시선 이탈 정도와 표정 강도 계산
+    """
+    lm = landmarks.landmark
+
+    # 눈 안에서 홍채의 상대 위치 (0.5가 중앙)
+    horizontal = (
+        _ratio(lm[RIGHT_IRIS_CENTER].x, lm[RIGHT_EYE_CORNERS[0]].x, lm[RIGHT_EYE_CORNERS[1]].x)
+        + _ratio(lm[LEFT_IRIS_CENTER].x, lm[LEFT_EYE_CORNERS[0]].x, lm[LEFT_EYE_CORNERS[1]].x)
+    ) / 2 - 0.5
+    vertical = (
+        _ratio(lm[RIGHT_IRIS_CENTER].y, lm[RIGHT_EYE_LIDS[0]].y, lm[RIGHT_EYE_LIDS[1]].y)
+        + _ratio(lm[LEFT_IRIS_CENTER].y, lm[LEFT_EYE_LIDS[0]].y, lm[LEFT_EYE_LIDS[1]].y)
+    ) / 2 - 0.5
+    # 얼굴 좌우 회전 (코끝이 얼굴 가장자리 사이 어디에 있는지)
+    yaw = _ratio(lm[NOSE_TIP].x, lm[FACE_EDGES[0]].x, lm[FACE_EDGES[1]].x) - 0.5
+
+    gaze = min(1.0, 2 * math.sqrt(horizontal ** 2 + vertical ** 2 + yaw ** 2))
+
+    # 얼굴 폭 대비 입 너비로 미소 강도 추정
+    face_width = abs(lm[FACE_EDGES[1]].x - lm[FACE_EDGES[0]].x)
+    mouth_width = abs(lm[MOUTH_CORNERS[1]].x - lm[MOUTH_CORNERS[0]].x)
+    expression = min(1.0, max(0.0, (mouth_width / face_width - 0.36) / 0.14)) if face_width else 0.0
+
+    return {"gaze": gaze, "expression": expression}
+
+def _posture_angle(landmarks, width: int, height: int) -> Optional[float]:
+    """
+    어깨선의 수평 대비 기울기 (도), 어깨가 보이지 않으면 None
+    """
+    lm = landmarks.landmark
+    left, right = lm[LEFT_SHOULDER], lm[RIGHT_SHOULDER]
+    if left.visibility < 0.5 or right.visibility < 0.5:
+        return None
+    dx = abs(left.x - right.x) * width
+    dy = (left.y - right.y) * height
+    return math.degrees(math.atan2(dy, dx))
+
+def _face_bbox(landmarks, width: int, height: int, offset: Tuple[int, int] = (0, 0), scale: Tuple[int, int] = None) -> Tuple[int, int, int, int]:
+    """
+    랜드마크를 감싸는 얼굴 영역 (x, y, w, h), 크롭 좌표인 경우 offset/scale로 원본 좌표 변환
+    """
+    scale_w, scale_h = scale or (width, height)
+    xs = [point.x for point in landmarks.landmark]
+    ys = [point.y for point in landmarks.landmark]
+    x0 = int(min(xs) * scale_w) + offset[0]
+    y0 = int(min(ys) * scale_h) + offset[1]
+    x1 = int(max(xs) * scale_w) + offset[0]
+    y1 = int(max(ys) * scale_h) + offset[1]
+    x0, y0 = max(0, x0), max(0, y0)
+    x1, y1 = min(width, x1), min(height, y1)
+    return x0, y0, max(1, x1 - x0), max(1, y1 - y0)
+
+def _expand(bbox: Tuple[int, int, int, int], ratio: float, width: int, height: int) -> Tuple[int, int, int, int]:
+    """
+    영역을 비율만큼 확장 (이미지 경계 안으로 제한)
+    """
+    x, y, w, h = bbox
+    dx, dy = int(w * ratio), int(h * ratio)
+    x0, y0 = max(0, x - dx), max(0, y - dy)
+    x1, y1 = min(width, x + w + dx), min(height, y + h + dy)
+    return x0, y0, x1 - x0, y1 - y0
+
+def _detect_full(image: np.ndarray) -> Tuple[Dict[str, Any], Optional[Tuple[int, int, int, int]]]:
+    """
+    전체 프레임에서 얼굴 메시 + 포즈 분석, 검출된 얼굴 영역 함께 반환
+    """
+    import cv2
+
+    rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    height, width = rgb.shape[:2]
+
+    result: Dict[str, Any] = {
+        "face_detected": False,
+        "gaze": None,
+        "posture_angle": None,
+        "expression": None,
+    }
+    bbox = None
+
+    face = _face_mesh.process(rgb)
+    if face.multi_face_landmarks:
+        landmarks = face.multi_face_landmarks[0]
+        result["face_detected"] = True
+        result.update(_face_metrics(landmarks))
+        bbox = _face_bbox(landmarks, width, height)
+
+    pose = _pose.process(rgb)
+    if pose.pose_landmarks:
+        result["posture_angle"] = _posture_angle(pose.pose_landmarks, width, height)
+
+    return result, bbox
+
+def analyze_image(image: np.ndarray) -> Dict[str, Any]:
+    """
+    디코딩된 BGR 프레임 1장 분석 (워커 프로세스에서 실행)
+    """
+    result, _ = _detect_full(image)
+    return _with_summary(result)
+
+class _FaceTrack:
+    """
+    면접별 얼굴 추적 상태 (워커 프로세스 메모리에 보관)
+    """
+
+    def __init__(self, bbox: Tuple[int, int, int, int], template: np.ndarray, posture_angle: Optional[float]):
+        self.bbox = bbox
+        self.template = template
+        self.posture_angle = posture_angle
+        self.frames_since_detection = 0
+
+_tracks: "OrderedDict[int, _FaceTrack]" = OrderedDict()
+MAX_TRACKS_PER_WORKER = 256
+
+def _template_of(gray: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+    x, y, w, h = bbox
+    return gray[y:y + h, x:x + w].copy()
+
+def _track_face(gray: np.ndarray, track: _FaceTrack) -> Optional[Tuple[int, int, int, int]]:
+    """
+    직전 얼굴 영역 주변에서 템플릿 매칭으로 얼굴 위치 추적, 신뢰도가 낮으면 None
+    """
+    import cv2
+
+    height, width = gray.shape[:2]
+    _, _, w, h = track.bbox
+    sx, sy, sw, sh = _expand(track.bbox, 0.5, width, height)
+    search = gray[sy:sy + sh, sx:sx + sw]
+    if search.shape[0] < track.template.shape[0] or search.shape[1] < track.template.shape[1]:
+        return None
+
+    scores = cv2.matchTemplate(search, track.template, cv2.TM_CCOEFF_NORMED)
+    _, confidence, _, location = cv2.minMaxLoc(scores)
+    if confidence < settings.FRAME_TRACKING_MIN_CONFIDENCE:
+        return None
+    return sx + location[0], sy + location[1], w, h
+
+def analyze_tracked(interview_id: int, image: np.ndarray) -> Dict[str, Any]:
+    """
+    추적 모드 분석: N 프레임마다 또는 추적 신뢰도 하락 시에만 전체 검출,
+    그 사이에는 추적한 얼굴 영역만 잘라 랜드마크 분석 (자세는 마지막 전체 검출 값 유지)
+    """
+    import cv2
+
+    height, width = image.shape[:2]
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    track = _tracks.get(interview_id)
+
+    if track is not None and track.frames_since_detection < settings.FRAME_FULL_DETECTION_INTERVAL:
+        bbox = _track_face(gray, track)
+        if bbox is not None:
+            rx, ry, rw, rh = _expand(bbox, 0.25, width, height)
+            crop = cv2.cvtColor(image[ry:ry + rh, rx:rx + rw], cv2.COLOR_BGR2RGB)
+            face = _face_mesh.process(crop)
+            if face.multi_face_landmarks:
+                landmarks = face.multi_face_landmarks[0]
+                # 랜드마크로 얼굴 영역을 다시 맞춰 추적 오차 누적 방지
+                track.bbox = _face_bbox(landmarks, width, height, offset=(rx, ry), scale=(rw, rh))
+                track.template = _template_of(gray, track.bbox)
+                track.frames_since_detection += 1
+                _tracks.move_to_end(interview_id)
+
+                result = {
+                    "face_detected": True,
+                    "posture_angle": track.posture_angle,
+                    "tracked": True,
+                }
+                result.update(_face_metrics(landmarks))
+                return _with_summary(result)
+
+    # 전체 검출
+    result, bbox = _detect_full(image)
+    if bbox is None:
+        _tracks.pop(interview_id, None)
+    else:
+        _tracks[interview_id] = _FaceTrack(bbox, _template_of(gray, bbox), result["posture_angle"])
+        _tracks.move_to_end(interview_id)
+        while len(_tracks) > MAX_TRACKS_PER_WORKER:
+            _tracks.popitem(last=False)
+    result["tracked"] = False
+    return _with_summary(result)
+
+def _drop_track(interview_id: int) -> None:
+    """
+    면접별 추적 상태 삭제 (워커 프로세스에서 실행)
+    """
+    _tracks.pop(interview_id, None)
+
+def _with_summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    수치 결과에 기존 응답 형식의 요약 필드(emotion, eye_contact, posture) 추가
+    """
+    expression = result.get("expression")
+    gaze = result.get("gaze")
+    angle = result.get("posture_angle")
+    result["emotion"] = "smile" if expression is not None and expression >= 0.5 else "neutral"
+    result["eye_contact"] = gaze is not None and gaze < GAZE_CONTACT_THRESHOLD
+    result["posture"] = "unknown" if angle is None else ("good" if abs(angle) < 5 else "tilted")
+    return result
+
+def _analyze_jpeg_batch(frames: List[bytes], interview_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    JPEG 프레임 묶음을 메모리에서 디코딩 후 분석 (워커 프로세스에서 실행)
+    """
+    import cv2
+
+    tracking = interview_id is not None and settings.FRAME_TRACKING_ENABLED
+    results = []
+    for frame_data in frames:
+        try:
+            image = cv2.imdecode(np.frombuffer(frame_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                results.append({"error": "프레임을 디코딩할 수 없습니다"})
+                continue
+            results.append(analyze_tracked(interview_id, image) if tracking else analyze_image(image))
+        except Exception as e:
+            results.append({"error": str(e)})
+    return results
+
+def _analyze_raw_batch(images: List[np.ndarray], interview_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    이미 디코딩된 BGR 프레임 묶음 분석 (워커 프로세스에서 실행)
+    """
+    tracking = interview_id is not None and settings.FRAME_TRACKING_ENABLED
+    results = []
+    for image in images:
+        try:
+            results.append(analyze_tracked(interview_id, image) if tracking else analyze_image(image))
+        except Exception as e:
+            results.append({"error": str(e)})
+    return results
+
+# ---------------------------------------------------------------------------
+# 메인 프로세스 API
+# ---------------------------------------------------------------------------
+
+# 면접별 추적 상태가 한 워커에 유지되도록 워커 1개짜리 풀을 샤드로 두고 면접 ID로 고정 배정
+_shards: List[ProcessPoolExecutor] = []
+_shards_lock = threading.Lock()
+_round_robin = itertools.count()
+
+def get_frame_analyzer(interview_id: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    프레임 분석 워커 조회 (최초 호출 시 생성), 면접 ID가 있으면 항상 같은 워커 반환
+    """
+    if not _shards:
+        with _shards_lock:
+            if not _shards:
+                context = multiprocessing.get_context("spawn")
+                _shards.extend(
+                    ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_worker)
+                    for _ in range(settings.FRAME_ANALYZER_WORKERS)
+                )
+    index = interview_id if interview_id is not None else next(_round_robin)
+    return _shards[index % len(_shards)]
+
+def warm_up_frame_analyzer() -> None:
+    """
+    프로세스 풀 워커를 미리 띄워 모델 로드 (서버 시작 시 호출)
+    """
+    try:
+        get_frame_analyzer()
+        wait([shard.submit(_ping) for shard in _shards])
+        logger.info(f"프레임 분석 워커 {len(_shards)}개 준비 완료")
+    except Exception as e:
+        logger.error(f"프레임 분석 워커 예열 실패: {e}")
+
+def shutdown_frame_analyzer() -> None:
+    """
+    프레임 분석 프로세스 풀 종료
+    """
+    with _shards_lock:
+        for shard in _shards:
+            shard.shutdown(wait=False, cancel_futures=True)
+        _shards.clear()
+
+def forget_interview(interview_id: int) -> None:
+    """
+    면접별 중복 제거/추적 상태 삭제 (실시간 분석 종료 시 호출)
+    """
+    _deduplicator.forget(interview_id)
+    if _shards:
+        get_frame_analyzer(interview_id).submit(_drop_track, interview_id)
+
+def submit_raw_frames(images: List[np.ndarray], interview_id: Optional[int] = None) -> Future:
+    """
+    디코딩된 프레임 묶음 분석 요청 (녹화 영상 분석용, 타임스탬프는 호출 측에서 기록)
+    """
+    return get_frame_analyzer(interview_id).submit(_analyze_raw_batch, images, interview_id)
+
+def _split_batches(frames: List[bytes]) -> List[List[bytes]]:
+    """
+    워커별 작업 단위로 프레임 분할
+    """
+    size = settings.FRAME_ANALYZER_BATCH_SIZE
+    return [frames[i:i + size] for i in range(0, len(frames), size)]
+
+# ---------------------------------------------------------------------------
+# 지각 해시 기반 중복 프레임 제거
+# ---------------------------------------------------------------------------
+
+HASH_SIZE = 8
+
+def frame_hash(frame_data: bytes) -> Optional[int]:
+    """
+    JPEG 프레임의 평균 해시(aHash, 64비트) 계산
+
+    1/8 축소 흑백 디코딩(JPEG DCT 단계에서 축소) 후 NumPy 블록 평균으로 8x8 축소
+    """
+    import cv2
+
+    image = cv2.imdecode(np.frombuffer(frame_data, dtype=np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    if image is None or image.shape[0] < HASH_SIZE or image.shape[1] < HASH_SIZE:
+        return None
+
+    height = image.shape[0] // HASH_SIZE * HASH_SIZE
+    width = image.shape[1] // HASH_SIZE * HASH_SIZE
+    blocks = image[:height, :width].reshape(HASH_SIZE, height // HASH_SIZE, HASH_SIZE, width // HASH_SIZE)
+    small = blocks.mean(axis=(1, 3))
+    bits = np.packbits(small > small.mean())
+    return int.from_bytes(bits.tobytes(), "big")
+
+def hamming_distance(a: int, b: int) -> int:
+    """
+    두 해시 간 해밍 거리
+    """
+    return (a ^ b).bit_count()
+
+class FrameDeduplicator:
+    """
+    면접별 마지막 분석 프레임의 해시와 결과를 보관하여 거의 같은 프레임의 분석을 생략
+    """
+
+    def __init__(self, threshold: int, max_interviews: int = 1024):
+        self.threshold = threshold
+        self.max_interviews = max_interviews
+        self._last: "OrderedDict[int, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def plan(self, interview_id: int, hashes: List[Optional[int]]) -> Tuple[List[Optional[int]], Optional[Dict[str, Any]]]:
+        """
+        프레임별 재사용 대상 결정, (계획, 이전 호출의 결과) 반환
+
+        계획[i]가 None이면 분석 대상, -1이면 이전 호출의 결과 재사용, 그 외에는 같은 묶음 안 해당 인덱스 결과 재사용
+        이전 결과는 계획과 함께 반환하므로 병합 전에 forget()/교체가 일어나도 계획과 어긋나지 않음
+        """
+        with self._lock:
+            last = self._last.get(interview_id)
+        last_hash = last[0] if last else None
+        last_ref = -1 if last else None
+        cached = last[1] if last else None
+
+        plan: List[Optional[int]] = []
+        for i, h in enumerate(hashes):
+            if h is not None and last_hash is not None and last_ref is not None \
+                    and hamming_distance(h, last_hash) <= self.threshold:
+                plan.append(last_ref)
+                continue
+            plan.append(None)
+            last_hash, last_ref = h, (i if h is not None else None)
+        return plan, cached
+
+    def remember(self, interview_id: int, frame_hash_value: int, result: Dict[str, Any]) -> None:
+        """
+        마지막 분석 프레임의 해시와 결과 저장
+        """
+        with self._lock:
+            self._last[interview_id] = (frame_hash_value, result)
+            self._last.move_to_end(interview_id)
+            while len(self._last) > self.max_interviews:
+                self._last.popitem(last=False)
+
+    def forget(self, interview_id: int) -> None:
+        """
+        면접별 보관 상태 삭제
+        """
+        with self._lock:
+            self._last.pop(interview_id, None)
+
+_deduplicator = FrameDeduplicator(settings.FRAME_DEDUP_HAMMING_THRESHOLD)
+
+FramePlan = Tuple[List[Optional[int]], List[Optional[int]], Optional[Dict[str, Any]], List[float]]
+
+def _plan_frames(
+    interview_id: Optional[int],
+    frames: List[bytes],
+    timestamps: Optional[List[float]] = None
+) -> FramePlan:
+    """
+    프레임 해시 계산 및 분석/재사용 계획 수립, (해시, 계획, 이전 호출의 결과, 프레임별 수신 시각) 반환
+
+    timestamps가 없으면 모든 프레임의 수신 시각을 현재 시각으로 간주
+    """
+    if timestamps is None:
+        timestamps = [datetime.now().timestamp()] * len(frames)
+    elif len(timestamps) != len(frames):
+        raise ValueError("프레임 수와 타임스탬프 수가 일치하지 않습니다")
+    if interview_id is None or settings.FRAME_DEDUP_HAMMING_THRESHOLD < 0:
+        return [None] * len(frames), [None] * len(frames), None, list(timestamps)
+    hashes = [frame_hash(frame_data) for frame_data in frames]
+    plan, cached = _deduplicator.plan(interview_id, hashes)
+    return hashes, plan, cached, list(timestamps)
+
+def _merge_results(
+    interview_id: Optional[int],
+    frame_plan: FramePlan,
+    analyzed: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    분석 결과와 재사용 결과를 입력 순서대로 합치고 마지막 분석 프레임 기억 (타임스탬프는 프레임별 수신 시각)
+    """
+    hashes, plan, cached, timestamps = frame_plan
+    analyzed_iter = iter(analyzed)
+
+    results: List[Dict[str, Any]] = []
+    last_index = None
+    for i, ref in enumerate(plan):
+        if ref is None:
+            result = next(analyzed_iter)
+            result["timestamp"] = timestamps[i]
+            if "error" not in result and hashes[i] is not None:
+                last_index = i
+        else:
+            # 이전 결과를 이 프레임의 타임스탬프로 재사용
+            source = cached if ref == -1 else results[ref]
+            result = {**source, "timestamp": timestamps[i], "reused": True}
+        results.append(result)
+
+    if interview_id is not None and last_index is not None:
+        _deduplicator.remember(interview_id, hashes[last_index], results[last_index])
+    return results
+
+def analyze_frames(
+    frames: List[bytes],
+    interview_id: Optional[int] = None,
+    timestamps: Optional[List[float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    JPEG 프레임 묶음 분석 (프로세스 풀 사용, 입력 순서대로 결과 반환)
+
+    interview_id가 주어지면 직전 분석 프레임과 거의 같은 프레임은 분석하지 않고 결과 재사용
+    timestamps는 프레임별 수신(촬영) 시각 (없으면 호출 시각)
+    """
+    frame_plan = _plan_frames(interview_id, frames, timestamps)
+    pending = [frame_data for frame_data, ref in zip(frames, frame_plan[1]) if ref is None]
+
+    if interview_id is not None:
+        # 추적 상태 순서를 지키기 위해 같은 워커에서 한 번에 처리
+        analyzed = get_frame_analyzer(interview_id).submit(_analyze_jpeg_batch, pending, interview_id).result()
+        return _merge_results(interview_id, frame_plan, analyzed)
+
+    futures = [get_frame_analyzer().submit(_analyze_jpeg_batch, batch) for batch in _split_batches(pending)]
+    analyzed = []
+    for future in futures:
+        analyzed.extend(future.result())
+    return _merge_results(interview_id, frame_plan, analyzed)
+
+async def analyze_frames_async(
+    frames: List[bytes],
+    interview_id: Optional[int] = None,
+    timestamps: Optional[List[float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    JPEG 프레임 묶음 분석 (이벤트 루프를 막지 않는 비동기 버전)
+    """
+    if timestamps is None:
+        # 해시 계산 대기 시간이 포함되지 않도록 호출 시각을 먼저 기록
+        timestamps = [datetime.now().timestamp()] * len(frames)
+    loop = asyncio.get_running_loop()
+    # 해시 계산(JPEG 디코딩)도 이벤트 루프 밖의 스레드에서 수행
+    frame_plan = await loop.run_in_executor(None, _plan_frames, interview_id, frames, timestamps)
+    pending = [frame_data for frame_data, ref in zip(frames, frame_plan[1]) if ref is None]
+
+    if interview_id is not None:
+        # 추적 상태 순서를 지키기 위해 같은 워커에서 한 번에 처리
+        analyzed = await loop.run_in_executor(get_frame_analyzer(interview_id), _analyze_jpeg_batch, pending, interview_id)
+        return _merge_results(interview_id, frame_plan, analyzed)
+
+    batches = await asyncio.gather(*[
+        loop.run_in_executor(get_frame_analyzer(), _analyze_jpeg_batch, batch)
+        for batch in _split_batches(pending)
+    ])
+    return _merge_results(interview_id, frame_plan, [result for batch in batches for result in batch])
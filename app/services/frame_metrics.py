@@ -0,0 +1,145 @@
+from typing import List, Dict, Any
+import os
+import threading
+import logging
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 프레임 분석 결과 레코드 (프레임당 1행, 25바이트)
+# - gaze: 카메라 정면 기준 시선 이탈 정도 (0: 정면 ~ 1: 크게 벗어남)
+# - posture_angle: 어깨선 기울기 (도)
+# - expression: 미소/표정 강도 (0 ~ 1)
+# 측정되지 않은 값은 NaN으로 저장
+FRAME_METRICS_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("face_detected", "u1"),
+    ("gaze", "<f4"),
+    ("posture_angle", "<f4"),
+    ("expression", "<f4"),
+])
+
+# 정면 응시로 판단하는 시선 이탈 임계값
+GAZE_CONTACT_THRESHOLD = 0.25
+
+_append_lock = threading.Lock()
+
+def get_frame_metrics_path(interview_id: int) -> str:
+    """
+    면접별 프레임 분석 시계열 파일 경로
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "frames", f"interview_{interview_id}.bin")
+
+def frame_results_to_records(results: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    프레임 분석 결과(dict) 목록을 레코드 배열로 변환
+    """
+    records = np.zeros(len(results), dtype=FRAME_METRICS_DTYPE)
+    for i, result in enumerate(results):
+        records[i] = (
+            result.get("timestamp", 0.0),
+            1 if result.get("face_detected") else 0,
+            np.nan if result.get("gaze") is None else result["gaze"],
+            np.nan if result.get("posture_angle") is None else result["posture_angle"],
+            np.nan if result.get("expression") is None else result["expression"],
+        )
+    return records
+
+def append_frame_metrics(interview_id: int, results: List[Dict[str, Any]]) -> bool:
+    """
+    프레임 분석 결과를 면접별 시계열 파일에 추가 (오류 결과는 제외)
+    """
+    try:
+        results = [result for result in results if "error" not in result]
+        if not results:
+            return True
+
+        records = frame_results_to_records(results)
+        path = get_frame_metrics_path(interview_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with _append_lock:
+            with open(path, "ab") as f:
+                records.tofile(f)
+        return True
+    except Exception as e:
+        logger.error(f"프레임 분석 결과 저장 실패: {e}")
+        return False
+
+def has_frame_metrics(interview_id: int) -> bool:
+    """
+    면접별 프레임 분석 시계열 존재 여부
+    """
+    path = get_frame_metrics_path(interview_id)
+    return os.path.exists(path) and os.path.getsize(path) >= FRAME_METRICS_DTYPE.itemsize
+
+def load_frame_metrics(interview_id: int) -> np.ndarray:
+    """
+    면접별 프레임 분석 시계열 조회 (타임스탬프 순 정렬)
+    """
+    path = get_frame_metrics_path(interview_id)
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=FRAME_METRICS_DTYPE)
+
+    # 기록 중인 마지막 레코드가 잘려 있을 수 있으므로 완전한 레코드만 읽음
+    count = os.path.getsize(path) // FRAME_METRICS_DTYPE.itemsize
+    series = np.fromfile(path, dtype=FRAME_METRICS_DTYPE, count=count)
+    return np.sort(series, order="timestamp")
+
+def _clip_score(value: float) -> float:
+    """
+    1~5점 범위로 제한 후 소수점 첫째 자리 반올림
+    """
+    return round(float(np.clip(value, 1.0, 5.0)), 1)
+
+def score_frame_metrics(series: np.ndarray) -> Dict[str, float]:
+    """
+    프레임 분석 시계열 전체에 대한 비언어적 점수 계산 (1-5점, 벡터 연산)
+
+    시계열로 측정할 수 없는 항목(volume, attire)은 포함하지 않음
+    """
+    face = series["face_detected"].astype(bool)
+    gaze = series["gaze"]
+    posture = series["posture_angle"]
+    expression = series["expression"]
+
+    # 시선 처리: 얼굴이 보이지 않는 프레임은 눈 맞춤 실패로 간주
+    contact_ratio = np.count_nonzero(face & (gaze < GAZE_CONTACT_THRESHOLD)) / len(series)
+    eye_contact = 1 + 4 * contact_ratio
+
+    # 자세: 어깨 기울기의 평균과 흔들림이 작을수록 높은 점수
+    valid_posture = posture[~np.isnan(posture)]
+    if valid_posture.size:
+        tilt = np.abs(valid_posture)
+        posture_score = 5 - tilt.mean() / 5 - tilt.std() / 5
+        # 제스처: 프레임 간 상체 움직임이 적당할 때 높은 점수 (경직 또는 과도한 움직임은 감점)
+        movement = np.abs(np.diff(valid_posture)).mean() if valid_posture.size > 1 else 0.0
+        gestures = 5 - abs(np.log2(max(movement, 0.05) / 0.8))
+    else:
+        posture_score = 3.0
+        gestures = 3.0
+
+    # 표정: 얼굴이 보이는 프레임의 평균 표정 강도
+    valid_expression = expression[face & ~np.isnan(expression)]
+    if valid_expression.size:
+        facial_expression = 1 + 4 * np.clip(valid_expression.mean() / 0.4, 0, 1)
+    else:
+        facial_expression = 3.0
+
+    return {
+        "posture": _clip_score(posture_score),
+        "facial_expression": _clip_score(facial_expression),
+        "eye_contact": _clip_score(eye_contact),
+        "gestures": _clip_score(gestures),
+    }
+
+def clear_frame_metrics(interview_id: int) -> None:
+    """
+    면접별 프레임 분석 시계열 삭제 (녹화 영상 재분석 시 사용)
+    """
+    path = get_frame_metrics_path(interview_id)
+    with _append_lock:
+        if os.path.exists(path):
+            os.remove(path)
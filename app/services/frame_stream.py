@@ -0,0 +1,101 @@
+from typing import Optional, Dict, Any, Tuple
+from datetime import datetime
+import asyncio
+import logging
+from fastapi import WebSocket, WebSocketDisconnect
+
+from app.services.frame_analyzer import analyze_frames_async, forget_interview
+from app.services.frame_metrics import append_frame_metrics
+
+logger = logging.getLogger(__name__)
+
+class LatestFrameSlot:
+    """
+    최신 프레임 1장만 보관하는 슬롯 (분석이 밀리면 이전 프레임은 버림)
+    """
+
+    def __init__(self):
+        self._frame: Optional[Tuple[int, bytes, float]] = None
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def put(self, seq: int, frame_data: bytes, received_at: float) -> None:
+        """
+        새 프레임과 수신 시각 저장 (아직 분석되지 않은 프레임이 있으면 교체하고 버린 수 증가)
+        """
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = (seq, frame_data, received_at)
+        self._ready.set()
+
+    async def take(self) -> Tuple[int, bytes, float]:
+        """
+        가장 최근 프레임을 꺼냄 (없으면 도착할 때까지 대기)
+        """
+        await self._ready.wait()
+        self._ready.clear()
+        frame, self._frame = self._frame, None
+        return frame
+
+def compact_frame_result(seq: int, result: Dict[str, Any], dropped: int) -> Dict[str, Any]:
+    """
+    실시간 피드백용 축약 분석 결과
+
+    seq: 프레임 번호, ts: 타임스탬프, face: 얼굴 검출 여부, gaze: 시선 이탈 정도,
+    eye: 눈 맞춤 여부, posture: 어깨 기울기(도), expr: 표정 강도, dropped: 누적 버린 프레임 수
+    """
+    if "error" in result:
+        return {"seq": seq, "error": result["error"], "dropped": dropped}
+
+    def _round(value: Optional[float], digits: int) -> Optional[float]:
+        return None if value is None else round(value, digits)
+
+    return {
+        "seq": seq,
+        "ts": result.get("timestamp"),
+        "face": result.get("face_detected", False),
+        "gaze": _round(result.get("gaze"), 3),
+        "eye": result.get("eye_contact", False),
+        "posture": _round(result.get("posture_angle"), 1),
+        "expr": _round(result.get("expression"), 3),
+        "dropped": dropped,
+    }
+
+async def run_frame_stream(websocket: WebSocket, interview_id: int) -> None:
+    """
+    바이너리 JPEG 프레임을 받아 분석 결과를 실시간으로 회신 (수신과 분석을 분리해 오래된 프레임은 건너뜀)
+    """
+    slot = LatestFrameSlot()
+
+    async def receive_frames() -> None:
+        seq = 0
+        while True:
+            frame_data = await websocket.receive_bytes()
+            seq += 1
+            slot.put(seq, frame_data, datetime.now().timestamp())
+
+    async def analyze_and_reply() -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            seq, frame_data, received_at = await slot.take()
+            result = (await analyze_frames_async([frame_data], interview_id=interview_id, timestamps=[received_at]))[0]
+            await websocket.send_json(compact_frame_result(seq, result, slot.dropped))
+            # 비언어적 평가를 위한 시계열 저장 (파일 쓰기는 스레드풀에서)
+            await loop.run_in_executor(None, append_frame_metrics, interview_id, [result])
+
+    tasks = [
+        asyncio.create_task(receive_frames()),
+        asyncio.create_task(analyze_and_reply()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exc = task.exception()
+            if exc and not isinstance(exc, WebSocketDisconnect):
+                logger.error(f"면접 ID {interview_id} 실시간 프레임 분석 실패: {exc}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        forget_interview(interview_id)
+        logger.info(f"면접 ID {interview_id} 실시간 프레임 분석 종료 (버린 프레임 {slot.dropped}개)")
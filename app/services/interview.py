@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 import redis
 import json
@@ -8,8 +8,16 @@ import openai
 import logging
 
 from app.models.interview import Interview, Answer
+from app.models.evaluation import Evaluation
 from app.schemas.interview import InterviewCreate, InterviewUpdate, AnswerCreate, STTChunk
 from app.core.config import settings
+from app.services.speech_metrics import save_chunk_with_stats, save_speech_metrics
+from app.services.stats import increment_counters, interview_status_deltas, evaluation_deltas, merge_deltas
+from app.services.dashboard_cache import invalidate_dashboard_cache
+from app.services.analytics import (
+    interview_rollup_key, apply_interview_rollup, evaluation_buckets_for_interview, rebuild_evaluation_rollup
+)
+from app.services.cohorts import rebuild_cohort_month, cohort_month
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +27,18 @@ def get_interview(db: Session, interview_id: int) -> Optional[Interview]:
     """
     return db.query(Interview).filter(Interview.id == interview_id).first()
 
+def get_interview_for_update(db: Session, interview_id: int) -> Optional[Interview]:
+    """
+    ID로 면접 조회 후 행 잠금 (상태 변경 시 이전 상태를 기준으로 카운터/롤업을 계산하므로 동시 변경 방지)
+    """
+    return (
+        db.query(Interview)
+        .filter(Interview.id == interview_id)
+        .with_for_update()
+        .populate_existing()
+        .first()
+    )
+
 def get_interviews(db: Session, skip: int = 0, limit: int = 100):
     """
     면접 목록 조회
@@ -42,7 +62,12 @@ def create_interview(db: Session, interview_in: InterviewCreate, interviewer_id:
         status="scheduled"
     )
     db.add(db_interview)
+    db.flush()
+    db.refresh(db_interview, ["start_time"])  # 서버 기본값(시작 시각)으로 롤업 버킷 결정
+    increment_counters(db, interview_status_deltas(None, db_interview.status))
+    apply_interview_rollup(db, None, interview_rollup_key(db_interview))
     db.commit()
+    invalidate_dashboard_cache()
     db.refresh(db_interview)
     return db_interview
 
@@ -50,17 +75,23 @@ def update_interview(db: Session, interview_id: int, interview_in: InterviewUpda
     """
     면접 정보 업데이트
     """
-    db_interview = get_interview(db, interview_id)
+    db_interview = get_interview_for_update(db, interview_id)
     if not db_interview:
         return None
     
     update_data = interview_in.dict(exclude_unset=True)
+    old_status = db_interview.status
+    old_rollup_key = interview_rollup_key(db_interview)
     
     for field, value in update_data.items():
         setattr(db_interview, field, value)
     
     db.add(db_interview)
+    increment_counters(db, interview_status_deltas(old_status, db_interview.status))
+    apply_interview_rollup(db, old_rollup_key, interview_rollup_key(db_interview))
     db.commit()
+    if db_interview.status != old_status:
+        invalidate_dashboard_cache()
     db.refresh(db_interview)
     return db_interview
 
@@ -68,27 +99,48 @@ def delete_interview(db: Session, interview_id: int) -> bool:
     """
     면접 삭제
     """
-    db_interview = get_interview(db, interview_id)
+    db_interview = get_interview_for_update(db, interview_id)
     if not db_interview:
         return False
     
+    # 함께 삭제되는 평가도 카운터에서 제외
+    evaluation_scores = db.query(Evaluation.total_score).filter(Evaluation.interview_id == interview_id).all()
+    increment_counters(db, merge_deltas(
+        interview_status_deltas(db_interview.status, None),
+        *[evaluation_deltas(total_score, -1) for total_score, in evaluation_scores]
+    ))
+    
+    old_rollup_key = interview_rollup_key(db_interview)
+    evaluation_buckets = evaluation_buckets_for_interview(db, db_interview)
+    
     db.delete(db_interview)
+    db.flush()
+    apply_interview_rollup(db, old_rollup_key, None)
+    for day, interviewer_id in evaluation_buckets:
+        rebuild_evaluation_rollup(db, day, interviewer_id)
+    for month in sorted({cohort_month(day) for day, _ in evaluation_buckets}):
+        rebuild_cohort_month(db, month)
     db.commit()
+    invalidate_dashboard_cache()
     return True
 
 def start_interview(db: Session, interview_id: int) -> Optional[Interview]:
     """
     면접 시작
     """
-    db_interview = get_interview(db, interview_id)
+    db_interview = get_interview_for_update(db, interview_id)
     if not db_interview:
         return None
     
+    increment_counters(db, interview_status_deltas(db_interview.status, "in_progress"))
+    old_rollup_key = interview_rollup_key(db_interview)
     db_interview.status = "in_progress"
     db_interview.start_time = datetime.now()
     
     db.add(db_interview)
+    apply_interview_rollup(db, old_rollup_key, interview_rollup_key(db_interview))
     db.commit()
+    invalidate_dashboard_cache()
     db.refresh(db_interview)
     return db_interview
 
@@ -96,15 +148,19 @@ def end_interview(db: Session, interview_id: int) -> Optional[Interview]:
     """
     면접 종료
     """
-    db_interview = get_interview(db, interview_id)
+    db_interview = get_interview_for_update(db, interview_id)
     if not db_interview:
         return None
     
+    increment_counters(db, interview_status_deltas(db_interview.status, "completed"))
+    old_rollup_key = interview_rollup_key(db_interview)
     db_interview.status = "completed"
     db_interview.end_time = datetime.now()
     
     db.add(db_interview)
+    apply_interview_rollup(db, old_rollup_key, interview_rollup_key(db_interview))
     db.commit()
+    invalidate_dashboard_cache()
     db.refresh(db_interview)
     return db_interview
 
@@ -130,19 +186,34 @@ def get_answers_by_interview(db: Session, interview_id: int) -> List[Answer]:
     """
     return db.query(Answer).filter(Answer.interview_id == interview_id).all()
 
+def get_answer_offsets(db: Session, interview: Interview) -> List[Tuple[int, float, float]]:
+    """
+    답변별 구간 (질문 인덱스, 시작 초, 종료 초), 면접 시작 시각 기준, 시작 순 정렬
+    """
+    if not interview.start_time:
+        return []
+    offsets = []
+    for answer in get_answers_by_interview(db, interview.id):
+        if answer.start_time and answer.end_time:
+            start = (answer.start_time - interview.start_time).total_seconds()
+            end = (answer.end_time - interview.start_time).total_seconds()
+            if end > start:
+                offsets.append((answer.question_index, max(start, 0.0), end))
+    return sorted(offsets, key=lambda offset: offset[1])
+
 def save_stt_chunk(redis_client: redis.Redis, chunk: STTChunk) -> bool:
     """
-    STT 청크 저장 (Redis)
+    STT 청크 저장 (Redis, 질문별 발화 통계도 함께 갱신)
     """
     try:
         # Redis 키 형식: stt:{interview_id}:{question_index}:{timestamp}
         key = f"stt:{chunk.interview_id}:{chunk.question_index}:{chunk.timestamp}"
-        redis_client.set(key, chunk.content, ex=86400)  # 24시간 유효
         
         # 해당 질문에 대한 모든 청크 키를 저장하는 세트
         set_key = f"stt_chunks:{chunk.interview_id}:{chunk.question_index}"
-        redis_client.sadd(set_key, key)
-        redis_client.expire(set_key, 86400)  # 24시간 유효
+        
+        # 청크, 세트, 발화 통계(어절/간투사 수, 시작/끝 타임스탬프)를 한 번에 저장 (24시간 유효)
+        save_chunk_with_stats(redis_client, chunk, key, set_key, 86400)
         
         return True
     except Exception as e:
@@ -163,10 +234,10 @@ def get_stt_chunks(redis_client: redis.Redis, interview_id: int, question_index:
             content = redis_client.get(key)
             if content:
                 # 키에서 타임스탬프 추출
-                timestamp = float(key.decode().split(":")[-1])
+                timestamp = float(key.split(":")[-1])
                 chunks.append({
                     "timestamp": timestamp,
-                    "content": content.decode()
+                    "content": content
                 })
         
         # 타임스탬프 기준 정렬
@@ -200,6 +271,9 @@ def save_final_stt(db: Session, redis_client: redis.Redis, interview_id: int) ->
         with open(stt_path, "w", encoding="utf-8") as f:
             json.dump(all_stt_content, f, ensure_ascii=False, indent=2)
         
+        # 발화 지표도 함께 저장 (Redis 통계는 청크와 같이 만료되므로 이후 평가는 파일 사용)
+        save_speech_metrics(redis_client, interview_id)
+        
         # 면접 정보 업데이트
         db_interview.stt_path = f"stt/{stt_filename}"
         db.add(db_interview)
@@ -0,0 +1,127 @@
+from typing import Optional
+import threading
+import time
+import logging
+import redis
+
+logger = logging.getLogger(__name__)
+
+# 토큰이 일치할 때만 삭제 (다른 소유자의 락 해제 방지)
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 토큰이 일치할 때만 임대 기간 연장
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+class RedisLock:
+    """
+    임대 기간(lease)과 펜싱 토큰을 사용하는 Redis 분산 락
+
+    - 락 획득 시 단조 증가하는 펜싱 토큰을 발급받아 락 값으로 저장
+    - 보유 중에는 백그라운드 스레드가 임대 기간을 주기적으로 연장
+    - 결과 저장 직전 is_held()로 토큰을 확인하여 임대가 만료된 작업의 쓰기를 차단
+    """
+
+    def __init__(self, redis_client: redis.Redis, name: str, lease_ms: int = 60000, auto_renew: bool = True):
+        self.redis_client = redis_client
+        self.name = name
+        self.fence_key = f"{name}:fence"
+        self.lease_ms = lease_ms
+        self.auto_renew = auto_renew
+        self.token: Optional[int] = None
+        self._stop_renew = threading.Event()
+        self._renew_thread: Optional[threading.Thread] = None
+
+    def acquire(self) -> bool:
+        """
+        락 획득 시도 (비차단), 성공 시 펜싱 토큰 보관
+        """
+        token = self.redis_client.incr(self.fence_key)
+        if not self.redis_client.set(self.name, str(token), nx=True, px=self.lease_ms):
+            return False
+
+        self.token = token
+        if self.auto_renew:
+            self._start_renew()
+        return True
+
+    def is_held(self) -> bool:
+        """
+        현재 락이 여전히 이 소유자의 펜싱 토큰으로 유지되고 있는지 확인
+        """
+        if self.token is None:
+            return False
+        value = self.redis_client.get(self.name)
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value == str(self.token)
+
+    def release(self) -> None:
+        """
+        락 해제 (토큰이 일치하는 경우에만)
+        """
+        self._stop_renew.set()
+        if self._renew_thread:
+            self._renew_thread.join(timeout=1)
+            self._renew_thread = None
+
+        if self.token is None:
+            return
+        try:
+            self.redis_client.eval(_RELEASE_SCRIPT, 1, self.name, str(self.token))
+        except redis.RedisError as e:
+            logger.error(f"락 해제 실패 ({self.name}): {e}")
+        finally:
+            self.token = None
+
+    def wait_released(self, timeout: float, poll_interval: float = 0.5) -> bool:
+        """
+        다른 소유자가 락을 해제(또는 임대 만료)할 때까지 대기
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.redis_client.exists(self.name):
+                return True
+            time.sleep(poll_interval)
+        return False
+
+    def _start_renew(self) -> None:
+        """
+        임대 기간 자동 연장 스레드 시작
+        """
+        self._stop_renew.clear()
+        self._renew_thread = threading.Thread(
+            target=self._renew_loop,
+            name=f"lock-renew-{self.name}",
+            daemon=True
+        )
+        self._renew_thread.start()
+
+    def _renew_loop(self) -> None:
+        """
+        임대 기간의 1/3 주기로 락 연장, 토큰이 바뀌었으면 중단
+        """
+        interval = self.lease_ms / 1000 / 3
+        while not self._stop_renew.wait(interval):
+            try:
+                renewed = self.redis_client.eval(_RENEW_SCRIPT, 1, self.name, str(self.token), self.lease_ms)
+                if not renewed:
+                    logger.warning(f"락 임대가 만료되어 연장하지 못했습니다 ({self.name}, 토큰 {self.token})")
+                    return
+            except redis.RedisError as e:
+                logger.error(f"락 연장 실패 ({self.name}): {e}")
+
+    def __enter__(self) -> "RedisLock":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
@@ -1,7 +1,6 @@
 import os
 import logging
 import ffmpeg
-import tempfile
 import base64
 import json
 from typing import Optional, List, Dict, Any
@@ -11,7 +10,9 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.models.interview import Interview
+from app.schemas.interview import InterviewUpdate
 from app.services.interview import get_interview, update_interview
+from app.services.frame_analyzer import analyze_frames
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ def merge_video_chunks(db: Session, interview_id: int) -> Optional[str]:
         
         # 면접 정보 업데이트
         relative_path = f"videos/interview_{interview_id}.mp4"
-        update_interview(db, interview_id, {"video_path": relative_path})
+        update_interview(db, interview_id, InterviewUpdate(video_path=relative_path))
         
         return relative_path
     except Exception as e:
@@ -156,7 +157,7 @@ def merge_audio_chunks(db: Session, interview_id: int) -> Optional[str]:
         
         # 면접 정보 업데이트
         relative_path = f"audios/interview_{interview_id}.mp3"
-        update_interview(db, interview_id, {"audio_path": relative_path})
+        update_interview(db, interview_id, InterviewUpdate(audio_path=relative_path))
         
         return relative_path
     except Exception as e:
@@ -201,33 +202,14 @@ def decode_base64_video(base64_data: str) -> Optional[bytes]:
         logger.error(f"Base64 비디오 디코딩 실패: {e}")
         return None
 
-def process_video_frame(frame_data: bytes) -> Dict[str, Any]:
+def process_video_frame(frame_data: bytes, interview_id: Optional[int] = None) -> Dict[str, Any]:
     """
-    비디오 프레임 처리 (Computer Vision 분석)
+    비디오 프레임 처리 (Computer Vision 분석, 메모리에서 디코딩)
+    
+    interview_id가 주어지면 직전 분석 프레임과 거의 같은 프레임은 이전 결과를 재사용
     """
     try:
-        # 실제 구현에서는 mediapipe 또는 openCV를 사용한 분석 수행
-        # 현재는 가상 데이터 반환
-        
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
-            temp_file.write(frame_data)
-            temp_file_path = temp_file.name
-        
-        # 여기서 실제 Computer Vision 분석 수행
-        # 예: face_landmarks = analyze_face(temp_file_path)
-        
-        # 임시 파일 삭제
-        os.unlink(temp_file_path)
-        
-        # 가상 분석 결과 반환
-        return {
-            "face_detected": True,
-            "emotion": "neutral",
-            "eye_contact": True,
-            "posture": "good",
-            "timestamp": datetime.now().timestamp()
-        }
+        return analyze_frames([frame_data], interview_id=interview_id)[0]
     except Exception as e:
         logger.error(f"비디오 프레임 처리 실패: {e}")
         return {
@@ -0,0 +1,119 @@
+from typing import Optional, List, Iterator
+import io
+import os
+import struct
+import logging
+import ffmpeg
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 모든 음성 처리(STT, 음성 분석)가 공유하는 정규화 형식: 16kHz 모노 16비트 PCM (리틀 엔디언)
+PCM_SAMPLE_RATE = 16000
+PCM_SAMPLE_WIDTH = 2
+
+def decode_to_pcm(audio_data: bytes) -> Optional[bytes]:
+    """
+    오디오 청크(WebM 등)를 16kHz 모노 PCM으로 디코딩 (파이프 사용, 임시 파일 없음)
+    """
+    try:
+        pcm, _ = (
+            ffmpeg
+            .input("pipe:")
+            .output("pipe:", format="s16le", acodec="pcm_s16le", ac=1, ar=PCM_SAMPLE_RATE)
+            .global_args("-loglevel", "error", "-nostdin")
+            .run(input=audio_data, capture_stdout=True, capture_stderr=True)
+        )
+        return pcm
+    except ffmpeg.Error as e:
+        logger.error(f"오디오 PCM 변환 실패: {e.stderr.decode(errors='ignore') if e.stderr else e}")
+        return None
+
+def get_pcm_chunk_dir(interview_id: int) -> str:
+    """
+    면접별 PCM 청크 디렉토리 (원본 오디오 청크와 같은 위치)
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "audios", f"interview_{interview_id}")
+
+def save_pcm_chunk(interview_id: int, pcm: bytes, chunk_index: int) -> Optional[str]:
+    """
+    정규화된 PCM 청크 저장
+    """
+    try:
+        pcm_dir = get_pcm_chunk_dir(interview_id)
+        os.makedirs(pcm_dir, exist_ok=True)
+
+        pcm_path = os.path.join(pcm_dir, f"chunk_{chunk_index}.pcm")
+        with open(pcm_path, "wb") as f:
+            f.write(pcm)
+
+        return pcm_path
+    except Exception as e:
+        logger.error(f"PCM 청크 저장 실패: {e}")
+        return None
+
+def list_pcm_chunks(interview_id: int) -> List[str]:
+    """
+    면접별 PCM 청크 파일 목록 (청크 순서대로)
+    """
+    pcm_dir = get_pcm_chunk_dir(interview_id)
+    if not os.path.exists(pcm_dir):
+        return []
+
+    chunk_files = [f for f in os.listdir(pcm_dir) if f.startswith("chunk_") and f.endswith(".pcm")]
+    chunk_files.sort(key=lambda x: int(x.split("_")[1].split(".")[0]))
+    return [os.path.join(pcm_dir, chunk_file) for chunk_file in chunk_files]
+
+def load_pcm(pcm_path: str) -> np.ndarray:
+    """
+    PCM 파일을 메모리 맵으로 조회 (복사 없이 int16 배열로 접근)
+    """
+    if os.path.getsize(pcm_path) < PCM_SAMPLE_WIDTH:
+        return np.zeros(0, dtype="<i2")
+    return np.memmap(pcm_path, dtype="<i2", mode="r")
+
+def iter_pcm_frames(pcm_paths: List[str], frame_samples: int, block_frames: int) -> Iterator[np.ndarray]:
+    """
+    PCM 청크 파일들을 이어서 (block_frames x frame_samples) float32 프레임 행렬 단위로 순차 반환
+
+    파일 경계에 걸친 프레임은 다음 파일과 이어 붙여 처리
+    """
+    block_samples = frame_samples * block_frames
+    carry = np.zeros(0, dtype="<i2")
+    for pcm_path in pcm_paths:
+        samples = load_pcm(pcm_path)
+        offset = 0
+        if len(carry):
+            head = samples[:frame_samples - len(carry)]
+            carry = np.concatenate([carry, head])
+            offset = len(head)
+            if len(carry) < frame_samples:
+                continue
+            yield (carry.astype(np.float32) / 32768.0).reshape(1, frame_samples)
+            carry = np.zeros(0, dtype="<i2")
+
+        while len(samples) - offset >= frame_samples:
+            usable = min(block_samples, (len(samples) - offset) // frame_samples * frame_samples)
+            block = samples[offset:offset + usable]
+            yield (block.astype(np.float32) / 32768.0).reshape(-1, frame_samples)
+            offset += usable
+
+        carry = np.array(samples[offset:])
+
+def pcm_to_wav(pcm: bytes, name: str = "audio.wav") -> io.BytesIO:
+    """
+    PCM 데이터에 WAV 헤더를 붙인 메모리 파일 (파일 업로드 API용, name 속성으로 형식 판별)
+    """
+    data_size = len(pcm)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, PCM_SAMPLE_RATE,
+        PCM_SAMPLE_RATE * PCM_SAMPLE_WIDTH, PCM_SAMPLE_WIDTH, PCM_SAMPLE_WIDTH * 8,
+        b"data", data_size
+    )
+    buffer = io.BytesIO(header + pcm)
+    buffer.name = name
+    return buffer
@@ -0,0 +1,238 @@
+from typing import Optional, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from xml.sax.saxutils import escape
+import os
+import json
+import hashlib
+import logging
+import threading
+import multiprocessing
+from reportlab import rl_config
+from reportlab.lib.pagesizes import letter
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 한글 출력용 CID 폰트 (reportlab 내장, 별도 폰트 파일 불필요)
+KOREAN_FONT = "HYSMyeongJo-Medium"
+
+# 리포트 양식 버전 (레이아웃/스타일을 바꾸면 올려서 기존 리포트를 모두 다시 생성)
+REPORT_TEMPLATE_VERSION = "2"
+
+def report_digest(snapshot: Dict[str, Any]) -> str:
+    """
+    평가 스냅샷과 양식 버전의 SHA-256 해시 (리포트 파일명 및 ETag로 사용)
+    """
+    payload = json.dumps(snapshot, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{REPORT_TEMPLATE_VERSION}\n{payload}".encode("utf-8")).hexdigest()
+
+def get_report_path(snapshot: Dict[str, Any]) -> str:
+    """
+    리포트 상대 경로 (평가별 디렉토리 아래 내용 해시 파일명, 데이터가 바뀌면 경로도 바뀜)
+    """
+    return f"reports/evaluation_{snapshot['evaluation_id']}/{report_digest(snapshot)}.pdf"
+
+# ---------------------------------------------------------------------------
+# 워커 프로세스 측 (프로세스당 1회 폰트 등록 및 스타일 생성)
+# ---------------------------------------------------------------------------
+
+_styles: Dict[str, ParagraphStyle] = {}
+_table_style_commands: List[tuple] = []
+
+def _init_report_worker() -> None:
+    """
+    워커 초기화: 한글 폰트 등록, 문단/표 스타일 생성
+    """
+    if _styles:
+        return
+
+    # 같은 입력이면 바이트 단위로 같은 PDF가 나오도록 생성 시각/문서 ID 고정 (ETag 일관성)
+    rl_config.invariant = 1
+    pdfmetrics.registerFont(UnicodeCIDFont(KOREAN_FONT))
+    base = getSampleStyleSheet()
+    _styles["title"] = ParagraphStyle("ReportTitle", parent=base["Title"], fontName=KOREAN_FONT, fontSize=16, spaceAfter=12)
+    _styles["heading"] = ParagraphStyle("ReportHeading", parent=base["Heading2"], fontName=KOREAN_FONT)
+    _styles["normal"] = ParagraphStyle("ReportNormal", parent=base["Normal"], fontName=KOREAN_FONT)
+    _table_style_commands.extend([
+        ("FONTNAME", (0, 0), (-1, -1), KOREAN_FONT),
+        ("BACKGROUND", (0, 0), (1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (1, 0), "CENTER"),
+        ("BOTTOMPADDING", (0, 0), (1, 0), 12),
+        ("BACKGROUND", (0, 1), (1, 1), colors.lightblue),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ])
+
+def _ping() -> bool:
+    """
+    워커 예열용 빈 작업
+    """
+    return True
+
+def render_report(snapshot: Dict[str, Any], output_path: str) -> str:
+    """
+    평가 스냅샷(dict)으로 PDF 리포트 생성 (완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체)
+    """
+    _init_report_worker()
+    styles = _styles
+    elements = []
+
+    # 제목
+    elements.append(Paragraph("SK AXIS 면접 평가 리포트", styles["title"]))
+    elements.append(Spacer(1, 0.25 * inch))
+
+    # 기본 정보
+    elements.append(Paragraph(f"지원자: {escape(snapshot['candidate_name'])}", styles["normal"]))
+    elements.append(Paragraph(f"면접 일시: {snapshot.get('interview_time') or '-'}", styles["normal"]))
+    elements.append(Paragraph(f"총점: {snapshot['total_score']:.1f}/100", styles["normal"]))
+    elements.append(Spacer(1, 0.25 * inch))
+
+    # 평가 결과 테이블
+    data = [["평가 영역", "점수 (5점 만점)"]]
+
+    # 언어적 측면
+    data.append(["언어적 측면", f"{snapshot['verbal_score']/settings.SCORE_SCALE:.1f}"])
+    verbal_scores = snapshot.get("verbal", {})
+    for criteria, score in verbal_scores.items():
+        data.append([f"  - {criteria.capitalize()}", f"{score:.1f}"])
+
+    # 비언어적 측면
+    data.append(["비언어적 측면", f"{snapshot['nonverbal_score']/settings.SCORE_SCALE:.1f}"])
+    for criteria, score in snapshot.get("nonverbal", {}).items():
+        data.append([f"  - {criteria.capitalize()}", f"{score:.1f}"])
+
+    table = Table(data, colWidths=[4*inch, 1*inch])
+    table.setStyle(TableStyle(_table_style_commands + [
+        ("BACKGROUND", (0, len(verbal_scores)+2), (1, len(verbal_scores)+2), colors.lightblue),
+    ]))
+    elements.append(table)
+    elements.append(Spacer(1, 0.25 * inch))
+
+    # 피드백
+    elements.append(Paragraph("종합 피드백:", styles["heading"]))
+    for p in (snapshot.get("feedback") or "").split("\n"):
+        if p.strip():
+            elements.append(Paragraph(escape(p), styles["normal"]))
+            elements.append(Spacer(1, 0.1 * inch))
+
+    # PDF 생성
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    SimpleDocTemplate(temp_path, pagesize=letter).build(elements)
+    os.replace(temp_path, output_path)
+    return output_path
+
+def _remove_stale_reports(report_path: str) -> None:
+    """
+    같은 평가의 이전 버전 리포트 삭제
+    """
+    report_dir = os.path.dirname(report_path)
+    current = os.path.basename(report_path)
+    for filename in os.listdir(report_dir):
+        if filename != current and filename.endswith(".pdf"):
+            try:
+                os.remove(os.path.join(report_dir, filename))
+            except OSError:
+                pass
+
+def _render_to_reports_dir(snapshot: Dict[str, Any]) -> str:
+    """
+    reports 디렉토리에 리포트 생성 후 상대 경로 반환 (같은 내용의 리포트가 있으면 생성 생략)
+    """
+    relative_path = get_report_path(snapshot)
+    output_path = os.path.join(settings.MEDIA_STORAGE_PATH, relative_path)
+    if not os.path.exists(output_path):
+        render_report(snapshot, output_path)
+        _remove_stale_reports(output_path)
+    return relative_path
+
+# ---------------------------------------------------------------------------
+# 메인 프로세스 측
+# ---------------------------------------------------------------------------
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_report_renderer() -> ProcessPoolExecutor:
+    """
+    리포트 렌더링 프로세스 풀 조회 (최초 호출 시 생성)
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.REPORT_RENDER_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_report_worker
+                )
+    return _executor
+
+def warm_up_report_renderer() -> None:
+    """
+    렌더링 워커를 미리 띄워 폰트/스타일 로드 (서버 시작 시 호출)
+    """
+    try:
+        executor = get_report_renderer()
+        for future in [executor.submit(_ping) for _ in range(settings.REPORT_RENDER_WORKERS)]:
+            future.result()
+        logger.info(f"리포트 렌더링 워커 {settings.REPORT_RENDER_WORKERS}개 준비 완료")
+    except Exception as e:
+        logger.error(f"리포트 렌더링 워커 예열 실패: {e}")
+
+def shutdown_report_renderer() -> None:
+    """
+    리포트 렌더링 프로세스 풀 종료
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+def render_reports(snapshots: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """
+    여러 리포트를 프로세스 풀에서 병렬 생성 (입력 순서대로 상대 경로 반환, 실패한 항목은 None)
+    """
+    # 이미 같은 내용으로 생성된 리포트는 워커에 보내지 않음
+    results: List[Optional[str]] = [None] * len(snapshots)
+    pending = []
+    for i, snapshot in enumerate(snapshots):
+        relative_path = get_report_path(snapshot)
+        if os.path.exists(os.path.join(settings.MEDIA_STORAGE_PATH, relative_path)):
+            results[i] = relative_path
+        else:
+            pending.append(i)
+    if not pending:
+        return results
+
+    try:
+        executor = get_report_renderer()
+        futures = [executor.submit(_render_to_reports_dir, snapshots[i]) for i in pending]
+    except BrokenProcessPool:
+        # 워커가 비정상 종료된 풀은 재사용할 수 없으므로 새로 생성
+        shutdown_report_renderer()
+        executor = get_report_renderer()
+        futures = [executor.submit(_render_to_reports_dir, snapshots[i]) for i in pending]
+
+    broken = False
+    for i, future in zip(pending, futures):
+        snapshot = snapshots[i]
+        try:
+            results[i] = future.result()
+        except Exception as e:
+            broken = broken or isinstance(e, BrokenProcessPool)
+            logger.error(f"평가 ID {snapshot.get('evaluation_id')} 리포트 렌더링 실패: {e}")
+
+    if broken:
+        shutdown_report_renderer()
+    return results
@@ -0,0 +1,377 @@
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import threading
+import logging
+import redis
+import numpy as np
+
+from app.core.config import settings
+from app.db.session import SessionLocal, redis_client
+from app.models.evaluation import Evaluation
+from app.models.scoring import ScoringWeights
+from app.schemas.scoring import ScoringWeightsCreate
+from app.services.lock import RedisLock
+from app.services.stats import reconcile_stat_counters
+from app.services.analytics import rebuild_evaluation_rollups
+from app.services.cohorts import rebuild_cohorts
+from app.services.dashboard_cache import invalidate_dashboard_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEIGHTS_VERSION = 0  # 저장된 버전이 없을 때 사용하는 설정값 기반 가중치
+SCORING_VERSION_KEY = "scoring_version"  # detailed_scores에 기록하는 적용 가중치 버전
+RESCORE_LOCK_NAME = "lock:scoring:rescore"
+
+class RescoreSuperseded(Exception):
+    """
+    재채점 중 더 최신 가중치 버전이 활성화됨
+    """
+
+# ---------------------------------------------------------------------------
+# 가중치 버전
+# ---------------------------------------------------------------------------
+
+def default_scoring_weights() -> ScoringWeights:
+    """
+    설정값 기반 기본 가중치 (DB에 저장하지 않는 버전 0)
+    """
+    return ScoringWeights(
+        version=DEFAULT_WEIGHTS_VERSION,
+        category_weights=dict(settings.SCORING_CATEGORY_WEIGHTS),
+        criteria_weights={},
+        is_active=True
+    )
+
+def get_active_scoring_weights(db: Session, lock: bool = False) -> ScoringWeights:
+    """
+    새 평가에 적용할 가중치 (활성 버전이 없으면 기본 가중치)
+
+    lock이면 커밋까지 공유 잠금을 유지해, 저장 중인 평가가 끝날 때까지 다른 버전의 활성화를 대기시킴
+    (재채점이 시작된 뒤 이전 가중치로 계산된 평가가 저장되는 경쟁 방지)
+    """
+    query = (
+        db.query(ScoringWeights)
+        .filter(ScoringWeights.is_active.is_(True))
+        .order_by(ScoringWeights.version.desc())
+    )
+    if lock:
+        query = query.with_for_update(read=True)
+    weights = query.first()
+    return weights or default_scoring_weights()
+
+def get_scoring_weights(db: Session, version: int) -> Optional[ScoringWeights]:
+    """
+    버전으로 가중치 조회
+    """
+    return db.query(ScoringWeights).filter(ScoringWeights.version == version).first()
+
+def get_scoring_weights_list(db: Session) -> List[ScoringWeights]:
+    """
+    가중치 버전 목록 (최신순)
+    """
+    return db.query(ScoringWeights).order_by(ScoringWeights.version.desc()).all()
+
+def validate_scoring_weights(category_weights: Dict[str, float], criteria_weights: Optional[Dict[str, Dict[str, float]]]) -> None:
+    """
+    가중치 검증 (영역은 평가 기준 설정과 같아야 하고, 가중치는 0 이상이며 영역 가중치 합은 0보다 커야 함)
+    """
+    categories = set(settings.EVALUATION_CRITERIA)
+    if set(category_weights) != categories:
+        raise ValueError(f"영역별 가중치는 {', '.join(sorted(categories))} 영역을 모두 포함해야 합니다")
+    if any(weight < 0 for weight in category_weights.values()) or sum(category_weights.values()) <= 0:
+        raise ValueError("영역별 가중치는 0 이상이고 합이 0보다 커야 합니다")
+    for category, weights in (criteria_weights or {}).items():
+        if category not in categories:
+            raise ValueError(f"알 수 없는 영역입니다: {category}")
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("기준별 가중치는 0 이상이어야 합니다")
+
+def create_scoring_weights(db: Session, weights_in: ScoringWeightsCreate) -> ScoringWeights:
+    """
+    새 가중치 버전 생성 (기존 버전은 수정하지 않으므로 어떤 가중치로 채점했는지 추적 가능)
+    """
+    validate_scoring_weights(weights_in.category_weights, weights_in.criteria_weights)
+    version = (db.query(func.max(ScoringWeights.version)).scalar() or DEFAULT_WEIGHTS_VERSION) + 1
+    db_weights = ScoringWeights(
+        version=version,
+        category_weights=weights_in.category_weights,
+        criteria_weights=weights_in.criteria_weights or {},
+        description=weights_in.description,
+        is_active=False
+    )
+    try:
+        db.add(db_weights)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise ValueError("같은 버전이 동시에 생성되었습니다. 다시 시도해주세요")
+    db.refresh(db_weights)
+    return db_weights
+
+def activate_scoring_weights(db: Session, version: int) -> Optional[ScoringWeights]:
+    """
+    가중치 버전 활성화 (이후 생성되는 평가에 적용, 기존 평가 재채점은 대기 상태로 표시)
+    """
+    db_weights = db.query(ScoringWeights).filter(ScoringWeights.version == version).with_for_update().first()
+    if not db_weights:
+        return None
+    db.query(ScoringWeights).filter(
+        ScoringWeights.version != version,
+        ScoringWeights.is_active.is_(True)
+    ).update({ScoringWeights.is_active: False}, synchronize_session=False)
+    db_weights.is_active = True
+    db_weights.rescore_status = "pending"
+    db_weights.rescored_count = 0
+    db_weights.rescore_error = None
+    db.commit()
+    db.refresh(db_weights)
+    return db_weights
+
+def _update_scoring_weights(db: Session, version: int, **fields: Any) -> None:
+    """
+    재채점 상태 갱신 후 즉시 커밋
+    """
+    db.query(ScoringWeights).filter(ScoringWeights.version == version).update(fields, synchronize_session=False)
+    db.commit()
+
+# ---------------------------------------------------------------------------
+# 점수 계산
+# ---------------------------------------------------------------------------
+
+def compute_scores_batch(detailed_scores_list: List[Dict[str, Any]], weights: ScoringWeights) -> Dict[str, np.ndarray]:
+    """
+    여러 평가의 기준별 점수(5점 만점)로 총점/영역 점수(100점 만점)를 한 번에 계산
+
+    - 평가 x 기준 점수 행렬을 만들어 영역별 가중 평균을 벡터 연산으로 계산 (없는 기준은 제외하고 가중치 재정규화)
+    - 총점은 점수가 있는 영역의 가중 평균, 계산할 수 없는 값은 NaN
+    """
+    categories = list(settings.EVALUATION_CRITERIA)
+    criteria_weights = weights.criteria_weights or {}
+
+    # 열: 설정된 평가 기준 + 저장된 점수에만 있는 기준
+    columns: List[Tuple[str, str]] = [
+        (category, criteria) for category in categories for criteria in settings.EVALUATION_CRITERIA[category]
+    ]
+    column_index = {column: i for i, column in enumerate(columns)}
+    for detailed_scores in detailed_scores_list:
+        for category in categories:
+            for criteria in (detailed_scores.get(category) or {}):
+                if (category, criteria) not in column_index:
+                    column_index[(category, criteria)] = len(columns)
+                    columns.append((category, criteria))
+
+    scores = np.full((len(detailed_scores_list), len(columns)), np.nan)
+    for row, detailed_scores in enumerate(detailed_scores_list):
+        for category in categories:
+            for criteria, score in (detailed_scores.get(category) or {}).items():
+                try:
+                    scores[row, column_index[(category, criteria)]] = float(score)
+                except (TypeError, ValueError):
+                    continue
+
+    present = ~np.isnan(scores)
+    values = np.where(present, scores, 0.0)
+    column_weights = np.array([
+        float(criteria_weights.get(category, {}).get(criteria, 1.0)) for category, criteria in columns
+    ])
+
+    category_scores = np.full((len(detailed_scores_list), len(categories)), np.nan)
+    for i, category in enumerate(categories):
+        mask = np.array([column_category == category for column_category, _ in columns]) * column_weights
+        weight_sum = present @ mask
+        with np.errstate(invalid="ignore", divide="ignore"):
+            category_scores[:, i] = np.where(weight_sum > 0, (values @ mask) / weight_sum, np.nan)
+
+    category_present = ~np.isnan(category_scores)
+    category_weights = np.array([float(weights.category_weights.get(category, 0.0)) for category in categories])
+    total_weight = category_present @ category_weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        total = np.where(total_weight > 0, (np.where(category_present, category_scores, 0.0) @ category_weights) / total_weight, np.nan)
+
+    result = {"total_score": total * settings.SCORE_SCALE}
+    for i, category in enumerate(categories):
+        result[f"{category}_score"] = category_scores[:, i] * settings.SCORE_SCALE
+    return result
+
+def _to_score(value: float) -> Optional[float]:
+    """
+    NaN -> None 변환 (DB 저장용)
+    """
+    return None if np.isnan(value) else float(value)
+
+def compute_scores(detailed_scores: Dict[str, Any], weights: ScoringWeights) -> Dict[str, Optional[float]]:
+    """
+    평가 1건의 총점/언어적/비언어적 점수 계산 (재채점과 같은 계산식)
+    """
+    result = compute_scores_batch([detailed_scores], weights)
+    return {
+        "total_score": _to_score(result["total_score"][0]),
+        "verbal_score": _to_score(result["verbal_score"][0]),
+        "nonverbal_score": _to_score(result["nonverbal_score"][0]),
+    }
+
+# ---------------------------------------------------------------------------
+# 재채점
+# ---------------------------------------------------------------------------
+
+def rescore_evaluations(db: Session, weights: ScoringWeights, batch_size: Optional[int] = None) -> int:
+    """
+    저장된 기준별 점수(detailed_scores)로 모든 평가의 점수 재계산, 재채점한 평가 수 반환 (LLM 재호출 없음)
+
+    ID 순 키셋 페이지로 배치를 읽어 벡터 연산으로 계산하고, 배치마다 기본 키 기준 일괄 UPDATE 후 커밋
+    더 최신 버전이 활성화되면 중단 (최신 버전의 재채점이 이어서 전체를 다시 계산)
+    """
+    batch_size = batch_size or settings.RESCORE_BATCH_SIZE
+    last_id = 0
+    rescored = 0
+    while True:
+        rows = (
+            db.query(Evaluation.id, Evaluation.detailed_scores)
+            .filter(Evaluation.id > last_id)
+            .order_by(Evaluation.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return rescored
+        last_id = rows[-1].id
+
+        rows = [row for row in rows if row.detailed_scores]
+        if rows:
+            result = compute_scores_batch([row.detailed_scores for row in rows], weights)
+            db.execute(update(Evaluation), [
+                {
+                    "id": row.id,
+                    "total_score": _to_score(result["total_score"][i]),
+                    "verbal_score": _to_score(result["verbal_score"][i]),
+                    "nonverbal_score": _to_score(result["nonverbal_score"][i]),
+                    "detailed_scores": {**row.detailed_scores, SCORING_VERSION_KEY: weights.version},
+                }
+                for i, row in enumerate(rows)
+            ])
+            rescored += len(rows)
+
+        is_active = db.query(ScoringWeights.is_active).filter(ScoringWeights.version == weights.version).scalar()
+        if weights.version != DEFAULT_WEIGHTS_VERSION and not is_active:
+            db.rollback()
+            raise RescoreSuperseded(f"가중치 버전 {weights.version}이 더 최신 버전으로 대체되어 재채점을 중단합니다")
+        if weights.version != DEFAULT_WEIGHTS_VERSION:
+            db.query(ScoringWeights).filter(ScoringWeights.version == weights.version).update(
+                {ScoringWeights.rescored_count: rescored}, synchronize_session=False
+            )
+        db.commit()
+
+def run_rescore_job(version: int) -> None:
+    """
+    가중치 버전으로 기존 평가 재채점 후 파생 데이터 재계산 (전용 워커에서 실행, 자체 DB 세션 사용)
+
+    총점이 바뀌므로 대시보드 카운터, 평가 롤업, 총점 코호트 스케치를 원본 기준으로 다시 계산
+    (면접 롤업과 기준별 코호트 스케치는 재채점으로 바뀌지 않음)
+    여러 서버에서 동시에 실행되지 않도록 락을 기다렸다가 실행
+    """
+    lock = RedisLock(redis_client, RESCORE_LOCK_NAME, lease_ms=60000)
+    try:
+        while not lock.acquire():
+            lock.wait_released(settings.EVALUATION_LOCK_WAIT_SECONDS)
+    except redis.RedisError as e:
+        logger.warning(f"재채점 락 획득 실패, 락 없이 진행: {e}")
+        lock = None
+
+    db = SessionLocal()
+    try:
+        weights = get_scoring_weights(db, version)
+        if not weights or not weights.is_active:
+            logger.info(f"가중치 버전 {version}이 활성 상태가 아니어서 재채점을 건너뜁니다")
+            if weights:
+                _update_scoring_weights(db, version, rescore_status="superseded")
+            return
+
+        if weights.rescore_status == "completed":
+            # 다른 서버가 락을 보유한 동안 같은 버전의 재채점을 이미 끝낸 경우
+            logger.info(f"가중치 버전 {version}은 이미 재채점되었습니다")
+            return
+
+        _update_scoring_weights(db, version, rescore_status="running", rescored_count=0, rescore_error=None)
+        rescored = rescore_evaluations(db, weights)
+
+        reconcile_stat_counters(db)
+        rebuild_evaluation_rollups(db)
+        rebuild_cohorts(db, total_only=True)
+        invalidate_dashboard_cache()
+
+        _update_scoring_weights(db, version, rescore_status="completed", rescored_at=datetime.now())
+        logger.info(f"가중치 버전 {version} 재채점 완료: {rescored}건")
+    except RescoreSuperseded as e:
+        logger.info(str(e))
+        _update_scoring_weights(db, version, rescore_status="superseded")
+    except Exception as e:
+        logger.error(f"가중치 버전 {version} 재채점 실패: {e}")
+        db.rollback()
+        try:
+            _update_scoring_weights(db, version, rescore_status="failed", rescore_error=str(e))
+        except Exception as update_error:
+            logger.error(f"가중치 버전 {version} 재채점 상태 기록 실패: {update_error}")
+    finally:
+        db.close()
+        if lock is not None:
+            lock.release()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_rescore_worker() -> ThreadPoolExecutor:
+    """
+    재채점 워커 조회 (최초 호출 시 생성, 재채점은 한 번에 하나씩 순서대로 실행)
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rescore-job")
+    return _executor
+
+def submit_rescore_job(version: int) -> None:
+    """
+    재채점 작업을 워커에 제출
+    """
+    get_rescore_worker().submit(run_rescore_job, version)
+
+def resume_rescore_jobs() -> int:
+    """
+    서버 재시작 등으로 중단된 재채점(pending, running) 다시 제출, 제출한 버전 수 반환
+
+    활성 상태가 아닌 버전은 실행 시 superseded로 정리됨
+    """
+    db = SessionLocal()
+    try:
+        versions = [
+            version for version, in
+            db.query(ScoringWeights.version)
+            .filter(ScoringWeights.rescore_status.in_(["pending", "running"]))
+            .order_by(ScoringWeights.version)
+        ]
+    except Exception as e:
+        logger.error(f"중단된 재채점 조회 실패: {e}")
+        return 0
+    finally:
+        db.close()
+
+    for version in versions:
+        submit_rescore_job(version)
+    if versions:
+        logger.info(f"중단된 재채점 재개: {versions}")
+    return len(versions)
+
+def shutdown_rescore_worker() -> None:
+    """
+    재채점 워커 종료 (대기 중인 작업은 취소, 중단된 재채점은 다음 시작 시 resume_rescore_jobs로 재개)
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
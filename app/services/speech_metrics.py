@@ -0,0 +1,169 @@
+from typing import Optional, Dict, Any
+import os
+import re
+import json
+import tempfile
+import logging
+import redis
+
+from app.core.config import settings
+from app.schemas.interview import STTChunk
+
+logger = logging.getLogger(__name__)
+
+# 간투사 (단독 어절만 집계, 늘여 말한 형태 포함: "음음", "으음", "어어")
+FILLER_PATTERN = re.compile(r"^(?:으?음+|어+|그+)$")
+_PUNCTUATION = ".,?!…~\"'()[]"
+
+# 청크 저장과 통계 갱신을 한 번에 수행 (이미 저장된 청크는 다시 집계하지 않음)
+# KEYS: 청크 키, 청크 세트 키, 통계 해시 키, 질문 번호 세트 키
+# ARGV: 내용, 유효 시간(초), 타임스탬프, 어절 수, 글자 수, 간투사 수, 질문 번호
+_SAVE_CHUNK_SCRIPT = """
+redis.call('set', KEYS[1], ARGV[1], 'EX', ARGV[2])
+local added = redis.call('sadd', KEYS[2], KEYS[1])
+redis.call('expire', KEYS[2], ARGV[2])
+if added == 1 then
+    redis.call('hincrby', KEYS[3], 'chunks', 1)
+    redis.call('hincrby', KEYS[3], 'words', ARGV[4])
+    redis.call('hincrby', KEYS[3], 'chars', ARGV[5])
+    redis.call('hincrby', KEYS[3], 'fillers', ARGV[6])
+    local ts = tonumber(ARGV[3])
+    local first = tonumber(redis.call('hget', KEYS[3], 'first_ts'))
+    local last = tonumber(redis.call('hget', KEYS[3], 'last_ts'))
+    if not first or ts < first then redis.call('hset', KEYS[3], 'first_ts', ARGV[3]) end
+    if not last or ts > last then redis.call('hset', KEYS[3], 'last_ts', ARGV[3]) end
+    redis.call('expire', KEYS[3], ARGV[2])
+    redis.call('sadd', KEYS[4], ARGV[7])
+    redis.call('expire', KEYS[4], ARGV[2])
+end
+return added
+"""
+
+def count_transcript(content: str) -> Dict[str, int]:
+    """
+    STT 청크 텍스트의 어절 수, 글자 수(공백 제외), 간투사 수 계산
+    """
+    words = [word.strip(_PUNCTUATION) for word in content.split()]
+    words = [word for word in words if word]
+    return {
+        "words": len(words),
+        "chars": sum(len(word) for word in words),
+        "fillers": sum(1 for word in words if FILLER_PATTERN.match(word)),
+    }
+
+def get_speech_stats_key(interview_id: int, question_index: int) -> str:
+    """
+    질문별 발화 통계 해시 키
+    """
+    return f"stt_stats:{interview_id}:{question_index}"
+
+def get_speech_questions_key(interview_id: int) -> str:
+    """
+    발화 통계가 기록된 질문 번호 세트 키
+    """
+    return f"stt_stats_questions:{interview_id}"
+
+def save_chunk_with_stats(redis_client: redis.Redis, chunk: STTChunk, chunk_key: str, set_key: str, ttl: int) -> bool:
+    """
+    STT 청크 저장 및 질문별 누적 통계 갱신 (Lua 스크립트로 원자적으로 처리, 새 청크이면 True)
+    """
+    counts = count_transcript(chunk.content)
+    added = redis_client.eval(
+        _SAVE_CHUNK_SCRIPT, 4,
+        chunk_key, set_key, get_speech_stats_key(chunk.interview_id, chunk.question_index),
+        get_speech_questions_key(chunk.interview_id),
+        chunk.content, ttl, repr(chunk.timestamp),
+        counts["words"], counts["chars"], counts["fillers"], chunk.question_index
+    )
+    return bool(added)
+
+def _question_metrics(stats: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    누적 통계로 질문별 발화 지표 계산 (발화 시간은 청크 간 평균 간격 x 청크 수로 추정)
+    """
+    if not stats:
+        return None
+
+    chunks = int(stats.get("chunks", 0))
+    words = int(stats.get("words", 0))
+    fillers = int(stats.get("fillers", 0))
+    span = float(stats.get("last_ts", 0)) - float(stats.get("first_ts", 0))
+    duration = span * chunks / (chunks - 1) if chunks > 1 and span > 0 else None
+
+    return {
+        "word_count": words,
+        "char_count": int(stats.get("chars", 0)),
+        "filler_count": fillers,
+        "filler_ratio": round(fillers / words, 3) if words else 0.0,
+        "duration_seconds": round(duration, 1) if duration else None,
+        "words_per_minute": round(words / (duration / 60), 1) if duration else None,
+    }
+
+def get_speech_metrics(redis_client: redis.Redis, interview_id: int) -> Dict[str, Any]:
+    """
+    면접 질문별 및 전체 발화 지표 조회 (통계가 기록된 질문마다 해시 1개, 파이프라인 1회 조회)
+    """
+    question_indexes = sorted(int(index) for index in redis_client.smembers(get_speech_questions_key(interview_id)))
+    pipe = redis_client.pipeline(transaction=False)
+    for question_index in question_indexes:
+        pipe.hgetall(get_speech_stats_key(interview_id, question_index))
+    all_stats = pipe.execute() if question_indexes else []
+
+    questions = {}
+    total_words = total_fillers = timed_words = 0
+    total_duration = 0.0
+    for question_index, stats in zip(question_indexes, all_stats):
+        metrics = _question_metrics(stats)
+        if metrics is None:
+            continue
+        questions[str(question_index)] = metrics
+        total_words += metrics["word_count"]
+        total_fillers += metrics["filler_count"]
+        if metrics["duration_seconds"]:
+            timed_words += metrics["word_count"]
+            total_duration += metrics["duration_seconds"]
+
+    return {
+        "questions": questions,
+        "word_count": total_words,
+        "filler_count": total_fillers,
+        "filler_ratio": round(total_fillers / total_words, 3) if total_words else 0.0,
+        "words_per_minute": round(timed_words / (total_duration / 60), 1) if total_duration else None,
+    }
+
+def get_speech_metrics_path(interview_id: int) -> str:
+    """
+    면접 종료 시 저장하는 발화 지표 파일 경로
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "speech_metrics", f"interview_{interview_id}.json")
+
+def save_speech_metrics(redis_client: redis.Redis, interview_id: int) -> Dict[str, Any]:
+    """
+    Redis 누적 통계로 발화 지표를 계산해 파일로 저장 (면접 종료 시 호출, 통계 해시의 유효 시간이 지난 뒤에도 평가에 사용)
+    """
+    metrics = get_speech_metrics(redis_client, interview_id)
+    path = get_speech_metrics_path(interview_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(path), suffix=".tmp", delete=False) as f:
+        json.dump(metrics, f, ensure_ascii=False, indent=2)
+    os.replace(f.name, path)
+    return metrics
+
+def load_speech_metrics(interview_id: int) -> Optional[Dict[str, Any]]:
+    """
+    저장된 발화 지표 조회
+    """
+    path = get_speech_metrics_path(interview_id)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def get_interview_speech_metrics(redis_client: redis.Redis, interview_id: int) -> Dict[str, Any]:
+    """
+    면접 발화 지표 (종료된 면접은 저장된 파일, 진행 중이거나 저장 전이면 Redis 누적 통계)
+    """
+    metrics = load_speech_metrics(interview_id)
+    if metrics is not None:
+        return metrics
+    return get_speech_metrics(redis_client, interview_id)
@@ -0,0 +1,239 @@
+from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+import threading
+import logging
+import redis
+
+from app.core.config import settings
+from app.db.session import SessionLocal, redis_client
+from app.models.stats import StatCounter
+from app.models.interview import Interview
+from app.models.evaluation import Evaluation
+from app.models.user import User
+from app.services.lock import RedisLock
+
+logger = logging.getLogger(__name__)
+
+INTERVIEW_TOTAL = "interviews.total"
+EVALUATION_TOTAL = "evaluations.total"
+EVALUATION_SCORED = "evaluations.scored"  # 총점이 있는 평가 수 (평균 계산 분모)
+EVALUATION_SCORE_SUM = "evaluations.score_sum"
+
+def interview_status_key(status: str) -> str:
+    """
+    면접 상태별 카운터 이름
+    """
+    return f"interviews.status.{status}"
+
+def _add(deltas: Dict[str, float], name: str, value: float) -> Dict[str, float]:
+    """
+    증감 dict에 값 누적
+    """
+    deltas[name] = deltas.get(name, 0) + value
+    return deltas
+
+def interview_status_deltas(old_status: Optional[str], new_status: Optional[str]) -> Dict[str, float]:
+    """
+    면접 생성(old=None)/상태 변경/삭제(new=None)에 따른 카운터 증감
+    """
+    deltas: Dict[str, float] = {}
+    if old_status == new_status:
+        return deltas
+    if old_status is None:
+        _add(deltas, INTERVIEW_TOTAL, 1)
+    else:
+        _add(deltas, interview_status_key(old_status), -1)
+    if new_status is None:
+        _add(deltas, INTERVIEW_TOTAL, -1)
+    else:
+        _add(deltas, interview_status_key(new_status), 1)
+    return deltas
+
+def evaluation_deltas(total_score: Optional[float], sign: int = 1) -> Dict[str, float]:
+    """
+    평가 생성(sign=1)/삭제(sign=-1)에 따른 카운터 증감 (점수 변경은 이전 값 삭제 + 새 값 생성으로 계산)
+    """
+    deltas = {EVALUATION_TOTAL: sign}
+    if total_score is not None:
+        _add(deltas, EVALUATION_SCORED, sign)
+        _add(deltas, EVALUATION_SCORE_SUM, sign * float(total_score))
+    return deltas
+
+def merge_deltas(*deltas_list: Dict[str, float]) -> Dict[str, float]:
+    """
+    카운터 증감 합산
+    """
+    merged: Dict[str, float] = {}
+    for deltas in deltas_list:
+        for name, value in deltas.items():
+            _add(merged, name, value)
+    return merged
+
+def _set_or_add_counter(db: Session, name: str, value: float, increment: bool) -> None:
+    """
+    카운터 1개 갱신 (행이 없으면 생성, 동시 생성 충돌 시 갱신으로 재시도)
+    """
+    new_value = StatCounter.value + value if increment else value
+    if db.query(StatCounter).filter(StatCounter.name == name).update({StatCounter.value: new_value}, synchronize_session=False):
+        return
+    try:
+        with db.begin_nested():
+            db.add(StatCounter(name=name, value=value))
+    except IntegrityError:
+        db.query(StatCounter).filter(StatCounter.name == name).update({StatCounter.value: new_value}, synchronize_session=False)
+
+def increment_counters(db: Session, deltas: Dict[str, float]) -> None:
+    """
+    현재 트랜잭션 안에서 카운터 증감 (커밋은 호출자가 데이터 변경과 함께 수행)
+
+    교착 상태를 피하기 위해 항상 이름 순서로 행을 갱신
+    """
+    for name in sorted(deltas):
+        if deltas[name]:
+            _set_or_add_counter(db, name, deltas[name], increment=True)
+
+def get_counters(db: Session) -> Dict[str, float]:
+    """
+    전체 카운터 조회 (카운터 수만큼의 작은 테이블 1회 조회)
+    """
+    return {name: value for name, value in db.query(StatCounter.name, StatCounter.value)}
+
+def compute_dashboard_stats(db: Session) -> Dict[str, Any]:
+    """
+    관리자 대시보드 통계 계산 (테이블 크기와 무관하게 카운터와 start_time 인덱스만 사용)
+    """
+    counters = get_counters(db)
+
+    def _count(name: str) -> int:
+        return int(counters.get(name, 0))
+
+    scored = counters.get(EVALUATION_SCORED, 0)
+    avg_score = counters.get(EVALUATION_SCORE_SUM, 0) / scored if scored else 0
+
+    # 최근 면접 목록
+    recent_interviews = (
+        db.query(Interview.id, Interview.candidate_name, Interview.start_time, Interview.status, User.username)
+        .join(User, Interview.interviewer_id == User.id)
+        .order_by(Interview.start_time.desc())
+        .limit(5)
+        .all()
+    )
+
+    return {
+        "interview_stats": {
+            "total": _count(INTERVIEW_TOTAL),
+            "completed": _count(interview_status_key("completed")),
+            "in_progress": _count(interview_status_key("in_progress")),
+            "scheduled": _count(interview_status_key("scheduled"))
+        },
+        "evaluation_stats": {
+            "total": _count(EVALUATION_TOTAL),
+            "avg_score": round(avg_score, 2)
+        },
+        "recent_interviews": [
+            {
+                "id": row.id,
+                "candidate_name": row.candidate_name,
+                "start_time": row.start_time.strftime("%Y-%m-%d %H:%M") if row.start_time else None,
+                "status": row.status,
+                "interviewer_name": row.username
+            }
+            for row in recent_interviews
+        ]
+    }
+
+def reconcile_stat_counters(db: Session) -> Dict[str, float]:
+    """
+    원본 테이블을 다시 집계해 카운터 보정, 보정한 카운터의 차이 반환
+
+    카운터 행을 먼저 잠가 진행 중인 증감이 끝난 뒤 집계하고, 이후의 증감은 보정 뒤에 반영되도록 함
+    """
+    try:
+        counters = {counter.name: counter.value for counter in db.query(StatCounter).with_for_update().all()}
+
+        expected: Dict[str, float] = {name: 0 for name in counters if name.startswith("interviews.status.")}
+        status_counts = db.query(Interview.status, func.count(Interview.id)).group_by(Interview.status).all()
+        for status, count in status_counts:
+            if status is not None:
+                expected[interview_status_key(status)] = count
+        expected[INTERVIEW_TOTAL] = sum(count for _, count in status_counts)
+
+        evaluation_total, evaluation_scored, score_sum = db.query(
+            func.count(Evaluation.id),
+            func.count(Evaluation.total_score),
+            func.coalesce(func.sum(Evaluation.total_score), 0)
+        ).one()
+        expected[EVALUATION_TOTAL] = evaluation_total
+        expected[EVALUATION_SCORED] = evaluation_scored
+        expected[EVALUATION_SCORE_SUM] = float(score_sum)
+
+        drift = {}
+        for name in sorted(expected):
+            if abs(counters.get(name, 0) - expected[name]) > 1e-6 or name not in counters:
+                drift[name] = expected[name] - counters.get(name, 0)
+                _set_or_add_counter(db, name, expected[name], increment=False)
+        db.commit()
+
+        if any(drift.values()):
+            logger.warning(f"통계 카운터 보정: {drift}")
+        return drift
+    except Exception:
+        db.rollback()
+        raise
+
+def reconcile_stat_counters_task() -> None:
+    """
+    카운터 재집계 (자체 DB 세션 사용, 여러 서버 중 하나만 실행)
+    """
+    lock = RedisLock(redis_client, "lock:stats:reconcile", lease_ms=60000)
+    try:
+        if not lock.acquire():
+            return
+    except redis.RedisError as e:
+        # 재집계는 여러 번 실행되어도 결과가 같으므로 락 없이 진행
+        logger.warning(f"통계 재집계 락 획득 실패, 락 없이 진행: {e}")
+        lock = None
+
+    from app.services.dashboard_cache import invalidate_dashboard_cache
+
+    db = SessionLocal()
+    try:
+        if reconcile_stat_counters(db):
+            invalidate_dashboard_cache()
+    except Exception as e:
+        logger.error(f"통계 카운터 재집계 실패: {e}")
+    finally:
+        db.close()
+        if lock is not None:
+            lock.release()
+
+_reconciler_stop = threading.Event()
+_reconciler_thread: Optional[threading.Thread] = None
+
+def _reconcile_loop() -> None:
+    """
+    종료 요청 전까지 주기적으로 재집계
+    """
+    while True:
+        reconcile_stat_counters_task()
+        if _reconciler_stop.wait(settings.STATS_RECONCILE_INTERVAL_SECONDS):
+            return
+
+def start_stats_reconciler() -> None:
+    """
+    주기적 카운터 재집계 스레드 시작 (시작 즉시 1회 실행해 카운터가 없는 기존 데이터도 반영)
+    """
+    global _reconciler_thread
+    if _reconciler_thread is not None and _reconciler_thread.is_alive():
+        return
+    _reconciler_stop.clear()
+    _reconciler_thread = threading.Thread(target=_reconcile_loop, name="stats-reconciler", daemon=True)
+    _reconciler_thread.start()
+
+def stop_stats_reconciler() -> None:
+    """
+    카운터 재집계 스레드 종료
+    """
+    _reconciler_stop.set()
@@ -1,6 +1,5 @@
 import os
 import logging
-import tempfile
 import json
 from typing import Optional, List, Dict, Any
 from google.cloud import speech
@@ -9,26 +8,35 @@ import redis
 
 from app.core.config import settings
 from app.schemas.interview import STTChunk
+from app.services.speech_metrics import save_chunk_with_stats
+from app.services.pcm import PCM_SAMPLE_RATE, decode_to_pcm, pcm_to_wav
 
 logger = logging.getLogger(__name__)
 
-def transcribe_audio_google(audio_path: str, language_code: str = "ko-KR") -> Optional[str]:
+def _read_pcm(audio_path: str) -> Optional[bytes]:
     """
-    Google Cloud Speech API를 사용한 오디오 파일 STT 변환
+    오디오 파일을 정규화된 PCM으로 조회 (.pcm 파일은 그대로, 그 외 형식은 디코딩)
+    """
+    with open(audio_path, "rb") as audio_file:
+        content = audio_file.read()
+    if audio_path.endswith(".pcm"):
+        return content
+    return decode_to_pcm(content)
+
+def transcribe_pcm_google(pcm: bytes, language_code: str = "ko-KR") -> Optional[str]:
+    """
+    Google Cloud Speech API를 사용한 PCM STT 변환 (16kHz 모노 LINEAR16)
     """
     try:
         # Google Cloud Speech 클라이언트 초기화
         client = speech.SpeechClient()
         
-        # 오디오 파일 읽기
-        with open(audio_path, "rb") as audio_file:
-            content = audio_file.read()
-        
         # 오디오 설정
-        audio = speech.RecognitionAudio(content=content)
+        audio = speech.RecognitionAudio(content=pcm)
         config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.MP3,
-            sample_rate_hertz=16000,
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=PCM_SAMPLE_RATE,
+            audio_channel_count=1,
             language_code=language_code,
             enable_automatic_punctuation=True,
         )
@@ -46,53 +54,67 @@ def transcribe_audio_google(audio_path: str, language_code: str = "ko-KR") -> Op
         logger.error(f"Google STT 변환 실패: {e}")
         return None
 
-def transcribe_audio_whisper(audio_path: str, language: str = "ko") -> Optional[str]:
+def transcribe_pcm_whisper(pcm: bytes, language: str = "ko") -> Optional[str]:
     """
-    OpenAI Whisper API를 사용한 오디오 파일 STT 변환
+    OpenAI Whisper API를 사용한 PCM STT 변환 (메모리의 WAV로 전송, 임시 파일 없음)
     """
     try:
         openai.api_key = settings.OPENAI_API_KEY
         
-        with open(audio_path, "rb") as audio_file:
-            response = openai.Audio.transcribe(
-                model="whisper-1",
-                file=audio_file,
-                language=language
-            )
+        response = openai.Audio.transcribe(
+            model="whisper-1",
+            file=pcm_to_wav(pcm),
+            language=language
+        )
         
         return response.get("text", "")
     except Exception as e:
         logger.error(f"Whisper STT 변환 실패: {e}")
         return None
 
-def transcribe_audio_chunk(audio_chunk: bytes, language: str = "ko") -> Optional[str]:
+def transcribe_audio_google(audio_path: str, language_code: str = "ko-KR") -> Optional[str]:
     """
-    오디오 청크 STT 변환 (Whisper API 사용)
+    Google Cloud Speech API를 사용한 오디오 파일 STT 변환
     """
     try:
-        openai.api_key = settings.OPENAI_API_KEY
-        
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as temp_file:
-            temp_file.write(audio_chunk)
-            temp_file_path = temp_file.name
-        
-        # STT 변환
-        with open(temp_file_path, "rb") as audio_file:
-            response = openai.Audio.transcribe(
-                model="whisper-1",
-                file=audio_file,
-                language=language
-            )
-        
-        # 임시 파일 삭제
-        os.unlink(temp_file_path)
-        
-        return response.get("text", "")
+        pcm = _read_pcm(audio_path)
+        if pcm is None:
+            return None
+        return transcribe_pcm_google(pcm, language_code)
+    except Exception as e:
+        logger.error(f"Google STT 변환 실패: {e}")
+        return None
+
+def transcribe_audio_whisper(audio_path: str, language: str = "ko") -> Optional[str]:
+    """
+    OpenAI Whisper API를 사용한 오디오 파일 STT 변환
+    """
+    try:
+        pcm = _read_pcm(audio_path)
+        if pcm is None:
+            return None
+        return transcribe_pcm_whisper(pcm, language)
     except Exception as e:
-        logger.error(f"오디오 청크 STT 변환 실패: {e}")
+        logger.error(f"Whisper STT 변환 실패: {e}")
         return None
 
+def transcribe_audio_chunk(audio_chunk: bytes, language: str = "ko", pcm: Optional[bytes] = None) -> Optional[str]:
+    """
+    오디오 청크 STT 변환 (Whisper API 사용)
+    
+    업로드 시 정규화한 PCM이 주어지면 다시 디코딩하지 않고 사용
+    """
+    if pcm is None:
+        pcm = decode_to_pcm(audio_chunk)
+        if pcm is None:
+            logger.error("오디오 청크 STT 변환 실패: PCM 변환에 실패했습니다.")
+            return None
+    
+    if not pcm:
+        return ""
+    
+    return transcribe_pcm_whisper(pcm, language)
+
 def save_stt_chunk_to_redis(redis_client: redis.Redis, chunk: STTChunk) -> bool:
     """
     STT 청크를 Redis에 저장
@@ -100,12 +122,12 @@ def save_stt_chunk_to_redis(redis_client: redis.Redis, chunk: STTChunk) -> bool:
     try:
         # Redis 키 형식: stt:{interview_id}:{question_index}:{timestamp}
         key = f"stt:{chunk.interview_id}:{chunk.question_index}:{chunk.timestamp}"
-        redis_client.set(key, chunk.content, ex=86400)  # 24시간 유효
         
         # 해당 질문에 대한 모든 청크 키를 저장하는 세트
         set_key = f"stt_chunks:{chunk.interview_id}:{chunk.question_index}"
-        redis_client.sadd(set_key, key)
-        redis_client.expire(set_key, 86400)  # 24시간 유효
+        
+        # 청크와 질문별 발화 통계를 함께 저장 (24시간 유효)
+        save_chunk_with_stats(redis_client, chunk, key, set_key, 86400)
         
         return True
     except Exception as e:
@@ -0,0 +1,221 @@
+from typing import Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+import os
+import json
+import math
+import hashlib
+import tempfile
+import logging
+import redis
+import ffmpeg
+
+from app.core.config import settings
+from app.db.session import SessionLocal, redis_client
+from app.models.interview import Interview
+from app.services.interview import get_interview, get_answer_offsets
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+GENERATING_LOCK_SECONDS = 600  # 생성 중 표시 유지 시간 (작업이 비정상 종료되어도 이후 다시 생성)
+
+def get_thumbnail_dir(interview_id: int) -> str:
+    """
+    면접별 썸네일 디렉토리 (병합된 비디오와 같은 위치)
+    """
+    return os.path.join(settings.MEDIA_STORAGE_PATH, "videos", f"interview_{interview_id}_thumbnails")
+
+def get_video_version(video_path: str) -> str:
+    """
+    병합된 비디오의 버전 (수정 시각과 크기 기반, 다시 병합되면 바뀜)
+    """
+    stat = os.stat(video_path)
+    return hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:12]
+
+def _video_info(video_path: str) -> Tuple[float, int, int]:
+    """
+    비디오 길이(초), 너비, 높이
+    """
+    probe = ffmpeg.probe(video_path)
+    stream = next(s for s in probe["streams"] if s["codec_type"] == "video")
+    duration = float(probe["format"].get("duration") or stream.get("duration") or 0.0)
+    return duration, int(stream["width"]), int(stream["height"])
+
+def extract_snapshot(video_path: str, output_path: str, position: float, width: int) -> bool:
+    """
+    지정 위치의 프레임 1장을 JPEG로 저장 (입력 측 탐색으로 앞부분 디코딩 생략)
+    """
+    try:
+        (
+            ffmpeg
+            .input(video_path, ss=f"{position:.3f}")
+            .filter("scale", width, -2)
+            .output(output_path, vframes=1, **{"q:v": 4})
+            .global_args("-loglevel", "error", "-nostdin")
+            .run(quiet=True, overwrite_output=True)
+        )
+        return os.path.exists(output_path)
+    except ffmpeg.Error as e:
+        logger.error(f"스냅샷 추출 실패 ({position:.1f}초): {e.stderr.decode(errors='ignore') if e.stderr else e}")
+        return False
+
+def extract_sprite_sheet(video_path: str, output_path: str, duration: float, tile_width: int, tile_height: int) -> Optional[Dict[str, Any]]:
+    """
+    영상 전체를 일정 간격으로 샘플링한 저해상도 스프라이트 시트 생성 (디코딩 1회)
+    """
+    columns, rows = settings.THUMBNAIL_SPRITE_COLUMNS, settings.THUMBNAIL_SPRITE_ROWS
+    interval = max(1, math.ceil(duration / (columns * rows)))
+    count = min(columns * rows, max(1, math.ceil(duration / interval)))
+    rows = math.ceil(count / columns)
+    try:
+        (
+            ffmpeg
+            .input(video_path)
+            .filter("fps", fps=f"1/{interval}")
+            .filter("scale", tile_width, tile_height)
+            .filter("tile", f"{columns}x{rows}")
+            .output(output_path, vframes=1, **{"q:v": 5})
+            .global_args("-loglevel", "error", "-nostdin")
+            .run(quiet=True, overwrite_output=True)
+        )
+    except ffmpeg.Error as e:
+        logger.error(f"스프라이트 시트 생성 실패: {e.stderr.decode(errors='ignore') if e.stderr else e}")
+        return None
+
+    return {
+        "file": os.path.basename(output_path),
+        "interval": interval,
+        "count": count,
+        "columns": columns,
+        "rows": rows,
+        "tile_width": tile_width,
+        "tile_height": tile_height,
+    }
+
+def generate_video_thumbnails(db: Session, interview_id: int) -> Optional[Dict[str, Any]]:
+    """
+    질문 시작 시점별 스냅샷과 스크러빙용 스프라이트 시트 생성 후 매니페스트 저장
+    """
+    try:
+        interview = get_interview(db, interview_id)
+        if not interview or not interview.video_path:
+            logger.error(f"면접 ID {interview_id}에 대한 썸네일 생성 실패: 병합된 비디오가 없습니다.")
+            return None
+
+        video_path = os.path.join(settings.MEDIA_STORAGE_PATH, interview.video_path)
+        version = get_video_version(video_path)
+        duration, width, height = _video_info(video_path)
+        thumbnail_dir = get_thumbnail_dir(interview_id)
+        os.makedirs(thumbnail_dir, exist_ok=True)
+
+        # 파일명에 비디오 버전을 넣어 다시 병합되면 URL이 바뀌도록 함 (브라우저/CDN 캐시 갱신)
+        # 질문별 스냅샷: 답변 시작 직후(최대 1초, 답변 길이의 절반 이내) 프레임
+        questions = {}
+        for question_index, start, end in get_answer_offsets(db, interview):
+            if duration and start >= duration:
+                continue
+            position = start + min(1.0, (end - start) / 2)
+            filename = f"question_{question_index}.{version}.jpg"
+            if extract_snapshot(video_path, os.path.join(thumbnail_dir, filename), position, settings.THUMBNAIL_WIDTH):
+                questions[str(question_index)] = {"file": filename, "time": round(position, 3)}
+
+        tile_width = settings.THUMBNAIL_SPRITE_TILE_WIDTH
+        tile_height = int(height * tile_width / width) // 2 * 2
+        sprite = extract_sprite_sheet(
+            video_path, os.path.join(thumbnail_dir, f"sprite.{version}.jpg"),
+            duration, tile_width, tile_height
+        ) if duration else None
+
+        manifest = {
+            "interview_id": interview_id,
+            "version": version,
+            "duration": round(duration, 3),
+            "questions": questions,
+            "sprite": sprite,
+        }
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=thumbnail_dir, suffix=".tmp", delete=False) as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(f.name, os.path.join(thumbnail_dir, MANIFEST_FILENAME))
+
+        # 이전 버전 이미지 정리
+        current_files = _manifest_files(manifest)
+        for filename in os.listdir(thumbnail_dir):
+            if filename.endswith(".jpg") and filename not in current_files:
+                os.remove(os.path.join(thumbnail_dir, filename))
+
+        return manifest
+    except Exception as e:
+        logger.error(f"썸네일 생성 실패: {e}")
+        return None
+
+def load_thumbnail_manifest(interview_id: int) -> Optional[Dict[str, Any]]:
+    """
+    저장된 썸네일 매니페스트 조회
+    """
+    path = os.path.join(get_thumbnail_dir(interview_id), MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def get_current_thumbnail_manifest(interview: Interview) -> Optional[Dict[str, Any]]:
+    """
+    현재 병합된 비디오로 만든 썸네일 매니페스트 (없거나 비디오가 다시 병합되었으면 None)
+    """
+    manifest = load_thumbnail_manifest(interview.id)
+    if manifest is None or not interview.video_path:
+        return None
+    video_path = os.path.join(settings.MEDIA_STORAGE_PATH, interview.video_path)
+    if not os.path.exists(video_path) or manifest.get("version") != get_video_version(video_path):
+        return None
+    return manifest
+
+def _manifest_files(manifest: Dict[str, Any]) -> set:
+    """
+    매니페스트에 기록된 이미지 파일명
+    """
+    files = {question["file"] for question in manifest["questions"].values()}
+    if manifest.get("sprite"):
+        files.add(manifest["sprite"]["file"])
+    return files
+
+def _generating_key(interview_id: int) -> str:
+    """
+    썸네일 생성 중 표시 키
+    """
+    return f"thumbnails:generating:{interview_id}"
+
+def claim_thumbnail_generation(interview_id: int) -> bool:
+    """
+    썸네일 생성 중 표시 (이미 생성 중이면 False, 조회 요청마다 생성 작업이 중복으로 등록되지 않도록 함)
+    """
+    try:
+        return bool(redis_client.set(_generating_key(interview_id), "1", nx=True, ex=GENERATING_LOCK_SECONDS))
+    except redis.RedisError as e:
+        logger.warning(f"썸네일 생성 중 표시 실패: {e}")
+        return True
+
+def get_thumbnail_path(interview_id: int, filename: str) -> Optional[str]:
+    """
+    썸네일 파일 경로 (매니페스트에 기록된 파일만 허용)
+    """
+    manifest = load_thumbnail_manifest(interview_id)
+    if not manifest or filename not in _manifest_files(manifest):
+        return None
+
+    path = os.path.join(get_thumbnail_dir(interview_id), filename)
+    return path if os.path.exists(path) else None
+
+def generate_thumbnails_task(interview_id: int) -> None:
+    """
+    썸네일 생성 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        generate_video_thumbnails(db, interview_id)
+    finally:
+        db.close()
+        try:
+            redis_client.delete(_generating_key(interview_id))
+        except redis.RedisError as e:
+            logger.warning(f"썸네일 생성 중 표시 해제 실패: {e}")
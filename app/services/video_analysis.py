@@ -0,0 +1,137 @@
+from typing import Optional, List, Tuple
+from collections import deque
+from sqlalchemy.orm import Session
+import os
+import logging
+import ffmpeg
+import numpy as np
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.interview import get_interview
+from app.services.media import merge_video_chunks
+from app.services.frame_analyzer import submit_raw_frames
+from app.services.frame_metrics import append_frame_metrics, has_frame_metrics, clear_frame_metrics
+from app.services.thumbnails import generate_video_thumbnails
+
+logger = logging.getLogger(__name__)
+
+def _output_size(video_path: str) -> Tuple[int, int]:
+    """
+    분석용 프레임 크기 (원본 비율 유지, 최대 너비 제한, 짝수 크기)
+    """
+    probe = ffmpeg.probe(video_path)
+    stream = next(s for s in probe["streams"] if s["codec_type"] == "video")
+    width, height = int(stream["width"]), int(stream["height"])
+    if width > settings.VIDEO_ANALYSIS_WIDTH:
+        height = int(height * settings.VIDEO_ANALYSIS_WIDTH / width)
+        width = settings.VIDEO_ANALYSIS_WIDTH
+    return width - width % 2, height - height % 2
+
+def iter_video_frames(video_path: str, fps: float, width: int, height: int):
+    """
+    ffmpeg rawvideo 파이프로 일정 간격 샘플링한 BGR 프레임을 NumPy 배열로 순차 반환 (임시 파일 없음)
+    """
+    process = (
+        ffmpeg
+        .input(video_path)
+        .filter("fps", fps=fps)
+        .filter("scale", width, height)
+        .output("pipe:", format="rawvideo", pix_fmt="bgr24")
+        .global_args("-loglevel", "error", "-nostdin")
+        .run_async(pipe_stdout=True)
+    )
+    frame_size = width * height * 3
+    try:
+        while True:
+            data = process.stdout.read(frame_size)
+            if len(data) < frame_size:
+                break
+            yield np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+    finally:
+        process.stdout.close()
+        process.wait()
+
+def analyze_recorded_video(db: Session, interview_id: int, force: bool = False) -> Optional[int]:
+    """
+    병합된 녹화 영상을 샘플링하여 프레임 분석 후 면접별 시계열로 저장 (분석한 프레임 수 반환)
+
+    실시간 분석 데이터가 이미 있으면 force가 아닌 한 건너뜀
+    """
+    try:
+        interview = get_interview(db, interview_id)
+        if not interview or not interview.video_path:
+            logger.error(f"면접 ID {interview_id}에 대한 영상 분석 실패: 병합된 비디오가 없습니다.")
+            return None
+
+        if has_frame_metrics(interview_id):
+            if not force:
+                logger.info(f"면접 ID {interview_id}에 대한 프레임 분석 데이터가 이미 존재합니다.")
+                return 0
+            clear_frame_metrics(interview_id)
+
+        video_path = os.path.join(settings.MEDIA_STORAGE_PATH, interview.video_path)
+        fps = settings.VIDEO_ANALYSIS_FPS
+        width, height = _output_size(video_path)
+        base_timestamp = interview.start_time.timestamp() if interview.start_time else 0.0
+        batch_size = settings.VIDEO_ANALYSIS_BATCH_SIZE
+
+        # 디코딩과 분석을 겹쳐 수행 (분석 중인 묶음은 최대 2개)
+        in_flight = deque()
+        batch: List[np.ndarray] = []
+        frame_index = 0
+
+        def flush(block: bool) -> None:
+            while in_flight and (block or len(in_flight) >= 2 or in_flight[0][1].done()):
+                start_index, future = in_flight.popleft()
+                results = future.result()
+                for offset, result in enumerate(results):
+                    result["timestamp"] = base_timestamp + (start_index + offset) / fps
+                append_frame_metrics(interview_id, results)
+
+        for frame in iter_video_frames(video_path, fps, width, height):
+            batch.append(frame)
+            frame_index += 1
+            if len(batch) == batch_size:
+                in_flight.append((frame_index - len(batch), submit_raw_frames(batch, interview_id)))
+                batch = []
+                flush(block=False)
+
+        if batch:
+            in_flight.append((frame_index - len(batch), submit_raw_frames(batch, interview_id)))
+        flush(block=True)
+
+        logger.info(f"면접 ID {interview_id} 녹화 영상 분석 완료 ({frame_index}프레임)")
+        return frame_index
+    except Exception as e:
+        logger.error(f"녹화 영상 분석 실패: {e}")
+        return None
+
+def process_merged_video(interview_id: int) -> None:
+    """
+    비디오 병합 후처리 (백그라운드 작업용, 자체 DB 세션 사용)
+
+    질문별 썸네일을 생성하고, 실시간 프레임 분석 데이터가 없는 면접은 병합된 영상으로 비언어적 분석 수행
+    """
+    db = SessionLocal()
+    try:
+        video_path = merge_video_chunks(db, interview_id)
+        if not video_path:
+            return
+
+        generate_video_thumbnails(db, interview_id)
+
+        if not has_frame_metrics(interview_id):
+            analyze_recorded_video(db, interview_id)
+    finally:
+        db.close()
+
+def analyze_recorded_video_task(interview_id: int, force: bool = False) -> None:
+    """
+    녹화 영상 분석 (백그라운드 작업용, 자체 DB 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        analyze_recorded_video(db, interview_id, force=force)
+    finally:
+        db.close()
@@ -0,0 +1,67 @@
+import os
+import re
+from typing import Optional, Dict, Tuple, Iterator
+from fastapi import Request, HTTPException, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+RANGE_CHUNK_SIZE = 64 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def parse_range_header(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 바이트 범위 헤더 해석 (시작, 끝 포함), 형식이 다르거나 다중 범위이면 None
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match or not any(match.groups()):
+        return None
+
+    start_text, end_text = match.groups()
+    if not start_text:
+        # 접미사 범위 (bytes=-N: 마지막 N바이트)
+        length = int(end_text)
+        if length == 0:
+            raise HTTPException(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers={"Content-Range": f"bytes */{file_size}"})
+        return max(file_size - length, 0), file_size - 1
+
+    start = int(start_text)
+    end = min(int(end_text), file_size - 1) if end_text else file_size - 1
+    if start >= file_size or start > end:
+        raise HTTPException(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers={"Content-Range": f"bytes */{file_size}"})
+    return start, end
+
+def _iter_file_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    """
+    파일의 지정 범위를 청크 단위로 읽기
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            data = f.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+def range_file_response(request: Request, path: str, media_type: str, headers: Optional[Dict[str, str]] = None):
+    """
+    Range 요청을 지원하는 파일 응답 (Range 헤더가 있으면 206 부분 응답, 없으면 전체 파일)
+    """
+    file_size = os.path.getsize(path)
+    headers = dict(headers or {})
+    headers["Accept-Ranges"] = "bytes"
+
+    range_header = request.headers.get("range")
+    byte_range = parse_range_header(range_header, file_size) if range_header and file_size else None
+    if byte_range is None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iter_file_range(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers
+    )
@@ -0,0 +1,219 @@
+import math
+from bisect import bisect_left
+from typing import Optional, List, Dict, Any, Iterable
+
+DEFAULT_COMPRESSION = 100.0
+
+class TDigest:
+    """
+    병합 가능한 분위수 스케치 (merging t-digest, k1 스케일 함수)
+
+    - 값들을 크기가 제한된 centroid(평균, 가중치) 목록으로 요약, 양 끝 분위수일수록 centroid를 작게 유지
+    - 같은 compression의 스케치끼리 병합 가능 (일별 버킷을 합쳐 주/월/기간 분위수 계산)
+    - centroid 수는 대략 compression 이하로 유지되어 저장 크기가 데이터 수와 무관
+    """
+
+    def __init__(self, compression: float = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[tuple] = []
+        self._buffer_size = int(compression * 5)
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """
+        값 추가
+        """
+        value = float(value)
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> None:
+        """
+        여러 값 추가
+        """
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """
+        다른 스케치를 병합 (자기 자신을 갱신 후 반환)
+        """
+        if other.count == 0:
+            return self
+        other._compress()
+        self._buffer.extend(zip(other._means, other._weights))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    @classmethod
+    def merge_all(cls, digests: Iterable["TDigest"], compression: float = DEFAULT_COMPRESSION) -> "TDigest":
+        """
+        여러 스케치를 하나로 병합
+        """
+        merged = cls(compression)
+        for digest in digests:
+            merged.merge(digest)
+        return merged
+
+    def _q_to_k(self, q: float) -> float:
+        """
+        분위수 -> k 스케일 (양 끝에서 기울기가 커져 centroid가 작아짐)
+        """
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_to_q(self, k: float) -> float:
+        """
+        k 스케일 -> 분위수
+        """
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compress(self) -> None:
+        """
+        버퍼와 기존 centroid를 정렬 후 스케일 함수 한도 안에서 인접 centroid 병합
+        """
+        if not self._buffer:
+            return
+        points = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+
+        total = sum(weight for _, weight in points)
+        means: List[float] = []
+        weights: List[float] = []
+        cur_mean, cur_weight = points[0]
+        weight_so_far = 0.0
+        q_limit = self._k_to_q(self._q_to_k(0.0) + 1)
+
+        for mean, weight in points[1:]:
+            if (weight_so_far + cur_weight + weight) / total <= q_limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                weight_so_far += cur_weight
+                means.append(cur_mean)
+                weights.append(cur_weight)
+                q_limit = self._k_to_q(self._q_to_k(weight_so_far / total) + 1)
+                cur_mean, cur_weight = mean, weight
+
+        means.append(cur_mean)
+        weights.append(cur_weight)
+        self._means, self._weights = means, weights
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        q 분위수 (0 ~ 1), 값이 없으면 None
+        """
+        self._compress()
+        if self.count == 0:
+            return None
+        q = min(max(q, 0.0), 1.0)
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        if len(self._means) == 1:
+            return self._means[0]
+
+        target = q * self.count
+        means, weights = self._means, self._weights
+
+        # 첫 centroid 중심 이전: 최솟값과 선형 보간
+        if target < weights[0] / 2:
+            return self.min + (means[0] - self.min) * target / (weights[0] / 2)
+
+        cumulative = weights[0] / 2
+        for i in range(len(means) - 1):
+            step = (weights[i] + weights[i + 1]) / 2
+            if target <= cumulative + step:
+                return means[i] + (means[i + 1] - means[i]) * (target - cumulative) / step
+            cumulative += step
+
+        # 마지막 centroid 중심 이후: 최댓값과 선형 보간
+        remaining = weights[-1] / 2
+        return means[-1] + (self.max - means[-1]) * min((target - cumulative) / remaining, 1.0)
+
+    def cdf(self, value: float) -> Optional[float]:
+        """
+        value 이하 비율 근사 (0 ~ 1, 백분위 순위), 값이 없으면 None
+        """
+        self._compress()
+        if self.count == 0:
+            return None
+        if value < self.min:
+            return 0.0
+        if value > self.max:
+            return 1.0
+        if self.max == self.min:
+            return 0.5  # 모든 값이 같으면 절반만 포함
+
+        means, weights = self._means, self._weights
+        if len(means) == 1:
+            return (value - self.min) / (self.max - self.min)
+
+        if value < means[0]:
+            span = means[0] - self.min
+            return (weights[0] / 2) * ((value - self.min) / span if span > 0 else 1.0) / self.count
+
+        # value를 포함하는 centroid 구간 탐색 후 중심 사이 선형 보간
+        i = bisect_left(means, value)
+        if i >= len(means):
+            span = self.max - means[-1]
+            tail = (weights[-1] / 2) * ((value - means[-1]) / span if span > 0 else 1.0)
+            return (self.count - weights[-1] / 2 + tail) / self.count
+
+        if means[i] == value:
+            # 같은 값을 가진 centroid들은 절반씩 포함
+            j = i
+            while j < len(means) and means[j] == value:
+                j += 1
+            below = sum(weights[:i]) + sum(weights[i:j]) / 2
+            return below / self.count
+
+        left = sum(weights[:i - 1]) + weights[i - 1] / 2
+        step = (weights[i - 1] + weights[i]) / 2
+        ratio = (value - means[i - 1]) / (means[i] - means[i - 1])
+        return (left + step * ratio) / self.count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 저장용 직렬화
+        """
+        self._compress()
+        return {
+            "compression": self.compression,
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "centroids": [[round(mean, 6), weight] for mean, weight in zip(self._means, self._weights)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "TDigest":
+        """
+        to_dict() 결과로 복원 (None이면 빈 스케치)
+        """
+        if not data:
+            return cls()
+        digest = cls(data.get("compression", DEFAULT_COMPRESSION))
+        if data.get("count"):
+            digest.count = float(data["count"])
+            digest.min = float(data["min"])
+            digest.max = float(data["max"])
+            digest._means = [float(mean) for mean, _ in data["centroids"]]
+            digest._weights = [float(weight) for _, weight in data["centroids"]]
+        return digest
+
+    def __len__(self) -> int:
+        return int(self.count)
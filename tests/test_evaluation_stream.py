@@ -0,0 +1,78 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import evaluation_stream
+from app.services.evaluation_stream import IncrementalVerdictParser, _stream_verbal_evaluation
+
+RESPONSE = json.dumps({
+    "clarity": 4,
+    "relevance": 3.5,
+    "depth": 2,
+    "conciseness": 5,
+    "confidence": 4,
+    "feedback": "답변이 \"명확\"합니다.\n근거를 보강하세요.",
+}, ensure_ascii=False)
+
+
+def _split(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(RESPONSE)])
+def test_parser_extracts_scores_and_feedback_from_fragments(size):
+    parser = IncrementalVerdictParser()
+    scores, feedback = {}, ""
+    for fragment in _split(RESPONSE, size):
+        for event, value in parser.feed(fragment):
+            if event == "score":
+                criteria, score = value
+                scores[criteria] = score
+            else:
+                feedback += value
+
+    assert scores == {"clarity": 4, "relevance": 3.5, "depth": 2, "conciseness": 5, "confidence": 4}
+    assert feedback == "답변이 \"명확\"합니다.\n근거를 보강하세요."
+    assert parser.result() == (scores, feedback)
+
+
+def test_parser_waits_for_score_delimiter():
+    parser = IncrementalVerdictParser()
+    assert parser.feed('{"clarity": 4') == []
+    assert parser.feed(",") == [("score", ("clarity", 4.0))]
+
+
+def test_parser_handles_split_unicode_escape():
+    parser = IncrementalVerdictParser()
+    parser.feed('{"feedback": "\\u')
+    assert parser.feed("d5") == []
+    assert parser.feed('5cab"}') == [("feedback", "한ab")]
+
+
+def test_stream_verbal_evaluation_reads_chunk_deltas(monkeypatch):
+    chunks = [SimpleNamespace(choices=[]), _chunk(None)] + [_chunk(fragment) for fragment in _split(RESPONSE, 5)]
+    requests = []
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            requests.append(kwargs)
+            return iter(chunks)
+
+    class FakeOpenAI:
+        def __init__(self, api_key=None):
+            self.chat = SimpleNamespace(completions=FakeCompletions())
+
+    monkeypatch.setattr(evaluation_stream, "OpenAI", FakeOpenAI)
+
+    parser = IncrementalVerdictParser()
+    events = list(_stream_verbal_evaluation("prompt", parser))
+
+    assert requests[0]["stream"] is True
+    assert sum(event.startswith("event: score") for event in events) == 5
+    assert any(event.startswith("event: feedback") for event in events)
+    assert parser.result()[0]["relevance"] == 3.5
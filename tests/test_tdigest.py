@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from app.utils.tdigest import TDigest
+
+
+def _digest(values, compression=100.0):
+    digest = TDigest(compression)
+    digest.update(values)
+    return digest
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(42).normal(loc=70, scale=12, size=20000)
+
+
+@pytest.mark.parametrize("q", [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99])
+def test_quantile_matches_numpy(values, q):
+    digest = _digest(values)
+    # 분위수 순위 오차 0.5% 이내
+    assert abs(np.mean(values <= digest.quantile(q)) - q) < 0.005
+
+
+@pytest.mark.parametrize("q", [0.01, 0.1, 0.5, 0.9, 0.99])
+def test_cdf_matches_numpy(values, q):
+    digest = _digest(values)
+    value = np.quantile(values, q)
+    assert digest.cdf(value) == pytest.approx(np.mean(values <= value), abs=0.005)
+
+
+def test_quantile_extremes(values):
+    digest = _digest(values)
+    assert digest.quantile(0) == values.min()
+    assert digest.quantile(1) == values.max()
+    assert digest.cdf(values.min() - 1) == 0.0
+    assert digest.cdf(values.max() + 1) == 1.0
+
+
+def test_empty_digest():
+    digest = TDigest()
+    assert digest.quantile(0.5) is None
+    assert digest.cdf(1.0) is None
+    assert len(digest) == 0
+
+
+def test_merge_is_associative(values):
+    a, b, c = (_digest(part) for part in np.array_split(values, 3))
+    left = _digest([]).merge(_digest([]).merge(a).merge(b)).merge(c)
+    right = _digest([]).merge(a).merge(_digest([]).merge(b).merge(c))
+
+    assert left.count == right.count == len(values)
+    assert left.min == right.min and left.max == right.max
+    for q in (0.01, 0.1, 0.5, 0.9, 0.99):
+        assert left.quantile(q) == pytest.approx(right.quantile(q), abs=0.5)
+        assert abs(np.mean(values <= left.quantile(q)) - q) < 0.01
+
+
+def test_merge_all_matches_single_digest(values):
+    merged = TDigest.merge_all(_digest(part) for part in np.array_split(values, 10))
+    single = _digest(values)
+    assert merged.count == single.count
+    for q in (0.05, 0.5, 0.95):
+        assert merged.quantile(q) == pytest.approx(single.quantile(q), abs=0.5)
+
+
+def test_dict_round_trip(values):
+    digest = _digest(values)
+    restored = TDigest.from_dict(digest.to_dict())
+
+    assert restored.count == digest.count
+    assert restored.min == digest.min and restored.max == digest.max
+    assert restored.to_dict() == digest.to_dict()
+    for q in (0.01, 0.5, 0.99):
+        assert restored.quantile(q) == pytest.approx(digest.quantile(q), abs=1e-4)
+
+
+def test_from_dict_none_is_empty():
+    assert TDigest.from_dict(None).count == 0
+    assert TDigest.from_dict(_digest([]).to_dict()).count == 0
+
+
+def test_ties_use_half_weight():
+    digest = _digest([3.0] * 100 + [1.0] * 50 + [5.0] * 50)
+    # 같은 값은 절반만 포함 (백분위 순위)
+    assert digest.cdf(3.0) == pytest.approx(0.5, abs=0.01)
+    assert digest.quantile(0.5) == pytest.approx(3.0)
+
+
+def test_single_value():
+    digest = _digest([4.0] * 10)
+    assert digest.quantile(0.5) == 4.0
+    assert digest.cdf(3.9) == 0.0
+    assert digest.cdf(4.0) == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("repeat", [1, 20, 2000])
+def test_ties_at_extremes_use_half_weight(repeat):
+    digest = _digest(np.repeat([1.0, 2.0, 3.0, 4.0, 5.0], repeat))
+    assert digest.cdf(1.0) == pytest.approx(0.1, abs=0.01)
+    assert digest.cdf(5.0) == pytest.approx(0.9, abs=0.01)